@@ -0,0 +1,102 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmark: loaders
+==================
+@ Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+Compare the parsing throughput of the JSON backends. The testing data is scaled up to
+about 100 MB by repeating the testing file. Run the following command to see the
+results:
+``` shell
+python benchmarks/bench_loaders.py
+```
+The size (MB) of the scaled data can be configured by an optional argument, e.g.
+``` shell
+python benchmarks/bench_loaders.py 20
+```
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+
+from typing import Any
+
+try:
+    from typing import Callable
+except ImportError:
+    from collections.abc import Callable
+
+
+if __name__ == "__main__":
+    sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+
+import dash_json_grid as djg
+
+
+def make_data(size_mb: float) -> str:
+    """Scale up the testing data by repeating it until the size of the JSON text
+    reaches `size_mb`."""
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tests")
+    with open(os.path.join(path, "data.json"), "r") as fobj:
+        item = json.dumps(json.load(fobj))
+    n_items = max(1, int(size_mb * 1e6 / (len(item) + 2)))
+    return "[" + ", ".join(item for _ in range(n_items)) + "]"
+
+
+def report(name: str, func: Callable[[], Any], size: int, repeat: int = 3) -> float:
+    """Run `func` for `repeat` times, and print the best throughput. The time of
+    releasing the loaded data is not counted."""
+    cost = float("inf")
+    for _ in range(repeat):
+        tic = time.perf_counter()
+        result = func()
+        cost = min(cost, time.perf_counter() - tic)
+        del result
+    print("{0:<32s}{1:>10.3f} s{2:>12.1f} MB/s".format(name, cost, size / cost / 1e6))
+    return cost
+
+
+def main(size_mb: float = 100.0) -> None:
+    json_str = make_data(size_mb)
+    json_bytes = json_str.encode("utf-8")
+    size = len(json_bytes)
+    print("Data size: {0:.1f} MB".format(size / 1e6))
+    print("Available backends: {0}".format(djg.loaders.available_backends()))
+
+    with tempfile.TemporaryDirectory() as path:
+        file_path = os.path.join(path, "data.json")
+        with open(file_path, "wb") as fobj:
+            fobj.write(json_bytes)
+        for backend in djg.loaders.available_backends():
+            print("Backend: {0}".format(backend))
+            report(
+                "loads (str)",
+                lambda: djg.loaders.loads(json_str, backend=backend),
+                size,
+            )
+            report(
+                "loads (bytes)",
+                lambda: djg.loaders.loads(json_bytes, backend=backend),
+                size,
+            )
+            report(
+                "load_file",
+                lambda: djg.loaders.load_file(file_path, backend=backend),
+                size,
+            )
+            print()
+
+
+if __name__ == "__main__":
+    main(*(float(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,107 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmark: routes
+=================
+@ Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+Compare the performance of the static route methods of `DashJsonGrid` and the
+compiled routes. Run the following command to see the results:
+``` shell
+python benchmarks/bench_routes.py
+```
+"""
+
+import os
+import json
+import timeit
+
+from typing import Any
+
+try:
+    from typing import Callable
+except ImportError:
+    from collections.abc import Callable
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+
+import dash_json_grid as djg
+
+
+def load_data() -> Any:
+    """Load the testing data, and make it deeper by nesting the data for a few
+    levels."""
+    path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tests")
+    with open(os.path.join(path, "data.json"), "r") as fobj:
+        data = json.load(fobj)
+    for idx in range(8):
+        data = {"level-{0}".format(idx): [{"value": data}]}
+    return data
+
+
+def report(name: str, func: Callable[[], Any], number: int) -> float:
+    """Run `func` for `number` times, and print the time cost of each call."""
+    cost = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print("{0:<36s}{1:>10.3f} us/call".format(name, cost * 1e6))
+    return cost
+
+
+def main(number: int = 20000) -> None:
+    data = load_data()
+    prefix = []
+    for idx in reversed(range(8)):
+        prefix.extend(("level-{0}".format(idx), "0", "value"))
+    route_cell = prefix + ["batters", "batter", "2", "type"]
+    route_col = prefix + ["topping", ["type"]]
+
+    for name, route in (("cell", route_cell), ("column", route_col)):
+        compiled = djg.DashJsonGrid.compile_route(route)
+        assert djg.DashJsonGrid.get_data_by_route(data, route) == compiled.get(data)
+        print("Route ({0}): depth={1}".format(name, len(route)))
+        cost_static = report(
+            "get_data_by_route",
+            lambda: djg.DashJsonGrid.get_data_by_route(data, route),
+            number,
+        )
+        cost_compiled = report("CompiledRoute.get", lambda: compiled.get(data), number)
+        report(
+            "compile_route + CompiledRoute.get",
+            lambda: djg.DashJsonGrid.compile_route(route).get(data),
+            number,
+        )
+        print(
+            "Speedup of reusing the compiled route: {0:.2f}x".format(
+                cost_static / cost_compiled
+            )
+        )
+        print()
+
+    val = djg.DashJsonGrid.get_data_by_route(data, route_cell)
+    compiled = djg.DashJsonGrid.compile_route(route_cell)
+    print("Route (cell, update): depth={0}".format(len(route_cell)))
+    cost_static = report(
+        "update_data_by_route",
+        lambda: djg.DashJsonGrid.update_data_by_route(data, route_cell, val),
+        number,
+    )
+    cost_compiled = report("CompiledRoute.set", lambda: compiled.set(data, val), number)
+    print(
+        "Speedup of reusing the compiled route: {0:.2f}x".format(
+            cost_static / cost_compiled
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# -*- coding: UTF-8 -*-
+"""
+Benchmark: walk
+===============
+@ Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+Compare the iterative traversal `walk` with the naive recursive traversal on the
+wide and deep synthetic trees. Run the following command to see the results:
+``` shell
+python benchmarks/bench_walk.py
+```
+"""
+
+import os
+import sys
+import time
+import collections.abc
+
+from typing import Any
+
+try:
+    from typing import Callable, Iterator
+except ImportError:
+    from collections.abc import Callable, Iterator
+
+
+if __name__ == "__main__":
+    sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+
+import dash_json_grid as djg
+
+
+def make_wide(n_rows: int = 20000) -> Any:
+    """A wide tree: a table with many short rows."""
+    return {
+        "rows": [
+            {"id": idx, "name": "row-{0}".format(idx), "tags": ["a", "b"]}
+            for idx in range(n_rows)
+        ]
+    }
+
+
+def make_deep(depth: int = 5000, width: int = 3) -> Any:
+    """A deep tree mimicking a serialized AST, where each level has a few leaves
+    and one nested child."""
+    root = cur = {}
+    for idx in range(depth):
+        child = {}
+        cur.update(("leaf-{0}".format(pos), idx) for pos in range(width))
+        cur["body"] = [child]
+        cur = child
+    return root
+
+
+def naive_walk(data: Any, route: tuple = ()) -> Iterator[Any]:
+    """The naive recursive traversal."""
+    yield route, data
+    if isinstance(data, collections.abc.Mapping):
+        for key, val in data.items():
+            yield from naive_walk(val, route + (key,))
+    elif djg.mixins.is_sequence(data):
+        for key, val in enumerate(data):
+            yield from naive_walk(val, route + (key,))
+
+
+def report(name: str, func: Callable[[], Any], repeat: int = 3) -> None:
+    """Run `func` for `repeat` times, and print the best time cost."""
+    cost = float("inf")
+    n_nodes = 0
+    for _ in range(repeat):
+        tic = time.perf_counter()
+        try:
+            n_nodes = func()
+        except RecursionError:
+            print("{0:<40s}{1:>16s}".format(name, "RecursionError"))
+            return
+        cost = min(cost, time.perf_counter() - tic)
+    print("{0:<40s}{1:>10.2f} ms{2:>12d} nodes".format(name, cost * 1e3, n_nodes))
+
+
+def count(iterator: Iterator[Any]) -> int:
+    return sum(1 for _ in iterator)
+
+
+def main() -> None:
+    for name, data in (
+        ("wide", make_wide()),
+        ("deep (depth=500)", make_deep(500)),
+        ("deep (depth=5000)", make_deep(5000)),
+    ):
+        print("Tree: {0}".format(name))
+        report("walk", lambda: count(djg.mixins.walk(data)))
+        report("naive recursion", lambda: count(naive_walk(data)))
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limit, 100000))
+        try:
+            report("naive recursion (raised limit)", lambda: count(naive_walk(data)))
+        finally:
+            sys.setrecursionlimit(limit)
+        print()
+
+
+if __name__ == "__main__":
+    main()
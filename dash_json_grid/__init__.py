@@ -28,14 +28,43 @@ import dash as _dash
 
 from . import typehints
 from . import mixins
+from . import loaders
+from . import store
+from . import patch
+from . import skeleton
+from . import search
+from . import diff
+from . import hashing
+from . import document
+from . import persistent
+from . import journal
+from . import columnar
 
 # noinspection PyUnresolvedReferences
 from ._imports_ import DashJsonGrid as _DashJsonGrid
 from ._imports_ import __all__ as __import_all__
 from .mixins import MixinDataRoute as _MixinDataRoute, MixinFile as _MixinFile
+from .store import MixinStore as _MixinStore
+from .skeleton import MixinSkeleton as _MixinSkeleton
 from .typehints import ThemeConfigs
 
-__all__ = ("typehints", "mixins", "DashJsonGrid", "ThemeConfigs")
+__all__ = (
+    "typehints",
+    "mixins",
+    "loaders",
+    "store",
+    "patch",
+    "skeleton",
+    "search",
+    "diff",
+    "hashing",
+    "document",
+    "persistent",
+    "journal",
+    "columnar",
+    "DashJsonGrid",
+    "ThemeConfigs",
+)
 
 if not hasattr(_dash, "__plotly_dash") and not hasattr(_dash, "development"):
     print(
@@ -107,7 +136,9 @@ _js_dist.extend(
 _css_dist = []
 
 
-class DashJsonGrid(_DashJsonGrid, _MixinDataRoute, _MixinFile):
+class DashJsonGrid(
+    _DashJsonGrid, _MixinDataRoute, _MixinFile, _MixinStore, _MixinSkeleton
+):
     """A DashJsonGrid component.
     DashJsonGrid is a Dash porting version for the React component:
     `react-json-grid/JSONGrid`
@@ -126,6 +157,19 @@ class DashJsonGrid(_DashJsonGrid, _MixinDataRoute, _MixinFile):
     - data (a value equal to: null | dict | list | number | string | boolean; required):
         The JSON-serializable data to be transformed into a grid table.
 
+    - data_key (string; optional):
+        The key of `data` in a server-side store. It is not used by the
+        grid viewer. Callbacks can use `State(..., "data_key")` to locate
+        the data on the server rather than receive the whole `data` from
+        the browser. See `dash_json_grid.store` for details.
+
+    - data_patch (list; optional):
+        A list of patch operations applied to `data` in the browser. Each
+        operation is `{"op": "add" | "remove" | "replace", "path": [str |
+        int], "value": any}`. When the patch is applied, `data` is updated
+        and this property is reset to `None`. See `dash_json_grid.patch`
+        for details.
+
     - default_expand_depth (number; default 0):
         The depth to which the grid is expanded by default.
 
@@ -134,6 +178,18 @@ class DashJsonGrid(_DashJsonGrid, _MixinDataRoute, _MixinFile):
         structure needs to be a `Mapping` mimicing the structure of the
         data.
 
+    - diff_highlight (list; optional):
+        The patch highlighted in the grid, typically returned by
+        `DashJsonGrid.diff(old, data)`. The added values and the replaced
+        values are prefixed by `+` and `~`, and the removed keys of the
+        objects are shown with `-`. See `dash_json_grid.diff` for details.
+
+    - expand_path (list; optional):
+        The route of the placeholder requested to be expanded. It is set
+        when a placeholder in the skeleton data is selected. Callbacks can
+        send the next level of the data to `data_patch` for expanding it.
+        See `dash_json_grid.skeleton` for details.
+
     - highlight_selected (boolean; default True):
         Whether to highlight the selected item or not.
 
@@ -152,8 +208,29 @@ class DashJsonGrid(_DashJsonGrid, _MixinDataRoute, _MixinFile):
         - component_name (string; optional):
             Holds the name of the component that is loading.
 
+    - page_size (number; optional):
+        If specified, the arrays longer than this size are shown as the
+        collapsible index-range buckets like `[0..999]`. The selected path
+        still uses the real indicies of the data.
+
+    - search_debounce (number; default 300):
+        The delay (ms) between the last change of `search_text` and the
+        search. The searches within the delay are merged.
+
+    - search_results (dict; optional):
+        The results of the latest search reported by the search engine, as
+        `{"text": str, "count": int, "routes": [route]}`. `count` is the
+        number of all matches, and `routes` contains the routes of at most
+        1000 matches. It is `None` if `search_text` is empty.
+
     - search_text (string; optional):
-        The text that needs to be searched in the JSON data.
+        The text that needs to be searched in the JSON data. The matching
+        reported by `search_results` runs in a Web Worker, but the data is
+        copied (structured clone) to the worker each time it changes, which
+        still costs main-thread time for huge data. The highlighting is drawn
+        by the grid itself, which scans the rendered data on the main thread
+        again. The highlighting is applied after the worker reports the
+        results, and skipped if nothing is found.
 
     - selected_path (list; optional):
         `keyPath` captured by the `onSelect` method of the grid viewer.
@@ -216,7 +293,19 @@ class DashJsonGrid(_DashJsonGrid, _MixinDataRoute, _MixinFile):
             selection.
 
         - searchHighlightBgColor (string; optional):
-            Background color of the part highlighted by the search."""
+            Background color of the part highlighted by the search.
+
+    - virtualize_overscan (number; default 20):
+        The number of the extra rows mounted before and after the viewport
+        in the virtualized mode.
+
+    - virtualize_threshold (number; optional):
+        The row-count threshold of the virtualized mode. When the data is
+        an array longer than this threshold, only the rows in the viewport
+        are mounted. If not specified, the virtualized mode is disabled.
+        The mounted rows are still shown as an array (or a table), where the
+        indicies shown by the grid start from the first mounted row. The
+        selected path uses the real indicies of the data."""
 
 
 for _component in __import_all__:
@@ -0,0 +1,288 @@
+# -*- coding: UTF-8 -*-
+"""
+Columnar
+========
+@Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The columnar encoding of the tables. When a table (a list of objects) is sent to
+the browser, the keys of each row are serialized repeatedly. The encoding keeps
+each column name only once:
+``` python
+[{"id": "5001", "type": "None"}, {"id": "5002"}]
+```
+is encoded as
+``` python
+{
+    "__djg_columns__": ["id", "type"],
+    "length": 2,
+    "values": [["5001", "5002"], ["None", None]],
+    "missing": [[], [1]],
+}
+```
+where `"missing"` contains the indicies of the rows not having the column. The
+component expands the encoded tables in the browser, so the encoded data can be
+passed to the property `data` directly:
+``` python
+DashJsonGrid(id="viewer", data=DashJsonGrid.encode_tables(data))
+```
+If a callback receives the encoded data by `State(..., "data")`, use
+`decode_tables` to get the original data.
+"""
+
+import collections.abc
+
+from typing import Optional, Any
+
+try:
+    from typing import Callable
+except ImportError:
+    from collections.abc import Callable
+
+from .mixins import _SCALAR_TYPES, _iter_children
+from .skeleton import PLACEHOLDER_TYPE_KEY, PLACEHOLDER_MORE_KEY
+
+
+__all__ = ("COLUMNAR_KEY", "is_columnar", "encode_tables", "decode_tables")
+
+
+COLUMNAR_KEY = "__djg_columns__"
+"""The key of the column names of an encoded table."""
+
+_RESERVED_KEYS = (COLUMNAR_KEY, PLACEHOLDER_TYPE_KEY, PLACEHOLDER_MORE_KEY)
+_TRANSFORM_END = object()
+
+
+def is_columnar(value: Any) -> bool:
+    """Check whether the value is an encoded table or not.
+
+    Arguments
+    ---------
+    value: `Any`
+        The value to be checked.
+
+    Returns
+    -------
+    #1: `bool`
+        `True` if `value` is a table encoded by `encode_tables`.
+    """
+    return isinstance(value, collections.abc.Mapping) and isinstance(
+        value.get(COLUMNAR_KEY), list
+    )
+
+
+def _is_flat(value: Any) -> bool:
+    """Check whether `value` is a `dict` or `list` only containing the scalar
+    values."""
+    value_type = type(value)
+    if value_type is dict:
+        value = value.values()
+    elif value_type is not list:
+        return False
+    return _SCALAR_TYPES.issuperset(map(type, value))
+
+
+def _transform(
+    data: Any,
+    finish: Callable[[Any, list, bool], Any],
+    enter: Optional[Callable[[Any], Any]] = None,
+) -> Any:
+    """Transform the containers of the data from the bottom up without recursion.
+
+    If `enter(value)` is specified, it is called for each container before its
+    items are transformed. If it returns another value, the returned value is
+    transformed instead of the container.
+
+    `finish(value, items, changed)` is called for each container after its items
+    are transformed. `items` is the list of the transformed `(key, item)` pairs,
+    and `changed` is `True` if any item is changed. It returns the transformed
+    container. The unchanged containers are shared with `data`. The `dict` and
+    `list` only containing the scalar values are not passed to `finish`, and are
+    kept unchanged.
+    """
+    orig = data
+    if enter is not None:
+        data = enter(data)
+    children = _iter_children(data)
+    if children is None:
+        return data
+    result = data
+    stack = [[None, data, children, [], data is not orig]]
+    while stack:
+        frame = stack[-1]
+        item = next(frame[2], _TRANSFORM_END)
+        if item is not _TRANSFORM_END:
+            key, val = item
+            if type(val) in _SCALAR_TYPES or _is_flat(val):
+                frame[3].append(item)
+                continue
+            children = _iter_children(val)
+            if children is None:
+                frame[3].append(item)
+                continue
+            new_val = val if enter is None else enter(val)
+            if new_val is not val:
+                frame[4] = True
+                val = new_val
+                children = _iter_children(val)
+            stack.append([key, val, children, [], new_val is not item[1]])
+            continue
+        stack.pop()
+        key, val, _, items, changed = frame
+        new_val = finish(val, items, changed)
+        if not stack:
+            result = new_val
+            break
+        parent = stack[-1]
+        parent[3].append((key, new_val))
+        if new_val is not val:
+            parent[4] = True
+    return result
+
+
+def _rebuild(value: Any, items: list) -> Any:
+    """Make a new container like `value` by the transformed items."""
+    if isinstance(value, collections.abc.Mapping):
+        return dict(items)
+    return [item for _, item in items]
+
+
+def _encode_rows(rows: list) -> Any:
+    """Encode the rows of a table. Return `None` if the rows can not be encoded, for
+    example, if the keys are not strings or the orders of the keys are conflicted.
+
+    The order of the columns is merged from the orders of the keys of the rows, so
+    the decoded rows have the same orders of the keys.
+    """
+    columns = []
+    col_pos = {}
+    prev_keys = None
+    for row in rows:
+        keys = tuple(row)
+        if keys == prev_keys:
+            continue
+        prev_keys = keys
+        last = -1
+        for key in keys:
+            pos = col_pos.get(key)
+            if pos is None:
+                if not isinstance(key, str) or key in _RESERVED_KEYS:
+                    return None
+                last += 1
+                columns.insert(last, key)
+                col_pos = {col: idx for idx, col in enumerate(columns)}
+            elif pos <= last:
+                return None
+            else:
+                last = pos
+    if not columns:
+        return None
+    is_full = all(len(row) == len(columns) for row in rows)
+    values = []
+    missing = []
+    for key in columns:
+        if is_full:
+            values.append([row[key] for row in rows])
+            missing.append([])
+            continue
+        values.append([row.get(key) for row in rows])
+        missing.append([pos for pos, row in enumerate(rows) if key not in row])
+    return {
+        COLUMNAR_KEY: columns,
+        "length": len(rows),
+        "values": values,
+        "missing": missing,
+    }
+
+
+def encode_tables(data: Any, min_rows: int = 100) -> Any:
+    """Encode the tables in the data by the columnar format.
+
+    A table is a `list` where all items are mappings with the string keys. Each
+    table with at least `min_rows` rows is encoded, if the keys of its rows are in
+    the same order. The tables in the values of a table are also encoded.
+
+    Arguments
+    ---------
+    data: `Any`
+        The whole data object to be encoded. It is not modified.
+
+    min_rows: `int`
+        The tables with fewer rows than this value will not be encoded.
+
+    Returns
+    -------
+    #1: `Any`
+        The encoded data. The parts without tables are shared with `data`.
+    """
+    if min_rows < 1:
+        raise ValueError(
+            "The argument min_rows needs to be positive, but get: {0}".format(min_rows)
+        )
+
+    def enter(value: Any) -> Any:
+        if (
+            isinstance(value, list)
+            and len(value) >= min_rows
+            and all(
+                type(row) is dict or isinstance(row, collections.abc.Mapping)
+                for row in value
+            )
+        ):
+            encoded = _encode_rows(value)
+            if encoded is not None:
+                return encoded
+        return value
+
+    def finish(value: Any, items: list, changed: bool) -> Any:
+        if not changed:
+            return value
+        return _rebuild(value, items)
+
+    return _transform(data, finish, enter)
+
+
+def decode_tables(data: Any) -> Any:
+    """Decode the tables encoded by `encode_tables`.
+
+    Arguments
+    ---------
+    data: `Any`
+        The whole data object with the encoded tables. It is not modified.
+
+    Returns
+    -------
+    #1: `Any`
+        The decoded data, where each encoded table is converted back to a list of
+        `dict`. The parts without tables are shared with `data`.
+    """
+
+    def finish(value: Any, items: list, changed: bool) -> Any:
+        if is_columnar(value):
+            table = dict(items) if changed else value
+            columns = table[COLUMNAR_KEY]
+            n_rows = table["length"]
+            rows = [{} for _ in range(n_rows)]
+            for key, col_values, col_missing in zip(
+                columns, table["values"], table["missing"]
+            ):
+                if not col_missing:
+                    for row, val in zip(rows, col_values):
+                        row[key] = val
+                    continue
+                col_missing = set(col_missing)
+                for pos, (row, val) in enumerate(zip(rows, col_values)):
+                    if pos not in col_missing:
+                        row[key] = val
+            return rows
+        if not changed:
+            return value
+        return _rebuild(value, items)
+
+    return _transform(data, finish)
@@ -0,0 +1,299 @@
+# -*- coding: UTF-8 -*-
+"""
+Diff
+====
+@Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The structural difference between two versions of the data. The difference is a
+patch like
+``` python
+[
+    {"op": "replace", "path": ["batters", "batter", 0, "type"], "value": "Plain"},
+    {"op": "replace", "path": ["topping", ["type"]], "value": ["None", "Sugar"]},
+    {"op": "remove", "path": ["ppu"]},
+]
+```
+where each path is a route of `MixinDataRoute.update_data_by_route`. A route
+ending with a one-value list like `["type"]` locates a table column. Applying the
+patch to the old data by `dash_json_grid.patch.apply_data_patch` gives the new data.
+The patch can also be sent to the property `data_patch` of the component, or be
+highlighted by the property `diff_highlight`.
+"""
+
+import marshal
+import operator
+import itertools
+import collections.abc
+
+from typing import Any
+
+try:
+    from typing import Sequence
+except ImportError:
+    from collections.abc import Sequence
+
+from .mixins import is_sequence
+
+
+__all__ = ("diff",)
+
+
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+# The version 2 of `marshal` does not write references to the shared objects, so
+# the same values always give the same bytes.
+_MARSHAL_VERSION = 2
+
+
+def _is_same_json(old: Any, new: Any) -> bool:
+    """Check whether two values equal by `==` are also the same JSON values.
+
+    The values are serialized by `marshal` in C first, which writes the types of the
+    scalar values, so `True`, `1`, and `1.0` give different bytes. If the bytes are
+    the same, the values are the same. Otherwise, for example, the keys of a
+    mapping are in a different order, or a value can not be serialized, the
+    values are compared item by item without recursion.
+    """
+    try:
+        if marshal.dumps(old, _MARSHAL_VERSION) == marshal.dumps(new, _MARSHAL_VERSION):
+            return True
+    except ValueError:
+        pass
+    stack = [(old, new)]
+    while stack:
+        old, new = stack.pop()
+        if old is new:
+            continue
+        if type(old) is not type(new):
+            return False
+        if isinstance(old, collections.abc.Mapping):
+            if len(old) != len(new):
+                return False
+            for key, o_item in old.items():
+                if key not in new:
+                    return False
+                stack.append((o_item, new[key]))
+        elif is_sequence(old):
+            if len(old) != len(new):
+                return False
+            stack.extend(zip(old, new))
+        elif old != new:
+            return False
+    return True
+
+
+def _is_equal(old: Any, new: Any) -> bool:
+    """Check whether two values are the same JSON values.
+
+    Unlike `==`, the types of the scalar values need to be the same, so `True` and
+    `1`, or `1` and `1.0`, are different. The values are compared by `==` first,
+    and only the equal containers are checked by `_is_same_json`.
+    """
+    if old is new:
+        return True
+    if type(old) is not type(new) or not old == new:
+        return False
+    return type(old) in _SCALAR_TYPES or _is_same_json(old, new)
+
+
+def _unequal_items(old: Sequence[Any], new: Sequence[Any]) -> list:
+    """Get the positions of the unequal items of two sequences with the same
+    length.
+
+    The items are compared by `==` in C, and each range of the equal items is
+    checked by `_is_same_json` at once. Only the ranges failing the check are
+    compared item by item.
+    """
+    n_items = len(old)
+    found = list(
+        itertools.compress(
+            range(n_items), map(operator.not_, map(operator.eq, old, new))
+        )
+    )
+    result = []
+    prev = 0
+    for pos in itertools.chain(found, (n_items,)):
+        if pos > prev and not _is_same_json(old[prev:pos], new[prev:pos]):
+            result.extend(
+                idx for idx in range(prev, pos) if not _is_equal(old[idx], new[idx])
+            )
+        if pos < n_items:
+            result.append(pos)
+        prev = pos + 1
+    return result
+
+
+def _common_length(old: Sequence[Any], new: Sequence[Any], limit: int) -> int:
+    """Get the length of the common head of two iterables. At most `limit` items
+    are compared."""
+    old = list(itertools.islice(old, limit))
+    new = list(itertools.islice(new, limit))
+    n_common = next(
+        itertools.compress(
+            itertools.count(), map(operator.not_, map(operator.eq, old, new))
+        ),
+        limit,
+    )
+    if n_common > 0 and not _is_same_json(old[:n_common], new[:n_common]):
+        n_common = next(
+            (idx for idx in range(n_common) if not _is_equal(old[idx], new[idx])),
+            n_common,
+        )
+    return n_common
+
+
+def _is_table(old: Sequence[Any], new: Sequence[Any]) -> bool:
+    """Check whether two versions of a list can be compared as a table. The rows
+    of both versions need to be mappings, and the number of the rows is not
+    changed."""
+    if len(old) != len(new) or not new:
+        return False
+    # Check each distinct row type once rather than each row.
+    row_types = set(map(type, old))
+    row_types.update(map(type, new))
+    return all(issubclass(row_type, collections.abc.Mapping) for row_type in row_types)
+
+
+def _diff_table(
+    route: list, old: Sequence[Any], new: Sequence[Any], ops: list, stack: list
+) -> None:
+    """Compare two versions of a table column by column.
+
+    A column existing in all new rows is replaced as a whole if it is new or most of
+    its values are changed. A column removed from all rows is removed as a whole.
+    The other columns are compared row by row.
+
+    The unchanged rows are found by `_unequal_items` first, so only the keys and
+    the values of the changed rows are compared in Python.
+    """
+    rows = _unequal_items(old, new)
+    if not rows:
+        return
+    keys = dict.fromkeys(key for idx in rows for key in old[idx])
+    keys.update(dict.fromkeys(key for idx in rows for key in new[idx]))
+
+    def in_all(table: Sequence[Any], key: Any) -> bool:
+        return all(map(operator.contains, table, itertools.repeat(key)))
+
+    for key in keys:
+        # Only the string keys can locate the table columns.
+        is_column = isinstance(key, str)
+        if all(key in old[idx] and key in new[idx] for idx in rows):
+            # The unchanged rows are the same in both versions, so the column
+            # exists in all old rows if and only if it exists in all new rows.
+            changed = [
+                idx for idx in rows if not _is_equal(old[idx][key], new[idx][key])
+            ]
+            if not changed:
+                continue
+            if not is_column or 2 * len(changed) <= len(new) or not in_all(new, key):
+                for idx in changed:
+                    stack.append((route + [idx, key], old[idx][key], new[idx][key]))
+                continue
+            new_col = [row[key] for row in new]
+            ops.append({"op": "replace", "path": route + [[key]], "value": new_col})
+        elif is_column and in_all(new, key):
+            new_col = [row[key] for row in new]
+            ops.append({"op": "replace", "path": route + [[key]], "value": new_col})
+        elif is_column and not any(map(operator.contains, new, itertools.repeat(key))):
+            ops.append({"op": "remove", "path": route + [[key]]})
+        else:
+            for idx in rows:
+                o_row = old[idx]
+                n_row = new[idx]
+                if key in o_row and key in n_row:
+                    stack.append((route + [idx, key], o_row[key], n_row[key]))
+                elif key in o_row:
+                    ops.append({"op": "remove", "path": route + [idx, key]})
+                elif key in n_row:
+                    ops.append(
+                        {"op": "add", "path": route + [idx, key], "value": n_row[key]}
+                    )
+
+
+def _diff_list(
+    route: list, old: Sequence[Any], new: Sequence[Any], ops: list, stack: list
+) -> None:
+    """Compare two versions of a list.
+
+    The common head and tail of the lists are skipped, so inserting or removing a
+    few items in the middle does not replace the following items. The remaining
+    items are compared pairwise, and the extra items are added or removed.
+    """
+    n_old = len(old)
+    n_new = len(new)
+    n_common = min(n_old, n_new)
+    start = _common_length(old, new, n_common)
+    n_tail = _common_length(reversed(old), reversed(new), n_common - start)
+    end_old = n_old - n_tail
+    end_new = n_new - n_tail
+    n_pairs = min(end_old, end_new) - start
+    for idx in range(start, start + n_pairs):
+        stack.append((route + [idx], old[idx], new[idx]))
+    for idx in range(end_old - 1, start + n_pairs - 1, -1):
+        ops.append({"op": "remove", "path": route + [idx]})
+    for idx in range(start + n_pairs, end_new):
+        ops.append({"op": "add", "path": route + [idx], "value": new[idx]})
+
+
+def diff(old: Any, new: Any) -> list:
+    """Make the patch changing the old data to the new data.
+
+    The comparison only visits the changed parts of the data. Each subtree is
+    skipped if it is the same object in both versions, or if it is equal to its old
+    version. The equality is checked by `==` in C first, and the equal subtrees are
+    confirmed by comparing their serialized bytes, so the values like `1`, `1.0`, and
+    `True` are regarded as different values, although they are equal by `==`.
+
+    Arguments
+    ---------
+    old: `Any`
+        The old version of the data.
+
+    new: `Any`
+        The new version of the data.
+
+    Returns
+    -------
+    #1: `[{"op": str, "path": [str | int | [str]], "value": Any}]`
+        The patch. Each path is a route that can be used by
+        `MixinDataRoute.update_data_by_route`. The lists of mappings with the same
+        number of rows are compared as tables, where a new column or a mostly
+        changed column is replaced by the path ending with `[key]` and a list of
+        the column values. The values
+        of the operations are shared with `new` rather than copied.
+    """
+    ops = []
+    stack = [([], old, new)]
+    while stack:
+        route, o_val, n_val = stack.pop()
+        if _is_equal(o_val, n_val):
+            continue
+        if isinstance(o_val, collections.abc.Mapping) and isinstance(
+            n_val, collections.abc.Mapping
+        ):
+            for key, o_item in o_val.items():
+                if key not in n_val:
+                    ops.append({"op": "remove", "path": route + [key]})
+                    continue
+                n_item = n_val[key]
+                if o_item is not n_item:
+                    stack.append((route + [key], o_item, n_item))
+            for key, n_item in n_val.items():
+                if key not in o_val:
+                    ops.append({"op": "add", "path": route + [key], "value": n_item})
+        elif is_sequence(o_val) and is_sequence(n_val):
+            if _is_table(o_val, n_val):
+                _diff_table(route, o_val, n_val, ops, stack)
+            else:
+                _diff_list(route, o_val, n_val, ops, stack)
+        else:
+            ops.append({"op": "replace", "path": route, "value": n_val})
+    return ops
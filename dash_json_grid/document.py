@@ -0,0 +1,369 @@
+# -*- coding: UTF-8 -*-
+"""
+Document
+========
+@Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The versioned wrapper of the data. The wrapper keeps the recently resolved routes,
+so the hot routes like the selected path of the component can be resolved without
+going through the data again:
+``` python
+doc = JsonDocument(data)
+value = doc.get_data_by_route(selected_path)  # Resolved and cached.
+value = doc.get_data_by_route(selected_path)  # Fetched from the cache.
+doc.update_data_by_route(["batters", "batter", 0, "type"], "Plain")
+```
+Modifying the data through the wrapper increases the version, and only drops the
+cached routes influenced by the modification.
+"""
+
+import copy
+import collections
+import collections.abc
+
+from typing import Union, Optional, Any
+
+try:
+    from typing import Sequence
+except ImportError:
+    from collections.abc import Sequence
+
+from .mixins import (
+    Route,
+    CompiledRoute,
+    MixinDataRoute,
+    is_sequence,
+    sanitize_list_index,
+    get_item_of_object,
+)
+from .patch import _locate_patch_path
+from . import persistent
+
+
+__all__ = ("JsonDocument",)
+
+
+def _make_key(route: Sequence[Any]) -> tuple:
+    """Convert a route to a hashable key."""
+    key = tuple(route)
+    try:
+        hash(key)
+    except TypeError:
+        key = tuple(tuple(idx) if is_sequence(idx) else idx for idx in route)
+    return key
+
+
+def _resolve(data: Any, route: Sequence[Any]) -> Any:
+    """Resolve a route, and normalize it. Like `MixinDataRoute.get_data_by_route`,
+    the resolution stops at the first `None` in the route.
+
+    Returns
+    -------
+    #1: `Any`
+        The located value.
+
+    #2: `tuple`
+        The normalized route, where the list indicies are non-negative `int`, and
+        a table column is represented by a one-value tuple.
+
+    #3: `int | None`
+        The position of the table column in the normalized route. If the route
+        does not locate a table column, it is `None`.
+    """
+    norm = []
+    cur_data = data
+    for pos, idx in enumerate(route):
+        if idx is None:
+            break
+        if is_sequence(idx):
+            key = idx[0]
+            if (
+                not isinstance(cur_data, collections.abc.Mapping)
+                and is_sequence(cur_data)
+                and not isinstance(key, int)
+            ):
+                norm.append((key,))
+                norm.extend(route[pos + 1 :])
+                return MixinDataRoute.get_data_by_route(data, route), tuple(norm), pos
+            idx = key
+        if not isinstance(cur_data, collections.abc.Mapping) and is_sequence(cur_data):
+            try:
+                idx = sanitize_list_index(idx)
+            except ValueError as exc:
+                raise TypeError(
+                    "Index {0} does not match the type of the data "
+                    "{1}".format(repr(idx), cur_data)
+                ) from exc
+            if idx < 0:
+                idx_neg = idx
+                idx += len(cur_data)
+                if idx < 0:
+                    raise IndexError(
+                        "The list index is out of range, but get: {0}".format(idx_neg)
+                    )
+        cur_data = get_item_of_object(cur_data, idx)
+        norm.append(idx)
+    return cur_data, tuple(norm), None
+
+
+class JsonDocument:
+    """The versioned wrapper of the data with a route-resolution cache.
+
+    The values located by the recently used routes are kept in an LRU cache, so
+    resolving a hot route again is O(1). The data can be modified by the methods
+    of this class, which have the same usages as those of `MixinDataRoute`. Each
+    modification increases `version` and drops the cached routes that are inside
+    the modified part (or inside a list whose items are shifted). If the data is
+    modified in other ways, call `invalidate(route)` with the route of the
+    modified part.
+
+    In the persistent mode, the data is not modified in place. Each modification
+    makes a new version of the data by `dash_json_grid.persistent`, where only the
+    containers along the route are copied. The previous versions returned by
+    `snapshot()` are kept unchanged.
+
+    The wrapper can be passed to the property `data` of the component directly.
+    """
+
+    def __init__(
+        self, data: Any, cache_size: int = 128, persistent: bool = False
+    ) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be wrapped.
+
+        cache_size: `int`
+            The maximal number of the cached routes.
+
+        persistent: `bool`
+            If `True`, use the persistent mode, where the modifications do not
+            change the previous versions of the data.
+        """
+        if cache_size < 1:
+            raise ValueError(
+                "The argument cache_size needs to be positive, but get: {0}".format(
+                    cache_size
+                )
+            )
+        self.data = data
+        self.cache_size = cache_size
+        self.persistent = bool(persistent)
+        self._version = 0
+        self._cache = collections.OrderedDict()
+
+    @property
+    def version(self) -> int:
+        """The version of the data. It is increased by each modification."""
+        return self._version
+
+    @property
+    def n_cached(self) -> int:
+        """The number of the cached routes."""
+        return len(self._cache)
+
+    def is_cached(self, route: Union[Route, CompiledRoute]) -> bool:
+        """Check whether a route is cached or not."""
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        return _make_key(route) in self._cache
+
+    def __repr__(self) -> str:
+        return "{0}(version={1}, cached={2})".format(
+            self.__class__.__name__, self._version, len(self._cache)
+        )
+
+    def snapshot(self) -> Any:
+        """Get the current version of the data.
+
+        Returns
+        -------
+        #1: `Any`
+            In the persistent mode, it is the current data, which will not be
+            changed by the following modifications. Otherwise, it is a deep copy
+            of the current data.
+        """
+        if self.persistent:
+            return self.data
+        return copy.deepcopy(self.data)
+
+    def to_plotly_json(self) -> Any:
+        """Serialize the document. This method is used by Dash when the document is
+        passed to a property."""
+        return self.data
+
+    def get_data_by_route(self, route: Union[Route, CompiledRoute]) -> Any:
+        """Get a specific part of the data by a route.
+
+        See `MixinDataRoute.get_data_by_route` for the details of the arguments.
+
+        Returns
+        -------
+        #1: `Any`
+            The located part of the data. If the route is cached, it is returned
+            without going through the data.
+        """
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        key = _make_key(route)
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            return entry[0]
+        entry = _resolve(self.data, route)
+        self._cache[key] = entry
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return entry[0]
+
+    def _drop(self, path: Sequence[Any]) -> None:
+        """Drop the cached routes influenced by modifying the normalized `path`.
+
+        The routes inside `path` are dropped. The cached columns of the tables
+        containing `path` are also dropped, because they are copied from the rows.
+        In the persistent mode, the containers along `path` are copied, so the
+        routes of these containers are also dropped.
+        """
+        path = tuple(path)
+        n_path = len(path)
+        stale = [
+            key
+            for key, (_, norm, col_pos) in self._cache.items()
+            if norm[:n_path] == path
+            or (self.persistent and path[: len(norm)] == norm)
+            or (
+                col_pos is not None
+                and col_pos <= n_path
+                and path[:col_pos] == norm[:col_pos]
+            )
+        ]
+        for key in stale:
+            del self._cache[key]
+
+    def invalidate(self, route: Optional[Union[Route, CompiledRoute]] = None) -> None:
+        """Increase the version after the data is modified without this wrapper.
+
+        Arguments
+        ---------
+        route: `[str | int] | CompiledRoute | None`
+            The route of the modified part. The cached routes inside this part are
+            dropped. If the items of a list are inserted or removed, use the route
+            of the list. If not specified, drop all cached routes.
+        """
+        self._version += 1
+        if route is None:
+            self._cache.clear()
+            return
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        try:
+            _, norm, col_pos = _resolve(self.data, route)
+        except (KeyError, IndexError, TypeError, ValueError):
+            self._cache.clear()
+            return
+        self._drop(norm if col_pos is None else norm[:col_pos])
+
+    def _locate_changed(self, route: Sequence[Any], shift: bool) -> Any:
+        """Get the normalized path of the part changed by modifying `route`.
+
+        If `shift` is `True` and `route` locates a list item, the items of the list
+        are shifted, so the path of the list is returned. If `route` locates a
+        table column, the path of the table is returned.
+        """
+        path, is_column = _locate_patch_path(self.data, route)
+        if path is None:
+            return None
+        if is_column:
+            return _resolve(self.data, path)[1]
+        parent, norm, _ = _resolve(self.data, path[:-1])
+        idx = path[-1]
+        if not isinstance(parent, collections.abc.Mapping) and is_sequence(parent):
+            if shift:
+                return norm
+            idx = sanitize_list_index(idx)
+            if idx < 0:
+                idx += len(parent)
+        return norm + (idx,)
+
+    def _modify(
+        self, method: Any, route: Sequence[Any], *args: Any, shift: bool
+    ) -> Any:
+        """Run a modification, and drop the influenced routes."""
+        try:
+            changed = self._locate_changed(route, shift)
+        except (KeyError, IndexError, TypeError, ValueError):
+            # Let the modification raise the error. If it does not fail, the
+            # influenced routes are unknown.
+            changed = ()
+        try:
+            return method(self.data, route, *args)
+        finally:
+            self._version += 1
+            if changed is not None:
+                self._drop(changed)
+
+    def _update_persistent(self, data: Any, route: Sequence[Any], val: Any) -> Any:
+        """Update the data in the persistent mode."""
+        self.data = persistent.update_data_by_route(data, route, val)
+        return self.data
+
+    def _delete_persistent(self, data: Any, route: Sequence[Any]) -> Any:
+        """Delete the data part in the persistent mode."""
+        self.data, val = persistent.delete_data_by_route(data, route)
+        return val
+
+    def update_data_by_route(self, route: Union[Route, CompiledRoute], val: Any) -> Any:
+        """Update a specific part of `data` by a route, and increase the version.
+
+        See `MixinDataRoute.update_data_by_route` for the details of the arguments.
+
+        Returns
+        -------
+        #1: `Any`
+            The modified `data`. In the persistent mode, it is the new version of
+            the data.
+        """
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        self._modify(
+            (
+                self._update_persistent
+                if self.persistent
+                else MixinDataRoute.update_data_by_route
+            ),
+            route,
+            val,
+            shift=False,
+        )
+        return self.data
+
+    def delete_data_by_route(self, route: Union[Route, CompiledRoute]) -> Any:
+        """Delete the data part specified by a route, and increase the version.
+
+        See `MixinDataRoute.delete_data_by_route` for the details of the arguments.
+
+        Returns
+        -------
+        #1: `Any`
+            The data that is deleted and poped out.
+        """
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        return self._modify(
+            (
+                self._delete_persistent
+                if self.persistent
+                else MixinDataRoute.delete_data_by_route
+            ),
+            route,
+            shift=True,
+        )
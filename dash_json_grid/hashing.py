@@ -0,0 +1,400 @@
+# -*- coding: UTF-8 -*-
+"""
+Hashing
+=======
+@Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The content hashes of the subtrees of the data. The hash cache mirrors the data
+tree, where each node keeps the digest of the corresponding subtree. The digest is
+changed when the content of the subtree is changed, so checking whether a subtree
+is changed only needs to compare the digests:
+``` python
+cache = HashCache(data)
+digest = cache.digest(["batters"])
+cache.update_data_by_route(["batters", "batter", 0, "type"], "Plain")
+assert cache.digest(["batters"]) != digest
+```
+The digest of a container is made of the sum of the hashes of its items, so an
+update only needs to re-hash the modified subtree and adjust the sums of its
+ancestors. The digests are used for detecting changes, not for security.
+"""
+
+import json
+import hashlib
+import collections.abc
+
+from typing import Union, Any
+
+try:
+    from typing import Sequence
+except ImportError:
+    from collections.abc import Sequence
+
+from .mixins import (
+    Route,
+    CompiledRoute,
+    MixinDataRoute,
+    is_sequence,
+    sanitize_list_index,
+    _iter_children,
+)
+from .patch import _locate_patch_path
+
+
+__all__ = ("HashCache",)
+
+
+_DIGEST_SIZE = 16
+_MASK = (1 << (8 * _DIGEST_SIZE)) - 1
+_HASH_END = object()
+
+
+def _hash(data: bytes) -> int:
+    """Hash the byte string as a 128-bit integer."""
+    return int.from_bytes(
+        hashlib.blake2b(data, digest_size=_DIGEST_SIZE).digest(), "little"
+    )
+
+
+def _text(value: Any) -> bytes:
+    """Get the typed text of a scalar value or a key. The values that can not be
+    serialized as JSON are represented by `repr`."""
+    value_type = type(value)
+    if value_type is str:
+        return b"s" + value.encode("utf-8", "surrogatepass")
+    if value_type is int or value_type is float:
+        return b"n" + repr(value).encode("ascii")
+    try:
+        text = json.dumps(value)
+    except (TypeError, ValueError):
+        text = repr(value)
+    return b"j" + text.encode("utf-8")
+
+
+def _term(key: Any, digest: int) -> int:
+    """Get the hash of an item of a container. The digest of the container is made
+    of the sum of these hashes."""
+    return _hash(b"k" + _text(key) + b"\x00" + digest.to_bytes(_DIGEST_SIZE, "little"))
+
+
+class _HashNode:
+    """A node of the hash cache.
+
+    `children` is a `dict` or a `list` of the child nodes if the node is a
+    container, and `None` if the node is a scalar value. `acc` is the sum of the
+    hashes of the items of the container.
+    """
+
+    __slots__ = ("digest", "acc", "children")
+
+    def __init__(self, value: Any) -> None:
+        self.acc = 0
+        if type(value) is dict or isinstance(value, collections.abc.Mapping):
+            self.children = {}
+            self.digest = 0
+        elif type(value) is list or is_sequence(value):
+            self.children = []
+            self.digest = 0
+        else:
+            self.children = None
+            self.digest = _hash(b"v" + _text(value))
+
+    def items(self) -> Any:
+        """Iterate the `(key, child)` pairs of the container."""
+        if isinstance(self.children, dict):
+            return self.children.items()
+        return enumerate(self.children)
+
+    def seal(self) -> None:
+        """Calculate the digest of the container by the sum of the item hashes."""
+        tag = b"o" if isinstance(self.children, dict) else b"a"
+        self.digest = _hash(
+            tag
+            + self.acc.to_bytes(_DIGEST_SIZE, "little")
+            + len(self.children).to_bytes(8, "little")
+        )
+
+    def seal_all(self) -> None:
+        """Sum the item hashes, and calculate the digest of the container."""
+        acc = 0
+        for key, child in self.items():
+            acc += _term(key, child.digest)
+        self.acc = acc & _MASK
+        self.seal()
+
+    def replace(self, key: Any, old: Any, new: Any) -> None:
+        """Replace the item hash of `key`. `old` and `new` are the digests of the
+        previous and the current item. If one of them is `None`, the item is added
+        or removed."""
+        if old is not None:
+            self.acc -= _term(key, old)
+        if new is not None:
+            self.acc += _term(key, new)
+        self.acc &= _MASK
+        self.seal()
+
+
+def _build(data: Any) -> _HashNode:
+    """Build the hash nodes of the data without recursion."""
+    root = _HashNode(data)
+    if root.children is None:
+        return root
+    stack = [(root, _iter_children(data))]
+    while stack:
+        node, items = stack[-1]
+        item = next(items, _HASH_END)
+        if item is _HASH_END:
+            stack.pop()
+            node.seal_all()
+            continue
+        key, value = item
+        child = _HashNode(value)
+        if isinstance(node.children, dict):
+            node.children[key] = child
+        else:
+            node.children.append(child)
+        if child.children is not None:
+            stack.append((child, _iter_children(value)))
+    return root
+
+
+def _child_index(node: _HashNode, idx: Any) -> Any:
+    """Normalize the index of a child of a node. The list indicies are converted to
+    non-negative `int`. Raise an error if the child does not exist."""
+    if isinstance(node.children, dict):
+        if idx not in node.children:
+            raise KeyError(idx)
+        return idx
+    if node.children is None:
+        raise KeyError(idx)
+    try:
+        idx = sanitize_list_index(idx)
+    except ValueError as exc:
+        raise TypeError(
+            "Index {0} does not locate an item of a list.".format(repr(idx))
+        ) from exc
+    if idx < 0:
+        idx += len(node.children)
+    if idx < 0 or idx >= len(node.children):
+        raise IndexError("The index {0} is out of range.".format(idx))
+    return idx
+
+
+class HashCache:
+    """The cache of the content hashes of the data.
+
+    Each container and each value of the data has a digest, which can be fetched
+    by its route in O(depth). The data can be modified by the methods of this
+    class, which have the same usages as those of `MixinDataRoute`. After a
+    modification, only the modified subtree and its ancestors are re-hashed. If
+    the data is modified in other ways, call `refresh(route)` with the route of the
+    modified part.
+    """
+
+    def __init__(self, data: Any) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be hashed. It is hashed when the cache is
+            initialized.
+        """
+        self.data = data
+        self._root = _build(data)
+
+    def __repr__(self) -> str:
+        return "{0}({1})".format(self.__class__.__name__, self.digest())
+
+    def _locate(self, route: Sequence[Any]) -> Any:
+        """Locate the nodes along the route.
+
+        Returns
+        -------
+        #1: `[_HashNode]`
+            The nodes from the root to the located node.
+
+        #2: `[str | int]`
+            The route where the list indicies are converted to non-negative `int`.
+        """
+        nodes = [self._root]
+        keys = []
+        for idx in route:
+            node = nodes[-1]
+            idx = _child_index(node, idx[0] if is_sequence(idx) else idx)
+            nodes.append(node.children[idx])
+            keys.append(idx)
+        return nodes, keys
+
+    def digest(self, route: Union[Route, CompiledRoute] = ()) -> str:
+        """Get the digest of a part of the data.
+
+        Arguments
+        ---------
+        route: `[str | int] | CompiledRoute`
+            The route of the part of the data. The route can not locate a table
+            column. If not specified, get the digest of the whole data.
+
+        Returns
+        -------
+        #1: `str`
+            The hexadecimal digest. It is changed when the located part of the
+            data is changed.
+        """
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        nodes, _ = self._locate(route)
+        return "{0:032x}".format(nodes[-1].digest)
+
+    def is_changed(self, route: Union[Route, CompiledRoute], digest: str) -> bool:
+        """Check whether a part of the data is changed since its digest is taken.
+
+        Arguments
+        ---------
+        route: `[str | int] | CompiledRoute`
+            The route of the part of the data.
+
+        digest: `str`
+            The previous digest returned by `digest(route)`.
+
+        Returns
+        -------
+        #1: `bool`
+            `True` if the located part is changed or does not exist anymore.
+        """
+        try:
+            return self.digest(route) != digest
+        except (KeyError, IndexError, TypeError):
+            return True
+
+    def _propagate(self, nodes: Sequence[Any], keys: Sequence[Any], old: list) -> None:
+        """Update the ancestors after the digest of `nodes[-1]` is changed. `old`
+        contains the previous digests of `nodes`."""
+        for pos in range(len(nodes) - 2, -1, -1):
+            nodes[pos].replace(keys[pos], old[pos + 1], nodes[pos + 1].digest)
+
+    def refresh(self, route: Union[Route, CompiledRoute] = ()) -> None:
+        """Re-hash a part of the data after it is modified.
+
+        Arguments
+        ---------
+        route: `[str | int] | CompiledRoute`
+            The route of the modified part. If the part is added to or removed
+            from an object, its parent is updated. If the length of a list is
+            changed, the list is re-hashed. If not specified, re-hash the whole
+            data.
+        """
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        route = [idx[0] if is_sequence(idx) else idx for idx in route]
+        if not route:
+            self._root = _build(self.data)
+            return
+        nodes, keys = self._locate(route[:-1])
+        parent = nodes[-1]
+        parent_data = MixinDataRoute.get_data_by_route(self.data, keys)
+        old = [node.digest for node in nodes]
+        key = route[-1]
+        if isinstance(parent.children, dict) and isinstance(
+            parent_data, collections.abc.Mapping
+        ):
+            prev = parent.children.pop(key, None)
+            child = _build(parent_data[key]) if key in parent_data else None
+            if child is not None:
+                parent.children[key] = child
+            parent.replace(
+                key,
+                None if prev is None else prev.digest,
+                None if child is None else child.digest,
+            )
+        elif (
+            isinstance(parent.children, list)
+            and is_sequence(parent_data)
+            and len(parent.children) == len(parent_data)
+        ):
+            key = _child_index(parent, key)
+            prev = parent.children[key]
+            child = _build(parent_data[key])
+            parent.children[key] = child
+            parent.replace(key, prev.digest, child.digest)
+        else:
+            # The items of the list are shifted, or the type of the parent is
+            # changed, so the parent is re-hashed.
+            self._replace_node(nodes, keys, old, _build(parent_data))
+            return
+        self._propagate(nodes, keys, old)
+
+    def _replace_node(
+        self, nodes: Sequence[Any], keys: Sequence[Any], old: list, node: _HashNode
+    ) -> None:
+        """Replace `nodes[-1]` by a new node, and update the ancestors."""
+        if len(nodes) == 1:
+            self._root = node
+            return
+        parent = nodes[-2]
+        parent.children[keys[-1]] = node
+        nodes = list(nodes[:-1]) + [node]
+        self._propagate(nodes, keys, old)
+
+    def update_data_by_route(self, route: Union[Route, CompiledRoute], val: Any) -> Any:
+        """Update a specific part of `data` by a route, and re-hash the updated
+        part.
+
+        If the route locates a table column, the whole table will be re-hashed.
+
+        See `MixinDataRoute.update_data_by_route` for the details of the arguments.
+
+        Returns
+        -------
+        #1: `Any`
+            The modified `data`.
+        """
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        path, _ = _locate_patch_path(self.data, route)
+        MixinDataRoute.update_data_by_route(self.data, route, val)
+        if path is not None:
+            self.refresh(path)
+        return self.data
+
+    def delete_data_by_route(self, route: Union[Route, CompiledRoute]) -> Any:
+        """Delete the data part specified by a route, and re-hash the parent of the
+        deleted part.
+
+        If the route locates a table column, the whole table will be re-hashed.
+        If an item is deleted from a list, the following items are not re-hashed,
+        but the hash of the list is re-calculated from the hashes of its items.
+
+        See `MixinDataRoute.delete_data_by_route` for the details of the arguments.
+
+        Returns
+        -------
+        #1: `Any`
+            The data that is deleted and poped out.
+        """
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        path, is_column = _locate_patch_path(self.data, route)
+        val = MixinDataRoute.delete_data_by_route(self.data, route)
+        if path is None:
+            return val
+        if is_column:
+            self.refresh(path)
+            return val
+        nodes, keys = self._locate(path[:-1])
+        parent = nodes[-1]
+        old = [node.digest for node in nodes]
+        if isinstance(parent.children, list):
+            del parent.children[_child_index(parent, path[-1])]
+            parent.seal_all()
+            self._propagate(nodes, keys, old)
+        else:
+            self.refresh(path)
+        return val
@@ -0,0 +1,548 @@
+# -*- coding: UTF-8 -*-
+"""
+Journal
+=======
+@Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The undo/redo journal of the modifications. Each modification made through the
+journal records how to revert it, e.g. the previous value of the updated part, or
+the value popped out by the deletion:
+``` python
+journal = EditJournal(data)
+journal.update_data_by_route(["batters", "batter", 0, "type"], "Plain")
+journal.delete_data_by_route(["topping", 2])
+journal.undo()  # The deleted item is inserted back.
+journal.redo()  # The item is deleted again.
+```
+Reverting a modification only costs the size of the modified part, rather than
+keeping a copy of the whole data for each step. The memory used by the records is
+limited by `max_bytes`, and the oldest records are dropped first.
+
+Several modifications can be applied as a transaction. If any of them fails, the
+applied ones are reverted by their records:
+``` python
+with transaction(data) as txn:
+    txn.update_data_by_route(["topping", ["type"]], ["Glazed", "Sugar"])
+    txn.delete_data_by_route(["batters"])
+```
+"""
+
+import sys
+import contextlib
+import collections
+import collections.abc
+
+from typing import Union, Optional, Any
+
+try:
+    from typing import Sequence, Iterator
+except ImportError:
+    from collections.abc import Sequence, Iterator
+
+from .mixins import (
+    Route,
+    CompiledRoute,
+    MixinDataRoute,
+    is_sequence,
+    sanitize_list_index,
+    get_item_of_object,
+    _notify_table_column,
+    _iter_children,
+)
+from .patch import _locate_patch_path
+
+
+__all__ = ("EditJournal", "transaction")
+
+
+def _estimate_size(value: Any) -> int:
+    """Estimate the memory used by a value and its items in bytes."""
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        size += sys.getsizeof(item)
+        children = _iter_children(item)
+        if children is None:
+            continue
+        is_mapping = isinstance(item, collections.abc.Mapping)
+        for key, child in children:
+            if is_mapping:
+                size += sys.getsizeof(key)
+            stack.append(child)
+    return size
+
+
+def _key_position(mapping: Any, key: Any) -> int:
+    """Get the position of `key` in the ordered keys of `mapping`. The last key is
+    found in O(1), and the other keys are found by scanning the keys."""
+    if isinstance(mapping, dict) and mapping and next(reversed(mapping)) == key:
+        return len(mapping) - 1
+    for pos, m_key in enumerate(mapping):
+        if m_key == key:
+            return pos
+    raise KeyError(key)
+
+
+def _insert_key(mapping: Any, pos: int, key: Any, val: Any) -> None:
+    """Add `key` to `mapping`, and move it to the position `pos` of the keys. The
+    other keys are kept in the same order.
+
+    A mapping can not insert a key in the middle, so if `key` is not the last key,
+    the mapping is rebuilt, which costs O(number of keys). Adding the last key
+    costs O(1).
+    """
+    mapping[key] = val
+    if pos >= len(mapping) - 1:
+        return
+    items = list(mapping.items())
+    items.insert(pos, items.pop())
+    mapping.clear()
+    mapping.update(items)
+
+
+def _normalize_path(data: Any, path: Sequence[Any]) -> list:
+    """Convert the last index of the path to a non-negative `int` if it locates a
+    list item."""
+    path = list(path)
+    parent = MixinDataRoute.get_data_by_route(data, path[:-1])
+    if not isinstance(parent, collections.abc.Mapping) and is_sequence(parent):
+        idx = sanitize_list_index(path[-1])
+        if idx < 0:
+            idx += len(parent)
+        path[-1] = idx
+    return path
+
+
+def _record_column(data: Any, path: Sequence[Any], key: Any, pop: bool) -> tuple:
+    """Record the values of the table column `key`, before the column is modified.
+
+    Each row is recorded as `(index, position, value)`. If `pop` is `True`, the
+    column will be deleted, and `position` is the position of `key` in the row.
+    Otherwise, `position` is `None` if the row has the column, and `-1` if the
+    row does not have it.
+    """
+    table = MixinDataRoute.get_data_by_route(data, path)
+    rows = []
+    for idx, row in enumerate(table):
+        if not isinstance(row, collections.abc.MutableMapping):
+            continue
+        if key in row:
+            rows.append((idx, _key_position(row, key) if pop else None, row[key]))
+        elif not pop:
+            rows.append((idx, -1, None))
+    return ("column", list(path), key, rows)
+
+
+def _record_update(data: Any, route: Sequence[Any]) -> Optional[tuple]:
+    """Record how to revert `MixinDataRoute.update_data_by_route(data, route, ...)`
+    before it is applied. Return `None` if the route does not locate anything."""
+    path, is_column = _locate_patch_path(data, route)
+    if path is None:
+        return None
+    if is_column:
+        key = route[len(path)][0]
+        return _record_column(data, path, key, pop=False)
+    path = _normalize_path(data, path)
+    parent = MixinDataRoute.get_data_by_route(data, path[:-1])
+    key = path[-1]
+    if isinstance(parent, collections.abc.Mapping) and key not in parent:
+        return ("pop", path)
+    return ("set", path, get_item_of_object(parent, key))
+
+
+def _record_delete(data: Any, route: Sequence[Any]) -> Optional[tuple]:
+    """Record how to revert `MixinDataRoute.delete_data_by_route(data, route)`
+    before it is applied. The deleted value is filled after it is popped out.
+    Return `None` if the route does not locate anything."""
+    path, is_column = _locate_patch_path(data, route)
+    if path is None:
+        return None
+    if is_column:
+        key = route[len(path)][0]
+        return _record_column(data, path, key, pop=True)
+    path = _normalize_path(data, path)
+    parent = MixinDataRoute.get_data_by_route(data, path[:-1])
+    if isinstance(parent, collections.abc.Mapping):
+        return ("insert_key", path, _key_position(parent, path[-1]), None)
+    return ("insert", path, None)
+
+
+def _common_route(routes: Sequence[Any]) -> list:
+    """Get the longest shared prefix of the routes."""
+    prefix = list(routes[0])
+    for route in routes[1:]:
+        n_shared = 0
+        for idx, p_idx in zip(route, prefix):
+            if idx != p_idx:
+                break
+            n_shared += 1
+        del prefix[n_shared:]
+    return prefix
+
+
+def _revert(data: Any, inverse: tuple) -> None:
+    """Revert a modification by its record."""
+    kind, path = inverse[0], inverse[1]
+    if kind == "set":
+        MixinDataRoute.update_data_by_route(data, path, inverse[2])
+    elif kind == "pop":
+        MixinDataRoute.delete_data_by_route(data, path)
+    elif kind == "insert":
+        parent = MixinDataRoute.get_data_by_route(data, path[:-1])
+        parent.insert(path[-1], inverse[2])
+    elif kind == "insert_key":
+        parent = MixinDataRoute.get_data_by_route(data, path[:-1])
+        _insert_key(parent, inverse[2], path[-1], inverse[3])
+        if len(path) > 1:
+            _notify_table_column(
+                MixinDataRoute.get_data_by_route(data, path[:-2]), path[-1]
+            )
+    elif kind == "column":
+        table = MixinDataRoute.get_data_by_route(data, path)
+        key = inverse[2]
+        for idx, pos, val in inverse[3]:
+            row = table[idx]
+            if pos is None:
+                row[key] = val
+            elif pos < 0:
+                row.pop(key, None)
+            else:
+                _insert_key(row, pos, key, val)
+        _notify_table_column(table, key)
+    else:
+        raise ValueError("Unrecognized record: {0}".format(kind))
+
+
+class _Edit:
+    """A recorded modification. `val` is the value used for updating the data, and
+    `inverse` is the record used for reverting the modification.
+
+    If `op` is `"group"`, the record is a transaction, where `val` is the list of
+    the records of its modifications, and `route` is their shared prefix.
+    """
+
+    __slots__ = ("op", "route", "val", "inverse", "n_bytes")
+
+    def __init__(self, op: str, route: Sequence[Any], val: Any, inverse: Any):
+        self.op = op
+        self.route = list(route)
+        self.val = val
+        self.inverse = inverse
+        if op == "group":
+            self.n_bytes = sum(edit.n_bytes for edit in val)
+        else:
+            self.n_bytes = _estimate_size((route, val, inverse))
+
+    @classmethod
+    def group(cls, edits: Sequence["_Edit"]) -> "_Edit":
+        """Make the record of a transaction."""
+        return cls("group", _common_route([edit.route for edit in edits]), edits, None)
+
+    def revert(self, data: Any) -> None:
+        """Revert the recorded modification."""
+        if self.op == "group":
+            for edit in reversed(self.val):
+                _revert(data, edit.inverse)
+        else:
+            _revert(data, self.inverse)
+
+
+class EditJournal:
+    """The undo/redo journal of the modifications of the data.
+
+    The data can be modified by the methods of this class, which have the same
+    usages as those of `MixinDataRoute`. Each modification records the previous
+    values of the modified part, so `undo()` reverts the modification without
+    copying the whole data. If the data is modified in other ways, the records may
+    not be able to revert the data correctly, so call `clear()` after that.
+
+    The modifications made in `transaction()` are reverted together if any of them
+    fails, and are recorded as one step of `undo()`.
+    """
+
+    def __init__(self, data: Any, max_bytes: Optional[int] = 64 * 1024 * 1024):
+        """Initialization.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be modified.
+
+        max_bytes: `int | None`
+            The maximal memory used by the records in bytes. If exceeded, the
+            oldest records are dropped. If `None`, the memory is not limited.
+        """
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError(
+                "The argument max_bytes needs to be positive, but get: {0}".format(
+                    max_bytes
+                )
+            )
+        self.data = data
+        self.max_bytes = max_bytes
+        self._undo = collections.deque()
+        self._redo = collections.deque()
+        self._n_bytes = 0
+        self._pending = None
+
+    @property
+    def n_bytes(self) -> int:
+        """The estimated memory used by the records in bytes."""
+        return self._n_bytes
+
+    @property
+    def can_undo(self) -> bool:
+        """Whether there is a modification that can be reverted."""
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        """Whether there is a reverted modification that can be applied again."""
+        return bool(self._redo)
+
+    def __repr__(self) -> str:
+        return "{0}(undo={1}, redo={2}, bytes={3})".format(
+            self.__class__.__name__, len(self._undo), len(self._redo), self._n_bytes
+        )
+
+    def clear(self) -> None:
+        """Drop all records."""
+        self._undo.clear()
+        self._redo.clear()
+        self._n_bytes = 0
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether a transaction is running."""
+        return self._pending is not None
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator["EditJournal"]:
+        """Apply the modifications in the context as a transaction.
+
+        The modifications made by this journal in the context are applied at once.
+        If an error is raised in the context, the modifications are reverted in
+        the reversed order, and the error is raised again. Otherwise, they are
+        recorded as one step of `undo()`. The data is not copied.
+
+        A transaction in another transaction only reverts its own modifications
+        when it fails. The outer transaction can catch the error and continue.
+
+        Returns
+        -------
+        #1: `EditJournal`
+            This journal.
+        """
+        is_outer = self._pending is None
+        if is_outer:
+            self._pending = []
+        pending = self._pending
+        start = len(pending)
+        try:
+            yield self
+        except BaseException:
+            for edit in reversed(pending[start:]):
+                edit.revert(self.data)
+            del pending[start:]
+            raise
+        finally:
+            if is_outer:
+                self._pending = None
+        if is_outer and pending:
+            self._push(_Edit.group(pending), new=True)
+
+    def _push(self, edit: _Edit, new: bool = False) -> None:
+        """Add a record, and drop the oldest records if the memory exceeds. If `new`
+        is `True`, the record is a new modification, so the reverted records are
+        dropped.
+
+        Both the undo and the redo records are counted in the memory. The oldest
+        undo records are dropped first, but the added record is kept as long as
+        the redo records can be dropped, starting from the one that `redo()`
+        would apply last.
+        """
+        if new:
+            for prev in self._redo:
+                self._n_bytes -= prev.n_bytes
+            self._redo.clear()
+        self._undo.append(edit)
+        self._n_bytes += edit.n_bytes
+        if self.max_bytes is None:
+            return
+        while self._n_bytes > self.max_bytes:
+            if len(self._undo) > 1 or (self._undo and not self._redo):
+                self._n_bytes -= self._undo.popleft().n_bytes
+            elif self._redo:
+                self._n_bytes -= self._redo.popleft().n_bytes
+            else:
+                break
+
+    def _add(self, edit: Optional[_Edit]) -> None:
+        """Add the record of a new modification."""
+        if edit is None:
+            return
+        if self._pending is not None:
+            self._pending.append(edit)
+        else:
+            self._push(edit, new=True)
+
+    def _check_no_transaction(self) -> None:
+        """Raise an error if a transaction is running."""
+        if self._pending is not None:
+            raise ValueError(
+                "Fail to revert or apply the records during a transaction."
+            )
+
+    def _apply(self, op: str, route: Sequence[Any], val: Any = None) -> Any:
+        """Apply a modification, and record how to revert it.
+
+        The record is made before the modification is applied. If the record can
+        not be made, the error is raised and the data is not modified, so every
+        applied modification can be reverted.
+
+        Returns
+        -------
+        #1: `Any`
+            The value returned by the modification of `MixinDataRoute`.
+
+        #2: `_Edit | None`
+            The record of the modification. If `None`, the modification is not
+            recorded.
+        """
+        record = _record_update if op == "update" else _record_delete
+        inverse = record(self.data, route)
+        try:
+            if op == "update":
+                res = MixinDataRoute.update_data_by_route(self.data, route, val)
+            else:
+                res = MixinDataRoute.delete_data_by_route(self.data, route)
+        except Exception:
+            # Only the modification of a table column writes several values, so
+            # the written values are reverted if it fails.
+            if inverse and inverse[0] == "column":
+                _revert(self.data, inverse)
+            raise
+        if inverse is None:
+            return res, None
+        if op == "delete":
+            if inverse[0] == "insert":
+                inverse = (inverse[0], inverse[1], res)
+            elif inverse[0] == "insert_key":
+                inverse = (inverse[0], inverse[1], inverse[2], res)
+        return res, _Edit(op, route, val, inverse)
+
+    def update_data_by_route(self, route: Union[Route, CompiledRoute], val: Any) -> Any:
+        """Update a specific part of `data` by a route, and record the previous
+        value of the updated part.
+
+        See `MixinDataRoute.update_data_by_route` for the details of the arguments.
+
+        Returns
+        -------
+        #1: `Any`
+            The modified `data`.
+        """
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        _, edit = self._apply("update", route, val)
+        self._add(edit)
+        return self.data
+
+    def delete_data_by_route(self, route: Union[Route, CompiledRoute]) -> Any:
+        """Delete the data part specified by a route, and record the deleted value.
+
+        See `MixinDataRoute.delete_data_by_route` for the details of the arguments.
+
+        Returns
+        -------
+        #1: `Any`
+            The data that is deleted and poped out.
+        """
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        val, edit = self._apply("delete", route)
+        self._add(edit)
+        return val
+
+    def undo(self) -> Optional[Route]:
+        """Revert the latest modification.
+
+        Returns
+        -------
+        #1: `[str | int | (str,)] | None`
+            The route of the reverted modification. If a transaction is reverted,
+            return the shared prefix of its routes. If there is nothing to revert,
+            return `None`.
+        """
+        self._check_no_transaction()
+        if not self._undo:
+            return None
+        edit = self._undo.pop()
+        edit.revert(self.data)
+        self._redo.append(edit)
+        return edit.route
+
+    def redo(self) -> Optional[Route]:
+        """Apply the latest reverted modification again.
+
+        If the modification fails, the error is raised, and the record is kept
+        for the next `redo()`. The failed transaction is reverted as a whole.
+
+        Returns
+        -------
+        #1: `[str | int | (str,)] | None`
+            The route of the applied modification. If there is nothing to apply,
+            return `None`.
+        """
+        self._check_no_transaction()
+        if not self._redo:
+            return None
+        prev = self._redo[-1]
+        if prev.op == "group":
+            edits = []
+            try:
+                for sub in prev.val:
+                    edits.append(self._apply(sub.op, sub.route, sub.val)[1])
+            except Exception:
+                for sub in reversed(edits):
+                    if sub is not None:
+                        sub.revert(self.data)
+                raise
+            edits = [sub for sub in edits if sub is not None]
+            edit = _Edit.group(edits) if edits else None
+        else:
+            _, edit = self._apply(prev.op, prev.route, prev.val)
+        self._redo.pop()
+        self._n_bytes -= prev.n_bytes
+        if edit is not None:
+            self._push(edit)
+        return prev.route
+
+
+@contextlib.contextmanager
+def transaction(data: Any) -> Iterator[EditJournal]:
+    """Modify the data by a transaction.
+
+    Arguments
+    ---------
+    data: `Any`
+        The whole data object to be modified.
+
+    Returns
+    -------
+    #1: `EditJournal`
+        The journal used for modifying the data in the context. If an error is
+        raised in the context, the modifications made by the journal are
+        reverted. See `EditJournal.transaction` for details.
+    """
+    journal = EditJournal(data, max_bytes=None)
+    with journal.transaction():
+        yield journal
@@ -0,0 +1,713 @@
+# -*- coding: UTF-8 -*-
+"""
+Loaders
+=======
+@Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The loaders used for reading the JSON data from files. These loaders are used by the
+methods of `MixinFile`, and can be used independently.
+"""
+
+import os
+import re
+import mmap
+import json
+import codecs
+import functools
+import threading
+import collections
+
+from typing import Union, Optional, Any, IO, Tuple, Dict, NamedTuple
+
+try:
+    from typing import Iterator, Callable
+except ImportError:
+    from collections.abc import Iterator, Callable
+
+from .mixins import Route, MixinDataRoute, is_sequence, sanitize_list_index
+
+
+__all__ = (
+    "JSONBackend",
+    "register_backend",
+    "available_backends",
+    "get_backend",
+    "get_default_backend",
+    "set_default_backend",
+    "loads",
+    "load_file",
+    "load_stream",
+)
+
+
+_RE_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_RE_CONTAINER = re.compile(r'([\[{])|([\]}])|"[^"\\]*(?:\\.[^"\\]*)*"|(")')
+_RE_FULL_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_RE_STRING = re.compile(r'["\\]')
+_RE_SCALAR_END = re.compile(r"[ \t\n\r,:\[\]{}\"]")
+
+
+class JSONBackend(NamedTuple):
+    """The JSON parser used for decoding the data."""
+
+    name: str
+    """The name of the backend."""
+
+    loads: Callable[[Union[str, bytes]], Any]
+    """The function decoding the JSON text (`str`) or JSON bytes (`bytes`)."""
+
+    accepts_bytes: bool
+    """Whether `loads` parses the UTF-8 encoded bytes directly. If `True`, the
+    files will be read in the binary mode, and the step of decoding the bytes into
+    the text will be skipped."""
+
+    accepts_buffer: bool = False
+    """Whether `loads` parses any object supporting the buffer protocol, like
+    `memoryview`. If `True`, the memory-mapped file can be parsed without being
+    copied."""
+
+
+def _load_orjson() -> JSONBackend:
+    import orjson
+
+    return JSONBackend("orjson", orjson.loads, True, True)
+
+
+def _load_simdjson() -> JSONBackend:
+    import simdjson
+
+    return JSONBackend("simdjson", simdjson.loads, True)
+
+
+def _load_ujson() -> JSONBackend:
+    import ujson
+
+    return JSONBackend("ujson", ujson.loads, True)
+
+
+def _load_json() -> JSONBackend:
+    return JSONBackend("json", json.loads, False)
+
+
+# The factories of the backends. The order is the priority in the auto mode.
+_backend_factories: "collections.OrderedDict[str, Callable[[], JSONBackend]]" = (
+    collections.OrderedDict(
+        (
+            ("orjson", _load_orjson),
+            ("simdjson", _load_simdjson),
+            ("ujson", _load_ujson),
+            ("json", _load_json),
+        )
+    )
+)
+_backends: Dict[str, JSONBackend] = dict()
+_backends_lock = threading.Lock()
+_default_backend: Optional[str] = None
+
+
+def register_backend(
+    name: str, factory: Callable[[], JSONBackend], priority: Optional[int] = None
+) -> None:
+    """Register a JSON backend.
+
+    Arguments
+    ---------
+    name: `str`
+        The name of the backend. If the name exists, the registered backend will be
+        replaced.
+
+    factory: `() -> JSONBackend`
+        The function creating the backend. It is not called until the backend is
+        used. It should raise `ImportError` if the backend is not installed.
+
+    priority: `int | None`
+        The position of this backend in the auto mode, where `0` means the highest
+        priority. If not specified, the backend is placed right before the
+        standard library `json`.
+    """
+    if name in ("auto", "json"):
+        raise ValueError(
+            "The backend name {0} is reserved and cannot be registered.".format(
+                repr(name)
+            )
+        )
+    with _backends_lock:
+        _backend_factories.pop(name, None)
+        _backends.pop(name, None)
+        items = list(_backend_factories.items())
+        if priority is None:
+            priority = len(items) - 1
+        items.insert(max(0, min(priority, len(items) - 1)), (name, factory))
+        _backend_factories.clear()
+        _backend_factories.update(items)
+
+
+def _resolve_backend(name: str) -> Optional[JSONBackend]:
+    """Get the backend by its name. Return `None` if not installed."""
+    backend = _backends.get(name)
+    if backend is not None:
+        return backend
+    factory = _backend_factories.get(name)
+    if factory is None:
+        raise ValueError(
+            "Unknown JSON backend: {0}. The available choices are: {1}.".format(
+                repr(name), ", ".join(("auto",) + tuple(_backend_factories.keys()))
+            )
+        )
+    try:
+        backend = factory()
+    except ImportError:
+        return None
+    with _backends_lock:
+        _backends[name] = backend
+    return backend
+
+
+def available_backends() -> Tuple[str, ...]:
+    """Get the names of the installed JSON backends.
+
+    Returns
+    -------
+    #1: `(str, ...)`
+        The names of the installed backends ordered by the priority in the auto
+        mode. The standard library `json` is always the last one.
+    """
+    return tuple(
+        name
+        for name in tuple(_backend_factories.keys())
+        if _resolve_backend(name) is not None
+    )
+
+
+def get_backend(name: Optional[str] = None) -> JSONBackend:
+    """Get the JSON backend.
+
+    Arguments
+    ---------
+    name: `str | None`
+        The name of the backend. If `None`, use the default backend configured by
+        `set_default_backend`. If `"auto"`, use the installed backend with the
+        highest priority.
+
+    Returns
+    -------
+    #1: `JSONBackend`
+        The backend. Raise `ImportError` if the specified backend is not
+        installed.
+    """
+    if name is None:
+        name = _default_backend
+    if name is None or name == "auto":
+        for name in tuple(_backend_factories.keys()):
+            backend = _resolve_backend(name)
+            if backend is not None:
+                return backend
+        return _load_json()
+    backend = _resolve_backend(name)
+    if backend is None:
+        raise ImportError("The JSON backend {0} is not installed.".format(repr(name)))
+    return backend
+
+
+def get_default_backend() -> str:
+    """Get the name of the default JSON backend. It is `"auto"` if the backend is
+    selected automatically."""
+    return "auto" if _default_backend is None else _default_backend
+
+
+def set_default_backend(name: Optional[str] = None) -> None:
+    """Configure the default JSON backend used by the loaders.
+
+    Arguments
+    ---------
+    name: `str | None`
+        The name of the backend. If `None` or `"auto"`, the installed backend with
+        the highest priority will be used, and the data failing to be decoded by
+        this backend will be decoded by the standard library `json` again.
+    """
+    global _default_backend
+    if name is None or name == "auto":
+        _default_backend = None
+        return
+    get_backend(name)
+    _default_backend = name
+
+
+def loads(
+    data: Union[str, bytes, bytearray, memoryview], backend: Optional[str] = None
+) -> Any:
+    """Decode the JSON data.
+
+    Arguments
+    ---------
+    data: `str | bytes | bytearray | memoryview`
+        The JSON text or the UTF-8 encoded JSON bytes.
+
+    backend: `str | None`
+        The name of the JSON backend. If not specified, use the default backend.
+        See `get_backend` for details.
+
+    Returns
+    -------
+    #1: `Any`
+        The decoded data.
+    """
+    is_auto = (_default_backend if backend is None else backend) in (None, "auto")
+    json_backend = get_backend(backend)
+    if isinstance(data, memoryview) and not json_backend.accepts_buffer:
+        data = data.tobytes()
+    try:
+        return json_backend.loads(data)
+    except ValueError:
+        # The fast parsers may be stricter than the standard library, for
+        # example, `NaN` or very large integers may not be supported.
+        if not is_auto or json_backend.name == "json":
+            raise
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _load_mmap(path: Union[str, os.PathLike], backend: Optional[str] = None) -> Any:
+    """Private implementation of `load_file(..., use_mmap=True)`."""
+    json_backend = get_backend(backend)
+    with open(path, "rb") as fobj:
+        if os.fstat(fobj.fileno()).st_size == 0:
+            # An empty file cannot be mapped.
+            return loads(b"", backend=backend)
+        with mmap.mmap(fobj.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if not json_backend.accepts_buffer:
+                return loads(mapped[:], backend=backend)
+            view = memoryview(mapped)
+            try:
+                return loads(view, backend=backend)
+            finally:
+                # The mapping cannot be closed if it is still exported.
+                view.release()
+
+
+def load_file(
+    json_file: Union[str, os.PathLike, IO[str], IO[bytes]],
+    backend: Optional[str] = None,
+    use_mmap: bool = False,
+) -> Any:
+    """Load the JSON data from a file.
+
+    Arguments
+    ---------
+    json_file: `str | os.PathLike | IO[str] | IO[bytes]`
+        If a `str`| os.PathLike` is provided, will open the file specified by this
+        path and load the file content as the data. If the backend parses bytes
+        directly, the file will be read in the binary mode.
+
+        If a file-like object is provided, will load data from this object directly.
+
+    backend: `str | None`
+        The name of the JSON backend. If not specified, use the default backend.
+        See `get_backend` for details.
+
+    use_mmap: `bool`
+        If specified, the file specified by the path will be memory-mapped. If the
+        backend parses buffers (see `JSONBackend.accepts_buffer`), the mapped file
+        is passed to the backend directly, and the file content will not be copied
+        into `bytes` or `str`. The file needs to be encoded by UTF-8. This option
+        does not take effect if `json_file` is a file-like object.
+
+    Returns
+    -------
+    #1: `Any`
+        The decoded data.
+    """
+    if isinstance(json_file, (str, os.PathLike)):
+        if use_mmap:
+            return _load_mmap(json_file, backend=backend)
+        mode = "rb" if get_backend(backend).accepts_bytes else "r"
+        with open(json_file, mode) as fobj:
+            return loads(fobj.read(), backend=backend)
+    return loads(json_file.read(), backend=backend)
+
+
+class _StreamScanner:
+    """Private class implementation for the method `load_stream`.
+
+    An incremental scanner of the JSON text. The text is read chunk by chunk, and the
+    consumed part of the text is dropped. The values that are not needed are skipped
+    without being decoded. Therefore, the peak memory is only related to the chunk
+    size and the size of the value that is really loaded.
+    """
+
+    def __init__(
+        self,
+        fobj: IO[Any],
+        chunk_size: int,
+        loads: Callable[[str], Any] = json.loads,
+    ) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        fobj: `IO[str] | IO[bytes]`
+            The file-like object to be read. If the file is opened in the binary
+            mode, the content will be decoded as UTF-8.
+
+        chunk_size: `int`
+            The number of characters (or bytes) read from the file each time.
+
+        loads: `(str) -> Any`
+            The function used for decoding the located values.
+        """
+        self.fobj = fobj
+        self.loads = loads
+        self.chunk_size = max(1, int(chunk_size))
+        self.decoder: Optional[codecs.IncrementalDecoder] = None
+        self.buf = ""
+        self.pos = 0
+        self.offset = 0
+        self.eof = False
+        self.captured: Optional[list] = None
+        self.cap_start = 0
+
+    def fill(self) -> bool:
+        """Read the next chunk. The part of the buffer before `pos` is dropped.
+
+        Returns
+        -------
+        #1: `bool`
+            `False` if the end of the file has been reached.
+        """
+        if self.eof:
+            return False
+        chunk = self.fobj.read(self.chunk_size)
+        if isinstance(chunk, (bytes, bytearray)):
+            if self.decoder is None:
+                self.decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            raw = chunk
+            chunk = self.decoder.decode(raw, final=not raw)
+            # A multi-byte character may be split by the chunk boundary.
+            while raw and not chunk:
+                raw = self.fobj.read(self.chunk_size)
+                chunk = self.decoder.decode(raw, final=not raw)
+        if not chunk:
+            self.eof = True
+        if self.captured is not None:
+            self.captured.append(self.buf[self.cap_start : self.pos])
+            self.cap_start = 0
+        self.offset += self.pos
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return not self.eof
+
+    def error(self, msg: str) -> ValueError:
+        """Create the error at the current position."""
+        return ValueError(
+            "{0} (char {1} of the JSON stream)".format(msg, self.offset + self.pos)
+        )
+
+    def skip_whitespace(self) -> str:
+        """Skip the white spaces, and return the next character. If the end of the
+        file is reached, return `""`."""
+        while True:
+            self.pos = _RE_WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume the character `char` after the white spaces."""
+        if self.skip_whitespace() != char:
+            raise self.error("Expecting {0}".format(repr(char)))
+        self.pos += 1
+
+    def scan_string(self) -> None:
+        """Move to the end of the string starting from the current position."""
+        match = _RE_FULL_STRING.match(self.buf, self.pos)
+        if match is not None:
+            self.pos = match.end()
+            return
+        self.pos += 1
+        while True:
+            match = _RE_STRING.search(self.buf, self.pos)
+            if match is None:
+                self.pos = len(self.buf)
+                if not self.fill():
+                    raise self.error("Unterminated string")
+                continue
+            if match.group() == '"':
+                self.pos = match.end()
+                return
+            if match.end() < len(self.buf):
+                self.pos = match.end() + 1
+                continue
+            # The escaped character is in the next chunk.
+            self.pos = match.start()
+            if not self.fill():
+                raise self.error("Unterminated string")
+
+    def scan_scalar(self) -> None:
+        """Move to the end of the number, `true`, `false`, or `null`."""
+        while True:
+            match = _RE_SCALAR_END.search(self.buf, self.pos)
+            if match is not None:
+                end = match.start()
+                break
+            if not self.fill():
+                end = len(self.buf)
+                break
+        if end == self.pos:
+            raise self.error("Expecting value")
+        self.pos = end
+
+    def scan_container(self) -> None:
+        """Move to the end of the object or the array starting from the current
+        position. The items of the container are not decoded."""
+        depth = 0
+        while True:
+            for match in _RE_CONTAINER.finditer(self.buf, self.pos):
+                kind = match.lastindex
+                if kind == 1:
+                    depth += 1
+                elif kind == 2:
+                    depth -= 1
+                    if depth == 0:
+                        self.pos = match.end()
+                        return
+                elif kind == 3:
+                    # The string is not terminated in the current buffer.
+                    self.pos = match.start()
+                    self.scan_string()
+                    break
+            else:
+                self.pos = len(self.buf)
+                if not self.fill():
+                    raise self.error("Unterminated object or array")
+
+    def skip_value(self) -> None:
+        """Move to the end of the next value without decoding it."""
+        char = self.skip_whitespace()
+        if char == '"':
+            self.scan_string()
+        elif char in ("[", "{"):
+            self.scan_container()
+        elif char == "" or char in "]},:":
+            raise self.error("Expecting value")
+        else:
+            self.scan_scalar()
+
+    def capture_value(self) -> str:
+        """Move to the end of the next value, and return the text of this value."""
+        self.skip_whitespace()
+        self.captured = []
+        self.cap_start = self.pos
+        try:
+            self.skip_value()
+            self.captured.append(self.buf[self.cap_start : self.pos])
+            return "".join(self.captured)
+        finally:
+            self.captured = None
+
+    def iter_object(self) -> Iterator[str]:
+        """Iterate the keys of the object starting from the current position.
+
+        After each key is yielded, the position is at the value of this key. The
+        value needs to be consumed before getting the next key.
+        """
+        self.expect("{")
+        if self.skip_whitespace() == "}":
+            self.pos += 1
+            return
+        while True:
+            if self.skip_whitespace() != '"':
+                raise self.error("Expecting property name enclosed in double quotes")
+            key = self.loads(self.capture_value())
+            self.expect(":")
+            yield key
+            char = self.skip_whitespace()
+            self.pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise self.error("Expecting ',' delimiter")
+
+    def iter_array(self) -> Iterator[int]:
+        """Iterate the indicies of the array starting from the current position.
+
+        After each index is yielded, the position is at the item of this index. The
+        item needs to be consumed before getting the next index.
+        """
+        self.expect("[")
+        if self.skip_whitespace() == "]":
+            self.pos += 1
+            return
+        idx = 0
+        while True:
+            yield idx
+            char = self.skip_whitespace()
+            self.pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise self.error("Expecting ',' delimiter")
+            idx += 1
+
+    def read_value(self) -> Any:
+        """Decode the next value.
+
+        If the value is an object or an array, its items are decoded one by one, so
+        the whole text of the value does not need to be held in the memory.
+        """
+        char = self.skip_whitespace()
+        if char == "{":
+            return {key: self.loads(self.capture_value()) for key in self.iter_object()}
+        elif char == "[":
+            return [self.loads(self.capture_value()) for _ in self.iter_array()]
+        return self.loads(self.capture_value())
+
+    def read_column(self, key: str) -> Any:
+        """Decode a column of the table (an array) starting from the current
+        position. The result is the same as the table column located by
+        `MixinDataRoute.get_data_by_route`."""
+        cols = collections.OrderedDict()
+        n_items = 0
+        for idx in self.iter_array():
+            n_items += 1
+            if self.skip_whitespace() != "{":
+                self.skip_value()
+                continue
+            # Only one row is decoded each time.
+            row = self.loads(self.capture_value())
+            if key in row:
+                cols[idx] = row[key]
+        if not cols:
+            raise KeyError(key)
+        if len(cols) == n_items:
+            return tuple(cols.values())
+        return cols
+
+    def seek_key(self, key: Any) -> None:
+        """Move to the value of `key` in the object starting from the current
+        position. Raise `KeyError` if the key is not found."""
+        for item_key in self.iter_object():
+            if item_key == key:
+                return
+            self.skip_value()
+        raise KeyError(key)
+
+    def seek_index(self, index: int) -> Optional[str]:
+        """Move to the item of `index` in the array starting from the current
+        position. Raise `IndexError` if the index is out of range.
+
+        If `index` is negative, the whole array will be scanned. In this case, the
+        text of the located item is returned, and the position will be at the end
+        of the array.
+        """
+        if index < 0:
+            last_items = collections.deque(maxlen=-index)
+            for _ in self.iter_array():
+                last_items.append(self.capture_value())
+            if len(last_items) < -index:
+                raise IndexError("list index out of range")
+            return last_items[0]
+        for idx in self.iter_array():
+            if idx == index:
+                return None
+            self.skip_value()
+        raise IndexError("list index out of range")
+
+    def locate(self, route: Route) -> Any:
+        """Decode the part of the data located by `route`. The values not on the
+        route are skipped without being decoded."""
+        for pos, idx in enumerate(route):
+            if idx is None:
+                break
+            char = self.skip_whitespace()
+            rest = route[pos + 1 :]
+            if char not in ("{", "["):
+                return MixinDataRoute.get_data_by_route(self.read_value(), route[pos:])
+            if is_sequence(idx):
+                key = idx[0]
+                if char == "{":
+                    self.seek_key(key)
+                    continue
+                if not isinstance(key, int):
+                    return MixinDataRoute.get_data_by_route(self.read_column(key), rest)
+                index = key
+            elif char == "{":
+                self.seek_key(idx)
+                continue
+            else:
+                try:
+                    index = sanitize_list_index(idx)
+                except ValueError as exc:
+                    raise TypeError(
+                        "Index {0} does not match the type of the data "
+                        "array".format(repr(idx))
+                    ) from exc
+            text = self.seek_index(index)
+            if text is not None:
+                return MixinDataRoute.get_data_by_route(self.loads(text), rest)
+        return self.read_value()
+
+
+def load_stream(
+    json_file: Union[str, os.PathLike, IO[str], IO[bytes]],
+    route: Optional[Route] = None,
+    chunk_size: int = 65536,
+    backend: Optional[str] = None,
+) -> Any:
+    """Load the JSON data from a file incrementally.
+
+    The file is read chunk by chunk. If `route` is specified, only the part located
+    by `route` will be decoded, and the other parts of the file (including the
+    siblings of the located part) are skipped without being decoded. The reading
+    stops once the located part is loaded. Therefore, this method is suitable for
+    viewing a small part of a very large file.
+
+    The peak memory is bounded by the chunk size and the size of the loaded value.
+    If the loaded value is an object or an array, its items are decoded one by one,
+    so the whole text of the value is not held in the memory.
+
+    Arguments
+    ---------
+    json_file: `str | os.PathLike | IO[str] | IO[bytes]`
+        If a `str`| os.PathLike` is provided, will open the file specified by this
+        path and load the file content as the data.
+
+        If a file-like object is provided, will load data from this object directly.
+        A binary file will be decoded as UTF-8.
+
+    route: `[str | int | (str,)] | None`
+        The route used for locating the part of the data to be loaded. It has the
+        same format as the `route` of `MixinDataRoute.get_data_by_route`. If not
+        specified, load the whole data.
+
+    chunk_size: `int`
+        The number of characters (or bytes) read from the file each time.
+
+    backend: `str | None`
+        The name of the JSON backend used for decoding the loaded values. If not
+        specified, use the default backend. See `get_backend` for details.
+
+    Returns
+    -------
+    #1: `Any`
+        The data located by `route`. It is the same as
+        `MixinDataRoute.get_data_by_route(json.load(json_file), route)`.
+    """
+    if route is not None and not is_sequence(route):
+        raise TypeError(
+            "The route needs to be a sequence, but get: {0}".format(repr(route))
+        )
+    get_backend(backend)
+    _loads = functools.partial(loads, backend=backend)
+    if isinstance(json_file, (str, os.PathLike)):
+        with open(json_file, "r") as fobj:
+            return _StreamScanner(fobj, chunk_size, _loads).locate(route or ())
+    return _StreamScanner(json_file, chunk_size, _loads).locate(route or ())
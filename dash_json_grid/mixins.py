@@ -16,30 +16,41 @@ component.
 """
 
 import os
+import asyncio
 import inspect
+import functools
 import collections.abc
-import json
 
-from typing import Union, Any, TypeVar, IO
+from typing import TYPE_CHECKING, Union, Optional, Any, TypeVar, IO, ContextManager
 
 try:
-    from typing import Sequence, Callable
+    from typing import Sequence, Iterator, Callable
 except ImportError:
-    from collections.abc import Sequence, Callable
+    from collections.abc import Sequence, Iterator, Callable
 
 from typing_extensions import ParamSpec, TypeGuard
 
+if TYPE_CHECKING:
+    from .search import SearchIndex
+    from .hashing import HashCache
+    from .journal import EditJournal
+
 
 P = ParamSpec("P")
 T = TypeVar("T")
 Route = Sequence[Union[str, int, Sequence[Union[str, int]]]]
 __all__ = (
     "is_sequence",
+    "is_array_like",
     "sanitize_list_index",
     "get_item_of_object",
     "set_item_of_object",
     "pop_item_of_object",
     "Route",
+    "IndexedTable",
+    "CompiledRoute",
+    "compile_route",
+    "walk",
     "MixinDataRoute",
     "MixinFile",
 )
@@ -52,6 +63,22 @@ def is_sequence(val: Any) -> TypeGuard[Sequence[Any]]:
     )
 
 
+def is_array_like(val: Any) -> bool:
+    """Check whether `val` is an array-like object (e.g. `np.ndarray`, `pd.Series`,
+    or `array.array`) but not a `Sequence`.
+
+    An array-like object needs to have a length and the method `tolist()`. The 0-d
+    arrays are not array-like objects.
+    """
+    if is_sequence(val) or isinstance(
+        val, (str, bytes, bytearray, collections.abc.Mapping)
+    ):
+        return False
+    if not (callable(getattr(val, "tolist", None)) and hasattr(val, "__len__")):
+        return False
+    return getattr(val, "ndim", 1) > 0
+
+
 def sanitize_list_index(index: Any) -> int:
     """Try to ensure `index` to be a `int`. If failed, raise `ValueError`."""
     if isinstance(index, int):
@@ -62,6 +89,152 @@ def sanitize_list_index(index: Any) -> int:
         raise ValueError("Unrecognized index value: {0}".format(index))
 
 
+class IndexedTable(list):
+    """A table (a list of rows) with an opt-in columnar index.
+
+    This class is a `list`, so it can be used as a part of the data directly. When
+    a table column is read by a route like `["rows", ["price"]]`, the values of the
+    column are collected only once and cached by the column key. The following
+    reads of the same column do not need to scan the rows any more.
+
+    The cache is invalidated when the table is modified by the `list` methods, or
+    when the table or its rows are modified by the routing methods of
+    `MixinDataRoute`, for example, `update_data_by_route(data, ["rows", 0, "price"],
+    ...)`. If the rows are modified in other ways, call `invalidate()` manually.
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._columns = dict()
+
+    def __reduce__(self) -> Any:
+        return (self.__class__, (list(self),))
+
+    def invalidate(self, key: Any = None) -> None:
+        """Invalidate the cached column index.
+
+        Arguments
+        ---------
+        key: `Any`
+            The key of the column to be invalidated. If not specified, all cached
+            columns will be invalidated.
+        """
+        if key is None:
+            self._columns = dict()
+        else:
+            self._columns.pop(key, None)
+
+    def column_index(self, key: Any) -> Any:
+        """Get the columnar index of a column. If the column is not cached, collect
+        and cache it.
+
+        Arguments
+        ---------
+        key: `Any`
+            The key of the column.
+
+        Returns
+        -------
+        #1: `(int, ...)`
+            The indicies of the rows containing this column.
+
+        #2: `(Any, ...)`
+            The values of this column. Each value corresponds to one index.
+        """
+        col = self._columns.get(key)
+        if col is not None:
+            return col
+        indicies = []
+        values = []
+        for idx, tb_item in enumerate(self):
+            if isinstance(tb_item, collections.abc.Mapping) and key in tb_item:
+                indicies.append(idx)
+                values.append(tb_item[key])
+        col = (tuple(indicies), tuple(values))
+        self._columns[key] = col
+        return col
+
+    def get_column(self, key: Any) -> Any:
+        """Get a column of this table.
+
+        Arguments
+        ---------
+        key: `Any`
+            The key of the column.
+
+        Returns
+        -------
+        #1: `(Any, ...) | {int: Any}`
+            The values of the column. If all rows have this column, return the tuple
+            of values. Otherwise, return an `OrderedDict` mapping the row indicies to
+            the values. The same as the result of `get_data_by_route`.
+        """
+        indicies, values = self.column_index(key)
+        if not indicies:
+            raise KeyError(key)
+        if len(indicies) == len(self):
+            return values
+        return collections.OrderedDict(zip(indicies, values))
+
+    def __setitem__(self, *args: Any) -> None:
+        super().__setitem__(*args)
+        self._columns = dict()
+
+    def __delitem__(self, *args: Any) -> None:
+        super().__delitem__(*args)
+        self._columns = dict()
+
+    def __iadd__(self, *args: Any) -> Any:
+        self._columns = dict()
+        return super().__iadd__(*args)
+
+    def __imul__(self, *args: Any) -> Any:
+        self._columns = dict()
+        return super().__imul__(*args)
+
+    def append(self, *args: Any) -> None:
+        super().append(*args)
+        self._columns = dict()
+
+    def extend(self, *args: Any) -> None:
+        super().extend(*args)
+        self._columns = dict()
+
+    def insert(self, *args: Any) -> None:
+        super().insert(*args)
+        self._columns = dict()
+
+    def pop(self, *args: Any) -> Any:
+        self._columns = dict()
+        return super().pop(*args)
+
+    def remove(self, *args: Any) -> None:
+        super().remove(*args)
+        self._columns = dict()
+
+    def clear(self) -> None:
+        super().clear()
+        self._columns = dict()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._columns = dict()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._columns = dict()
+
+
+def _notify_table_column(table: Any, key: Any) -> None:
+    """Invalidate the column `key` if `table` is an `IndexedTable`. This method is
+    called when the column `key` of `table` may be modified. `key` can be a
+    one-value sequence like the index of `set_item_of_object`."""
+    if isinstance(table, IndexedTable):
+        table.invalidate(key[0] if is_sequence(key) else key)
+
+
 def _get_item_of_table(table: Sequence[Any], index: Union[int, str]) -> Any:
     """Suppose that `table` is potentially to be rendered as a table. Use the index to
     fetch a column or a plain element of it.
@@ -83,6 +256,8 @@ def _get_item_of_table(table: Sequence[Any], index: Union[int, str]) -> Any:
     """
     if isinstance(index, int):
         return table[index]
+    if isinstance(table, IndexedTable):
+        return table.get_column(index)
     n_items = len(table)
     cols = collections.OrderedDict(
         (idx, tb_item[index])
@@ -120,6 +295,9 @@ def get_item_of_object(data: Any, index: Any) -> Any:
     return data
 
 
+_ARRAY_LIKE_CHUNK = 4096
+
+
 class _set_item_of_object:
     """Private class implementation for the method `set_item_of_object`."""
 
@@ -132,35 +310,55 @@ class _set_item_of_object:
             if isinstance(item, collections.abc.MutableMapping):
                 item[index_key] = value
 
+    @staticmethod
+    def _iter_array_like(value: Any) -> Iterator[Any]:
+        """Iterate the items of an array-like object as Python objects.
+
+        If the array-like object can be sliced, the items are converted by
+        `tolist()` chunk by chunk, so the whole array is not materialized as a
+        list. Otherwise, `value.tolist()` is used."""
+        if not hasattr(value, "__getitem__"):
+            yield from value.tolist()
+            return
+        for start in range(0, len(value), _ARRAY_LIKE_CHUNK):
+            yield from value[start : start + _ARRAY_LIKE_CHUNK].tolist()
+
     @staticmethod
     def _broadcast_sequence(data: Sequence[Any], index_key: str, value: Sequence[Any]):
         """Suppose that `data` is formatted like
         `[{"key": val1, ...}, {"key": val2, ...}, ...]`
-        and `value` is a sequence, broadcast `value` items to each mapping-like item
-        of `data`."""
-        _sub_data = tuple(
-            ditem for ditem in data if isinstance(ditem, collections.abc.MutableMapping)
-        )
-        n_data = len(_sub_data)
-        if n_data == len(value):
-            for item, vitem in zip(_sub_data, value):
+        and `value` is a sequence or an array-like object, broadcast `value` items
+        to each mapping-like item of `data`."""
+        n_value = len(value)
+        if is_array_like(value):
+            items = _set_item_of_object._iter_array_like(value)
+        else:
+            items = value
+        rows = [
+            ditem
+            for ditem in data
+            if type(ditem) is dict or isinstance(ditem, collections.abc.MutableMapping)
+        ]
+        n_data = len(rows)
+        if n_data == n_value:
+            for item, vitem in zip(rows, items):
                 item[index_key] = vitem
             return
-        sub_data = tuple(ditem for ditem in _sub_data if index_key in ditem)
-        if len(sub_data) == len(value):
-            for item, vitem in zip(sub_data, value):
+        sub_rows = [ditem for ditem in rows if index_key in ditem]
+        if len(sub_rows) == n_value:
+            for item, vitem in zip(sub_rows, items):
                 item[index_key] = vitem
             return
-        elif n_data > 1 and len(value) == 1:
-            vitem = value[0]
-            for item in _sub_data:
+        elif n_data > 1 and n_value == 1:
+            vitem = next(iter(items))
+            for item in rows:
                 item[index_key] = vitem
             return
         raise IndexError(
             "The current index {0} locates a table column. However, "
             'the provided argument "val" does not match the length of '
             "the valid table rows. len(table_rows)={1} or {2}, len(value)="
-            "{3}.".format(index_key, len(sub_data), n_data, len(value))
+            "{3}.".format(index_key, len(sub_rows), n_data, n_value)
         )
 
     @staticmethod
@@ -169,7 +367,16 @@ class _set_item_of_object:
         `[{"key": val1, ...}, {"key": val2, ...}, ...]`
         where `key` in each item is the same. This method will modify each value of
         these items by broadcasting `value` into `data`.
+
+        If `value` is an array-like object (e.g. `np.ndarray`), it is broadcast like
+        a sequence. Its items are converted to Python objects by `tolist()` of the
+        chunks of `value`.
         """
+        if is_array_like(value):
+            if len(value) == 0:
+                raise ValueError('The provided argument "value" is empty.')
+            _set_item_of_object._broadcast_sequence(data, index_key, value)
+            return
         if not is_sequence(value):
             if (
                 isinstance(value, collections.abc.Mapping)
@@ -198,7 +405,10 @@ class _set_item_of_object:
                     )
                 data[index_key] = value
                 return
-            _set_item_of_object._set_by_broadcast(data, index_key, value)
+            try:
+                _set_item_of_object._set_by_broadcast(data, index_key, value)
+            finally:
+                _notify_table_column(data, index_key)
         elif isinstance(data, collections.abc.MutableMapping):
             data[index_key] = value
         elif isinstance(data, collections.abc.MutableSequence):
@@ -279,6 +489,7 @@ def _pop_item_of_table(table: Sequence[Any], index: Union[int, str]) -> Any:
             )
         return table.pop(index)
     n_items = len(table)
+    _notify_table_column(table, index)
     cols = collections.OrderedDict(
         (idx, tb_item.pop(index))
         for idx, tb_item in enumerate(table)
@@ -324,7 +535,460 @@ def pop_item_of_object(data: Any, index: Any) -> Any:
             )
 
 
+def _get_by_step(data: Any, step: Any) -> Any:
+    """Run `data[index]` by a pre-processed step of `CompiledRoute`."""
+    idx, is_column, key, list_index = step
+    data_type = type(data)
+    if data_type is dict:
+        return data[key]
+    elif data_type is list and list_index is not None:
+        return data[list_index]
+    return get_item_of_object(data, idx)
+
+
+def _set_by_step(data: Any, step: Any, value: Any) -> None:
+    """Run `data[index] = value` by a pre-processed step of `CompiledRoute`."""
+    idx, is_column, key, list_index = step
+    data_type = type(data)
+    if not is_column and data_type is dict:
+        data[key] = value
+    elif not is_column and data_type is list and list_index is not None:
+        data[list_index] = value
+    else:
+        set_item_of_object(data, idx, value)
+
+
+def _pop_by_step(data: Any, step: Any) -> Any:
+    """Run `data.pop(index)` by a pre-processed step of `CompiledRoute`."""
+    idx, is_column, key, list_index = step
+    data_type = type(data)
+    if not is_column and data_type is dict:
+        return data.pop(key)
+    elif not is_column and data_type is list and list_index is not None:
+        return data.pop(list_index)
+    return pop_item_of_object(data, idx)
+
+
+class CompiledRoute:
+    """A route that has been validated and normalized once.
+
+    Each element of the route is pre-processed when the instance is created, for
+    example, list indicies are sanitized and the table-column elements are
+    recognized. Therefore, reusing the same instance for accessing different data
+    only needs to dispatch `dict`/`list` levels by their exact types. Other data
+    types are still handled by the general functions like `get_item_of_object`, so
+    the results are always the same as the `MixinDataRoute` methods.
+
+    Do not initialize this class directly. Use `compile_route(...)` instead.
+    """
+
+    __slots__ = ("_route", "_steps", "_parent_steps", "_last", "_is_noop")
+
+    def __init__(self, route: Route) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        route: `[str | int | (str,)]`
+            The route to be compiled. Its format is the same as the `selected_path`
+            property of the component.
+        """
+        if not is_sequence(route):
+            raise TypeError(
+                "The route needs to be a sequence, but get: {0}".format(repr(route))
+            )
+        elements = tuple(self._sanitize_element(idx) for idx in route)
+        self._route = elements
+        all_steps = tuple(self._make_step(idx) for idx in elements)
+
+        # Steps used by `get`: stop at the first `None`.
+        n_steps = next(
+            (pos for pos, idx in enumerate(elements) if idx is None), len(elements)
+        )
+        self._steps = all_steps[:n_steps]
+
+        # Steps used by `set` and `pop`: the first table column or the last element
+        # is the target, the previous elements are used for locating its parent.
+        n_parent = max(0, len(elements) - 1)
+        is_noop = False
+        for pos, idx in enumerate(elements[:-1]):
+            if idx is None:
+                is_noop = True
+                n_parent = pos
+                break
+            if isinstance(idx, tuple):
+                n_parent = pos
+                break
+        self._parent_steps = all_steps[:n_parent]
+        self._last = all_steps[n_parent] if elements else None
+        self._is_noop = is_noop
+
+    @staticmethod
+    def _sanitize_element(idx: Any) -> Any:
+        """Validate one element of the route, and freeze the table-column element."""
+        if idx is None or isinstance(idx, (str, int)):
+            return idx
+        if is_sequence(idx) and len(idx) > 0 and isinstance(idx[0], (str, int)):
+            return (idx[0],)
+        raise TypeError(
+            "Unrecognized route element: {0}. A route element needs to be a "
+            "str, an int, or a one-element sequence.".format(repr(idx))
+        )
+
+    @staticmethod
+    def _make_step(idx: Any) -> Any:
+        """Make the pre-processed step `(element, is_column, key, list_index)`.
+
+        `list_index` is the `int` used when the data of this level is a `list`. It
+        is `None` if `idx` can not be used for indexing a list directly.
+        """
+        if idx is None:
+            return (idx, False, idx, None)
+        if isinstance(idx, tuple):
+            key = idx[0]
+            return (idx, True, key, key if isinstance(key, int) else None)
+        try:
+            list_index = sanitize_list_index(idx)
+        except ValueError:
+            list_index = None
+        return (idx, False, idx, list_index)
+
+    @property
+    def route(self) -> Route:
+        """The normalized route. The table-column elements are converted to
+        one-element tuples."""
+        return self._route
+
+    def __repr__(self) -> str:
+        return "{0}({1})".format(self.__class__.__name__, repr(list(self._route)))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompiledRoute):
+            return NotImplemented
+        return self._route == other.route
+
+    def __hash__(self) -> int:
+        return hash(self._route)
+
+    def __len__(self) -> int:
+        return len(self._route)
+
+    @staticmethod
+    def _locate(data: Any, steps: Sequence[Any]) -> Any:
+        """Go through the pre-processed `steps` and return the located data."""
+        cur_data = data
+        for step in steps:
+            cur_data = _get_by_step(cur_data, step)
+        return cur_data
+
+    def get(self, data: Any) -> Any:
+        """Get the small part of the data located by this route.
+
+        The same as `MixinDataRoute.get_data_by_route(data, route)`.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be routed.
+
+        Returns
+        -------
+        #1: `Any`
+            The value located by this route.
+        """
+        if not isinstance(data, (collections.abc.Sequence, collections.abc.Mapping)):
+            return data
+        return self._locate(data, self._steps)
+
+    def set(self, data: Any, val: Any) -> Any:
+        """Update a specific part of `data` located by this route.
+
+        The same as `MixinDataRoute.update_data_by_route(data, route, val)`.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be updated.
+
+        val: `Any`
+            The value used for updating the located part of the given data.
+
+        Returns
+        -------
+        #1: `Any`
+            The modified `data`.
+        """
+        if self._last is None:
+            return data
+        if not isinstance(data, (collections.abc.Sequence, collections.abc.Mapping)):
+            return data
+        if self._is_noop:
+            return None
+        prev_data, cur_data = None, data
+        for step in self._parent_steps:
+            prev_data, cur_data = cur_data, _get_by_step(cur_data, step)
+        _set_by_step(cur_data, self._last, val)
+        _notify_table_column(prev_data, self._last[0])
+        return data
+
+    def pop(self, data: Any) -> Any:
+        """Delete the data part located by this route.
+
+        The same as `MixinDataRoute.delete_data_by_route(data, route)`.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be modified, where the located part will be
+            deleted.
+
+        Returns
+        -------
+        #1: `Any`
+            The data that is deleted and poped out.
+        """
+        if not isinstance(data, (collections.abc.Sequence, collections.abc.Mapping)):
+            raise KeyError(
+                "Fail to locate the data, because the given data is immutable."
+            )
+        if self._last is None:
+            raise IndexError("Fail to delete the data by an empty route.")
+        if self._is_noop:
+            return None
+        prev_data, cur_data = None, data
+        for step in self._parent_steps:
+            prev_data, cur_data = cur_data, _get_by_step(cur_data, step)
+        val = _pop_by_step(cur_data, self._last)
+        _notify_table_column(prev_data, self._last[0])
+        return val
+
+
+def compile_route(route: Union[Route, CompiledRoute]) -> CompiledRoute:
+    """Validate and normalize a route once, and get a reusable accessor.
+
+    Arguments
+    ---------
+    route: `[str | int | (str,)] | CompiledRoute`
+        The route to be compiled. If it has been compiled, return it directly.
+
+    Returns
+    -------
+    #1: `CompiledRoute`
+        The compiled route providing the methods `get`, `set`, and `pop`.
+    """
+    if isinstance(route, CompiledRoute):
+        return route
+    return CompiledRoute(route)
+
+
+_WALK_END = object()
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _iter_children(data: Any) -> Optional[Iterator[Any]]:
+    """Get the iterator of `(key, child)` pairs of a container. If `data` is not a
+    container, return `None`."""
+    data_type = type(data)
+    if data_type is dict:
+        return iter(data.items())
+    if data_type is list:
+        return enumerate(data)
+    if data_type in _SCALAR_TYPES:
+        return None
+    if isinstance(data, collections.abc.Mapping):
+        return iter(data.items())
+    if is_sequence(data):
+        return enumerate(data)
+    return None
+
+
+def walk(
+    data: Any,
+    *,
+    max_depth: Optional[int] = None,
+    prune: Optional[Callable[[Sequence[Any], Any], bool]] = None,
+    share_route: bool = False,
+) -> Iterator[Any]:
+    """Traverse the data in the pre-order without recursion.
+
+    The traversal uses an explicit stack, so the data deeper than the recursion
+    limit can be traversed. Only one iterator is allocated for each container.
+
+    Arguments
+    ---------
+    data: `Any`
+        The whole data object to be traversed.
+
+    max_depth: `int | None`
+        If specified, the nodes deeper than `max_depth` are not visited. The depth
+        of `data` itself is `0`.
+
+    prune: `((route, value) -> bool) | None`
+        A function called for each visited container. If it returns `True`, the
+        children of the container are not visited. The `route` passed to it is
+        only valid during the call.
+
+    share_route: `bool`
+        If `True`, the yielded `route` is a list shared by all iterations and
+        modified in place, which avoids copying the route for each node.
+        Warning: in this case, the route is only valid before the next iteration,
+        and should not be modified or kept. Use `list(route)` if it needs to be
+        kept.
+
+    Returns
+    -------
+    #1: `Iterator[([str | int], Any)]`
+        A generator yielding `(route, value)` of each node, where the first node is
+        `([], data)`. By default, each `route` is a new list.
+    """
+    route = []
+    yield (route if share_route else []), data
+    if (max_depth is not None and max_depth <= 0) or (
+        prune is not None and _iter_children(data) is not None and prune(route, data)
+    ):
+        return
+    children = _iter_children(data)
+    if children is None:
+        return
+    stack = [children]
+    while stack:
+        item = next(stack[-1], _WALK_END)
+        if item is _WALK_END:
+            stack.pop()
+            if route:
+                route.pop()
+            continue
+        key, value = item
+        route.append(key)
+        yield (route if share_route else list(route)), value
+        children = _iter_children(value)
+        if (
+            children is None
+            or (max_depth is not None and len(route) >= max_depth)
+            or (prune is not None and prune(route, value))
+        ):
+            route.pop()
+            continue
+        stack.append(children)
+
+
+class _RouteTrie:
+    """Private class implementation for the batch operations of `MixinDataRoute`.
+
+    The routes are grouped by their shared prefixes. Each node of the trie is
+    visited only once, so the shared prefix will not be located repeatedly.
+    """
+
+    __slots__ = ("step", "children", "targets")
+
+    def __init__(self, step: Any = None) -> None:
+        self.step = step
+        self.children = dict()
+        self.targets = list()
+
+    @classmethod
+    def build(cls, items: Sequence[Any]) -> "_RouteTrie":
+        """Build the trie by `items`, each item is `(steps, target)`. The `target`
+        will be recorded in the node located by `steps`."""
+        root = cls()
+        for steps, target in items:
+            node = root
+            for step in steps:
+                idx = step[0]
+                child = node.children.get(idx)
+                if child is None:
+                    child = cls(step)
+                    node.children[idx] = child
+                node = child
+            node.targets.append(target)
+        return root
+
+    def walk_pre_order(self, data: Any) -> Any:
+        """Iterate `(node, located_data, parent_data)` from the root to the leaves.
+        The data of the children are located after the parent node is yielded."""
+        stack = [(self, data, None)]
+        while stack:
+            node, cur_data, prev_data = stack.pop()
+            yield node, cur_data, prev_data
+            for child in reversed(tuple(node.children.values())):
+                stack.append((child, _get_by_step(cur_data, child.step), cur_data))
+
+    def walk_post_order(self, data: Any) -> Any:
+        """Iterate `(node, located_data, parent_data)` where the children are always
+        yielded before the parent node. All nodes are located before any of them is
+        yielded."""
+        stack = [(self, data, None)]
+        visited = []
+        while stack:
+            node, cur_data, prev_data = stack.pop()
+            visited.append((node, cur_data, prev_data))
+            for child in node.children.values():
+                stack.append((child, _get_by_step(cur_data, child.step), cur_data))
+        return reversed(visited)
+
+    @staticmethod
+    def pop_order(data: Any, targets: Sequence[Any]) -> Any:
+        """Sort the `(step, position)` targets to be popped from the same `data`.
+
+        If `data` is a list, the removal of the list items is performed in the
+        descending order of indicies, so the indicies will not be invalidated by
+        the previous removals. Table columns are removed before the list items.
+        The targets located at the same place are grouped together.
+
+        Returns
+        -------
+        #1: `[(step, [int])]`
+            The steps to be popped and the positions of the results sharing the step.
+        """
+        groups = collections.OrderedDict()
+        is_list = isinstance(data, collections.abc.MutableSequence)
+        n_data = len(data) if is_list else 0
+        for step, pos in targets:
+            idx, is_column, key, list_index = step
+            if is_list and list_index is not None:
+                group_key = (1, list_index + n_data if list_index < 0 else list_index)
+            else:
+                group_key = (0, key)
+            group = groups.get(group_key)
+            if group is None:
+                groups[group_key] = (step, [pos])
+            else:
+                group[1].append(pos)
+        if not is_list:
+            return groups.values()
+        return (
+            groups[group_key]
+            for group_key in sorted(
+                groups.keys(), key=lambda val: (val[0], -val[1] if val[0] else 0)
+            )
+        )
+
+
 class MixinDataRoute:
+    @staticmethod
+    def compile_route(route: Union[Route, CompiledRoute]) -> CompiledRoute:
+        """Validate and normalize a route once, and get a reusable accessor.
+
+        Compiling a route is useful when the same route needs to be used for many
+        times, for example, when the same `selected_path` is used for accessing the
+        data in different callbacks. The compiled route can be passed to
+        `get_data_by_route`, `update_data_by_route`, and `delete_data_by_route`,
+        too.
+
+        Arguments
+        ---------
+        route: `[str | int | (str,)] | CompiledRoute`
+            The route provided by the `selected_path` callback. If it has been
+            compiled, return it directly.
+
+        Returns
+        -------
+        #1: `CompiledRoute`
+            The compiled route providing the methods `get(data)`, `set(data, val)`,
+            and `pop(data)`.
+        """
+        return compile_route(route)
+
     @staticmethod
     def compare_routes(route_1: Route, route_2: Route) -> bool:
         """Compare two different routes.
@@ -356,7 +1020,7 @@ class MixinDataRoute:
         return all((val1 == val2 for val1, val2 in zip(route_1, route_2)))
 
     @staticmethod
-    def get_data_by_route(data: Any, route: Route) -> Any:
+    def get_data_by_route(data: Any, route: Union[Route, CompiledRoute]) -> Any:
         """Get the small part of the data by a specific route.
 
         Arguments
@@ -364,7 +1028,7 @@ class MixinDataRoute:
         data: `Any`
             The whole data object to be routed.
 
-        route: `[str | int | (str,)]`
+        route: `[str | int | (str,)] | CompiledRoute`
             A sequence of indicies used for locating the specific value in `data`. If
             the last element of this `route` locates a table column, will locate each
             value of the column as a sequence.
@@ -374,6 +1038,8 @@ class MixinDataRoute:
         #1: `Any`
             The value located by `route`.
         """
+        if isinstance(route, CompiledRoute):
+            return route.get(data)
         cur_data: Any = data
         if not isinstance(
             cur_data, (collections.abc.Sequence, collections.abc.Mapping)
@@ -386,7 +1052,9 @@ class MixinDataRoute:
         return cur_data
 
     @staticmethod
-    def update_data_by_route(data: Any, route: Route, val: Any) -> Any:
+    def update_data_by_route(
+        data: Any, route: Union[Route, CompiledRoute], val: Any
+    ) -> Any:
         """Update a specific part of `data` by a route.
 
         If the update fails (for example, maybe the data is immutable), raise a
@@ -397,7 +1065,7 @@ class MixinDataRoute:
         data: `Any`
             The whole data object to be updated.
 
-        route: `[str | int | (str,)]`
+        route: `[str | int | (str,)] | CompiledRoute`
             A sequence of indicies used for locating the specific value in `data`. If
             the last element of this `route` locates a table column, will apply the
             update to each value of the column.
@@ -413,11 +1081,14 @@ class MixinDataRoute:
             The modified `data`. Since `data` is mutable, even if this returned value
             is not used, the modification will still take effect.
         """
+        if isinstance(route, CompiledRoute):
+            return route.set(data, val)
         if not route:
             return data
         if not isinstance(data, (collections.abc.Sequence, collections.abc.Mapping)):
             return data
         cur_data = data
+        prev_data = None
         idx_last = route[-1]
         for idx in route[:-1]:
             if idx is None:
@@ -425,12 +1096,14 @@ class MixinDataRoute:
             if is_sequence(idx):
                 idx_last = idx
                 break
+            prev_data = cur_data
             cur_data = get_item_of_object(cur_data, idx)
         set_item_of_object(cur_data, idx_last, val)
+        _notify_table_column(prev_data, idx_last)
         return data
 
     @staticmethod
-    def delete_data_by_route(data: Any, route: Route) -> Any:
+    def delete_data_by_route(data: Any, route: Union[Route, CompiledRoute]) -> Any:
         """Delete the data part specified by a route.
 
         If the deletion fails (for example, maybe the data is immutable), raise a
@@ -442,7 +1115,7 @@ class MixinDataRoute:
             The whole data object to be modified, where the located part will be
             deleted.
 
-        route: `[str | int | (str,)]`
+        route: `[str | int | (str,)] | CompiledRoute`
             A sequence of indicies used for locating the specific value in `data`. If
             the last element of this `route` locates a table column, will pop out the
             each value of the column.
@@ -452,6 +1125,8 @@ class MixinDataRoute:
         #1: `Any`
             The data that is deleted and poped out.
         """
+        if isinstance(route, CompiledRoute):
+            return route.pop(data)
         cur_data = data
         if not isinstance(
             cur_data, (collections.abc.Sequence, collections.abc.Mapping)
@@ -459,6 +1134,7 @@ class MixinDataRoute:
             raise KeyError(
                 "Fail to locate the data, because the given data is immutable."
             )
+        prev_data = None
         idx_last = route[-1]
         for idx in route[:-1]:
             if idx is None:
@@ -466,14 +1142,494 @@ class MixinDataRoute:
             if is_sequence(idx):
                 idx_last = idx
                 break
+            prev_data = cur_data
             cur_data = get_item_of_object(cur_data, idx)
-        return pop_item_of_object(cur_data, idx_last)
+        val = pop_item_of_object(cur_data, idx_last)
+        _notify_table_column(prev_data, idx_last)
+        return val
+
+    @staticmethod
+    def index_tables(data: Any, min_rows: int = 100) -> Any:
+        """Enable the columnar index for the tables in the data.
+
+        A table is a `list` where all items are mappings. Each table with at least
+        `min_rows` rows will be replaced by an `IndexedTable` in place. After that,
+        the repeated reading of the same table column by `get_data_by_route` will
+        not need to scan the rows.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object where the tables will be indexed.
+
+        min_rows: `int`
+            The tables with fewer rows than this value will not be indexed.
+
+        Returns
+        -------
+        #1: `Any`
+            The modified `data`. If `data` itself is a table, return the new
+            `IndexedTable` that replaces `data`.
+        """
+
+        def is_table(val: Any) -> bool:
+            return (
+                isinstance(val, list)
+                and (not isinstance(val, IndexedTable))
+                and len(val) >= max(1, min_rows)
+                and all(isinstance(row, collections.abc.Mapping) for row in val)
+            )
+
+        if is_table(data):
+            data = IndexedTable(data)
+        stack = [data]
+        while stack:
+            cur_data = stack.pop()
+            if isinstance(cur_data, collections.abc.Mapping):
+                items = cur_data.items()
+                is_mutable = isinstance(cur_data, collections.abc.MutableMapping)
+            elif is_sequence(cur_data):
+                items = enumerate(cur_data)
+                is_mutable = isinstance(cur_data, collections.abc.MutableSequence)
+            else:
+                continue
+            for key, val in items:
+                if is_mutable and is_table(val):
+                    val = IndexedTable(val)
+                    cur_data[key] = val
+                if isinstance(val, collections.abc.Mapping) or is_sequence(val):
+                    stack.append(val)
+        return data
+
+    @staticmethod
+    def walk(
+        data: Any,
+        *,
+        max_depth: Optional[int] = None,
+        prune: Optional[Callable[[Sequence[Any], Any], bool]] = None,
+        share_route: bool = False,
+    ) -> Iterator[Any]:
+        """Traverse the data in the pre-order without recursion.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be traversed.
+
+        max_depth: `int | None`
+            If specified, the nodes deeper than `max_depth` are not visited.
+
+        prune: `((route, value) -> bool) | None`
+            A function called for each visited container. If it returns `True`, the
+            children of the container are not visited.
+
+        share_route: `bool`
+            If `True`, the yielded `route` is shared by all iterations and only
+            valid before the next iteration. See `dash_json_grid.mixins.walk` for
+            details.
+
+        Returns
+        -------
+        #1: `Iterator[([str | int], Any)]`
+            A generator yielding `(route, value)` of each node.
+        """
+        return walk(data, max_depth=max_depth, prune=prune, share_route=share_route)
+
+    @staticmethod
+    def search(
+        data: Any,
+        query: str,
+        *,
+        keys: bool = True,
+        values: bool = True,
+        regex: bool = False,
+        limit: Optional[int] = None,
+        index: Optional["SearchIndex"] = None,
+    ) -> Iterator[list]:
+        """Search the data, and yield the routes of the matched nodes.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be searched.
+
+        query: `str`
+            The searched text. If `regex` is `False`, a node matches the query when
+            its text contains the query (case-insensitive).
+
+        keys: `bool`
+            Whether to match the keys of the mappings.
+
+        values: `bool`
+            Whether to match the values that are not containers.
+
+        regex: `bool`
+            If `True`, `query` is a regular expression searched in the texts.
+
+        limit: `int | None`
+            The maximal number of the yielded routes.
+
+        index: `SearchIndex | None`
+            The index prebuilt by `build_search_index(data)`. It makes the repeated
+            queries on the same data faster.
+
+        Returns
+        -------
+        #1: `Iterator[[str | int]]`
+            A generator yielding the route of each matched node. The routes have
+            the same format as the property `selected_path`.
+        """
+        from .search import search
+
+        return search(
+            data,
+            query,
+            keys=keys,
+            values=values,
+            regex=regex,
+            limit=limit,
+            index=index,
+        )
+
+    @staticmethod
+    def build_search_index(data: Any) -> "SearchIndex":
+        """Build the inverted index used by `search`.
+
+        The index needs to be rebuilt if the data is modified.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be indexed.
+
+        Returns
+        -------
+        #1: `SearchIndex`
+            The index that can be passed to `search(data, ..., index=index)`.
+        """
+        from .search import SearchIndex
+
+        return SearchIndex(data)
+
+    @staticmethod
+    def build_hash_cache(data: Any) -> "HashCache":
+        """Build the cache of the content hashes of the data.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be hashed.
+
+        Returns
+        -------
+        #1: `HashCache`
+            The cache providing the digest of each part of the data. Modify the
+            data by the methods of the cache, so the digests are kept up to date.
+            See `dash_json_grid.hashing` for details.
+        """
+        from .hashing import HashCache
+
+        return HashCache(data)
+
+    @staticmethod
+    def transaction(data: Any) -> ContextManager["EditJournal"]:
+        """Modify the data by a transaction.
+
+        ``` python
+        with DashJsonGrid.transaction(data) as txn:
+            txn.update_data_by_route(["topping", ["type"]], "None")
+            txn.delete_data_by_route(["batters"])
+        ```
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be modified.
+
+        Returns
+        -------
+        #1: `ContextManager[EditJournal]`
+            The context yielding the journal used for modifying the data. If an
+            error is raised in the context, the modifications made by the journal
+            are reverted without copying the data. See `dash_json_grid.journal`
+            for details.
+        """
+        from .journal import transaction
+
+        return transaction(data)
+
+    @staticmethod
+    def diff(old: Any, new: Any) -> list:
+        """Make the patch changing the old data to the new data.
+
+        Arguments
+        ---------
+        old: `Any`
+            The old version of the data.
+
+        new: `Any`
+            The new version of the data.
+
+        Returns
+        -------
+        #1: `[{"op": str, "path": [str | int | [str]], "value": Any}]`
+            The patch where each path is a route of `update_data_by_route`. It can
+            be applied by `dash_json_grid.patch.apply_data_patch`, or be sent to the
+            property `data_patch` or `diff_highlight`. See
+            `dash_json_grid.diff.diff` for details.
+        """
+        from .diff import diff
+
+        return diff(old, new)
+
+    @staticmethod
+    def encode_tables(data: Any, min_rows: int = 100) -> Any:
+        """Encode the tables in the data by the columnar format.
+
+        The column names of each table are kept only once, so the encoded data is
+        smaller and faster to be serialized. It can be passed to the property
+        `data` directly, and the tables are expanded in the browser.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be encoded. It is not modified.
+
+        min_rows: `int`
+            The tables with fewer rows than this value will not be encoded.
+
+        Returns
+        -------
+        #1: `Any`
+            The encoded data. See `dash_json_grid.columnar` for details.
+        """
+        from .columnar import encode_tables
+
+        return encode_tables(data, min_rows=min_rows)
+
+    @staticmethod
+    def decode_tables(data: Any) -> Any:
+        """Decode the tables encoded by `encode_tables`.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object with the encoded tables, e.g. the property `data`
+            received by a callback. It is not modified.
+
+        Returns
+        -------
+        #1: `Any`
+            The decoded data, where each encoded table is converted back to a list
+            of `dict`.
+        """
+        from .columnar import decode_tables
+
+        return decode_tables(data)
+
+    @staticmethod
+    def get_many(data: Any, routes: Sequence[Union[Route, CompiledRoute]]) -> list:
+        """Get several parts of the data by a sequence of routes.
+
+        The routes are grouped by their shared prefixes, and each shared prefix is
+        located only once. Therefore, the cost is proportional to the number of the
+        distinct nodes touched by the routes.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be routed.
+
+        routes: `[[str | int | (str,)] | CompiledRoute]`
+            A sequence of routes. Each route is used like `get_data_by_route`.
+
+        Returns
+        -------
+        #1: `[Any]`
+            The values located by `routes`. The order is the same as `routes`.
+        """
+        compiled = tuple(compile_route(route) for route in routes)
+        if not isinstance(data, (collections.abc.Sequence, collections.abc.Mapping)):
+            return [data for _ in compiled]
+        results = [None] * len(compiled)
+        trie = _RouteTrie.build(
+            (route._steps, pos) for pos, route in enumerate(compiled)
+        )
+        for node, cur_data, _ in trie.walk_pre_order(data):
+            for pos in node.targets:
+                results[pos] = cur_data
+        return results
+
+    @staticmethod
+    def update_many(
+        data: Any, updates: Sequence[Sequence[Union[Route, CompiledRoute, Any]]]
+    ) -> Any:
+        """Update several parts of `data` by a sequence of `(route, val)` pairs.
+
+        The routes are grouped by their shared prefixes, and each shared prefix is
+        located only once. The update of a route is always applied before the
+        updates of its descendant routes, in other words, a descendant route will
+        modify the newly updated value. The updates of the same route are applied
+        in the given order.
+
+        A table column like `["t", ["q"]]` overlaps the cells like `["t", 1, "q"]`.
+        If a cell update is given before an update of its column, it is applied
+        right before the column update, so the later one wins as if the updates
+        were applied one by one.
+
+        If any update fails, raise the same error as `update_data_by_route`. The
+        updates that have been applied will not be reverted.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be updated.
+
+        updates: `[([str | int | (str,)] | CompiledRoute, Any)]`
+            A sequence of `(route, val)` pairs. Each pair is used like the
+            arguments of `update_data_by_route`.
+
+        Returns
+        -------
+        #1: `Any`
+            The modified `data`. Since `data` is mutable, even if this returned value
+            is not used, the modification will still take effect.
+        """
+        compiled = []
+        # The position of the last update of each table column.
+        columns = dict()
+        for route, val in updates:
+            route = compile_route(route)
+            if route._last is None or route._is_noop:
+                continue
+            last = route._last
+            if last[1] and isinstance(last[2], str):
+                table = tuple(step[0] for step in route._parent_steps)
+                columns[(table, last[2])] = len(compiled)
+            compiled.append((route._parent_steps, last, val))
+        if not compiled:
+            return data
+        if not isinstance(data, (collections.abc.Sequence, collections.abc.Mapping)):
+            return data
+        items = []
+        for pos, (steps, last, val) in enumerate(compiled):
+            if columns and steps and not last[1]:
+                table = tuple(step[0] for step in steps[:-1])
+                if columns.get((table, last[2]), -1) > pos:
+                    # Move the cell update to the table, before the column update.
+                    items.append((steps[:-1], (last, val, steps[-1])))
+                    continue
+            items.append((steps, (last, val, None)))
+        for node, cur_data, prev_data in _RouteTrie.build(items).walk_pre_order(data):
+            for step, val, row_step in node.targets:
+                if row_step is None:
+                    _set_by_step(cur_data, step, val)
+                    _notify_table_column(prev_data, step[0])
+                else:
+                    _set_by_step(_get_by_step(cur_data, row_step), step, val)
+                    _notify_table_column(cur_data, step[0])
+        return data
+
+    @staticmethod
+    def delete_many(data: Any, routes: Sequence[Union[Route, CompiledRoute]]) -> list:
+        """Delete several parts of `data` by a sequence of routes.
+
+        All routes are located in the data before the deletion, in other words,
+        each route refers to the original `data`. The routes are grouped by their
+        shared prefixes, and each shared prefix is located only once. The items of
+        the same list are deleted in the descending order of the indicies, so the
+        indicies will not be invalidated during the deletion. If several routes
+        locate the same item, the item is deleted only once.
+
+        If any deletion fails, raise the same error as `delete_data_by_route`. The
+        deletions that have been applied will not be reverted.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be modified, where the located parts will be
+            deleted.
+
+        routes: `[[str | int | (str,)] | CompiledRoute]`
+            A sequence of routes. Each route is used like `delete_data_by_route`.
+
+        Returns
+        -------
+        #1: `[Any]`
+            The data that are deleted and poped out. The order is the same as
+            `routes`.
+        """
+        if not isinstance(data, (collections.abc.Sequence, collections.abc.Mapping)):
+            raise KeyError(
+                "Fail to locate the data, because the given data is immutable."
+            )
+        compiled = tuple(compile_route(route) for route in routes)
+        results = [None] * len(compiled)
+        items = []
+        for pos, route in enumerate(compiled):
+            if route._last is None:
+                raise IndexError("Fail to delete the data by an empty route.")
+            if route._is_noop:
+                continue
+            items.append((route._parent_steps, (route._last, pos)))
+        for node, cur_data, prev_data in _RouteTrie.build(items).walk_post_order(data):
+            for step, positions in _RouteTrie.pop_order(cur_data, node.targets):
+                val = _pop_by_step(cur_data, step)
+                _notify_table_column(prev_data, step[0])
+                for pos in positions:
+                    results[pos] = val
+        return results
+
+
+def _check_data_delegated(
+    cls: Callable, method: str, delegate: str, args: Sequence[Any], kwargs: Any
+) -> None:
+    """Raise `TypeError` if the argument `data` is specified when `data` is
+    delegated to another argument of `method`."""
+    all_args = inspect.signature(cls).bind(*args, **kwargs).arguments.keys()
+    if "data" in all_args:
+        raise TypeError(
+            'When using "{0}", it is not allowed to specify the argument "data" '
+            'because "data" is delegated to the argument "{1}".'.format(
+                method, delegate
+            )
+        )
+
+
+def _pop_str_loader(json_string: Union[str, bytes], kwargs: Any) -> Callable[[], Any]:
+    """Pop the extra arguments of `MixinFile.from_str` from `kwargs`, and return
+    the picklable function loading the data."""
+    from .loaders import loads
+
+    return functools.partial(loads, json_string, backend=kwargs.pop("backend", None))
+
+
+def _pop_file_loader(
+    json_file: Union[str, os.PathLike, IO[str], IO[bytes]], kwargs: Any
+) -> Callable[[], Any]:
+    """Pop the extra arguments of `MixinFile.from_file` from `kwargs`, and return
+    the picklable function loading the data."""
+    from .loaders import load_file, load_stream
+
+    stream = kwargs.pop("stream", False)
+    route = kwargs.pop("route", None)
+    chunk_size = kwargs.pop("chunk_size", 65536)
+    backend = kwargs.pop("backend", None)
+    use_mmap = kwargs.pop("use_mmap", False)
+    if stream or route is not None:
+        return functools.partial(
+            load_stream, json_file, route=route, chunk_size=chunk_size, backend=backend
+        )
+    return functools.partial(load_file, json_file, backend=backend, use_mmap=use_mmap)
 
 
 class MixinFile:
     @classmethod
     def from_str(
-        cls: Callable[P, T], json_string: str, *args: P.args, **kwargs: P.kwargs
+        cls: Callable[P, T],
+        json_string: Union[str, bytes],
+        *args: P.args,
+        **kwargs: P.kwargs,
     ) -> T:
         """Use a JSON string to initialize the component.
 
@@ -482,8 +1638,13 @@ class MixinFile:
 
         Extra Arguments
         ---------------
-        json_string: `str`
-            A string where JSON data is encoded.
+        json_string: `str | bytes`
+            A string where JSON data is encoded. It can be the UTF-8 encoded bytes.
+
+        backend: `str | None`
+            A keyword-only argument. The name of the JSON backend used for decoding
+            the data, like `"orjson"` or `"json"`. If not specified, use the default
+            backend configured by `loaders.set_default_backend`.
 
         Other Arugments
         ---------------
@@ -494,20 +1655,15 @@ class MixinFile:
         The component initialized by `json_string`, where the other details of the
         component is the same as the initialization.
         """
-        all_args = inspect.signature(cls).bind(*args, **kwargs).arguments.keys()
-        if "data" in all_args:
-            raise TypeError(
-                'When using "from_str", it is not allowed to specify the argument '
-                '"data" because "data" is delegated to the argument "json_string".'
-            )
-        data = json.loads(json_string)
-        kwargs["data"] = data
+        load = _pop_str_loader(json_string, kwargs)
+        _check_data_delegated(cls, "from_str", "json_string", args, kwargs)
+        kwargs["data"] = load()
         return cls(*args, **kwargs)
 
     @classmethod
     def from_file(
         cls: Callable[P, T],
-        json_file: Union[str, os.PathLike, IO[str]],
+        json_file: Union[str, os.PathLike, IO[str], IO[bytes]],
         *args: P.args,
         **kwargs: P.kwargs,
     ) -> T:
@@ -518,13 +1674,40 @@ class MixinFile:
 
         Extra Arguments
         ---------------
-        json_file: `str | os.PathLike | IO[str]`
+        json_file: `str | os.PathLike | IO[str] | IO[bytes]`
             If a `str`| os.PathLike` is provided, will open the file specified by this
             path and load the file content as the data.
 
-            If an `IO[str]` is provided, wil load data from this file-like object
+            If a file-like object is provided, wil load data from this object
             directly.
 
+        stream: `bool`
+            A keyword-only argument. If specified, will load the file incrementally
+            by `loaders.load_stream`. The file is read chunk by chunk, and the peak
+            memory is bounded by the chunk size and the size of the loaded data.
+            Default is `False`.
+
+        route: `[str | int | (str,)] | None`
+            A keyword-only argument. If specified, only load the part of the data
+            located by this route. The other parts of the file are skipped without
+            being decoded. Specifying this argument implies `stream=True`.
+
+        chunk_size: `int`
+            A keyword-only argument. The number of characters (or bytes) read from
+            the file each time in the streaming mode. Default is `65536`.
+
+        backend: `str | None`
+            A keyword-only argument. The name of the JSON backend used for decoding
+            the data, like `"orjson"` or `"json"`. If not specified, use the default
+            backend configured by `loaders.set_default_backend`.
+
+        use_mmap: `bool`
+            A keyword-only argument. If specified, the file specified by the path
+            will be memory-mapped and passed to the backend directly, which avoids
+            copying the file content. It works best with the backends parsing
+            buffers, like `"orjson"`. This option is not used in the streaming mode.
+            Default is `False`.
+
         Other Arugments
         ---------------
         The same as the initialization.
@@ -534,16 +1717,88 @@ class MixinFile:
         The component initialized by `json_file`, where the other details of the
         component is the same as the initialization.
         """
-        all_args = inspect.signature(cls).bind(*args, **kwargs).arguments.keys()
-        if "data" in all_args:
-            raise TypeError(
-                'When using "from_file", it is not allowed to specify the argument '
-                '"data" because "data" is delegated to the argument "json_file".'
-            )
-        if isinstance(json_file, (str, os.PathLike)):
-            with open(json_file, "r") as fobj:
-                data = json.load(fobj)
-        else:
-            data = json.load(json_file)
-        kwargs["data"] = data
+        load = _pop_file_loader(json_file, kwargs)
+        _check_data_delegated(cls, "from_file", "json_file", args, kwargs)
+        kwargs["data"] = load()
+        return cls(*args, **kwargs)
+
+    @classmethod
+    async def from_str_async(
+        cls: Callable[P, T],
+        json_string: Union[str, bytes],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Use a JSON string to initialize the component asynchronously.
+
+        The async version of `from_str`. The data is decoded in an executor, so the
+        event loop is not blocked by decoding the data. The component is
+        initialized in the event loop after the data is decoded.
+
+        Extra Arguments
+        ---------------
+        executor: `concurrent.futures.Executor | None`
+            A keyword-only argument. The executor where the data is decoded. If a
+            `ProcessPoolExecutor` is used, the global configurations of
+            `loaders` (like `set_default_backend`) do not take effect in the worker
+            processes. If not specified, use the default executor of the event
+            loop.
+
+        The other extra arguments are the same as `from_str`.
+
+        Other Arugments
+        ---------------
+        The same as the initialization.
+
+        Returns
+        -------
+        The component initialized by `json_string`, where the other details of the
+        component is the same as the initialization.
+        """
+        executor = kwargs.pop("executor", None)
+        load = _pop_str_loader(json_string, kwargs)
+        _check_data_delegated(cls, "from_str_async", "json_string", args, kwargs)
+        loop = asyncio.get_running_loop()
+        kwargs["data"] = await loop.run_in_executor(executor, load)
+        return cls(*args, **kwargs)
+
+    @classmethod
+    async def from_file_async(
+        cls: Callable[P, T],
+        json_file: Union[str, os.PathLike, IO[str], IO[bytes]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Use a JSON file to initialize the component asynchronously.
+
+        The async version of `from_file`. Both reading and decoding the file are
+        done in an executor, so the event loop is not blocked. The component is
+        initialized in the event loop after the data is loaded.
+
+        Extra Arguments
+        ---------------
+        executor: `concurrent.futures.Executor | None`
+            A keyword-only argument. The executor where the file is loaded. If a
+            `ProcessPoolExecutor` is used, `json_file` needs to be a path because
+            file-like objects cannot be sent to the worker processes. The global
+            configurations of `loaders` (like `set_default_backend`) do not take
+            effect in the worker processes, either. If not specified, use the
+            default executor of the event loop.
+
+        The other extra arguments are the same as `from_file`.
+
+        Other Arugments
+        ---------------
+        The same as the initialization.
+
+        Returns
+        -------
+        The component initialized by `json_file`, where the other details of the
+        component is the same as the initialization.
+        """
+        executor = kwargs.pop("executor", None)
+        load = _pop_file_loader(json_file, kwargs)
+        _check_data_delegated(cls, "from_file_async", "json_file", args, kwargs)
+        loop = asyncio.get_running_loop()
+        kwargs["data"] = await loop.run_in_executor(executor, load)
         return cls(*args, **kwargs)
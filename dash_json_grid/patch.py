@@ -0,0 +1,298 @@
+# -*- coding: UTF-8 -*-
+"""
+Patch
+=====
+@Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The partial updates of the data. A patch is a list of operations like
+``` python
+[
+    {"op": "replace", "path": ["batters", "batter", 0, "type"], "value": "Plain"},
+    {"op": "remove", "path": ["topping", 2]},
+    {"op": "add", "path": ["topping", 0], "value": {"id": "5008", "type": "Ice"}},
+]
+```
+The patch can be sent to the property `data_patch` of the component. Then, the
+component will apply the patch to its `data` in the browser, so the callbacks do not
+need to send the whole `data` back.
+"""
+
+import copy
+import collections.abc
+
+from typing import Union, Any
+
+try:
+    from typing import Sequence, Iterator
+except ImportError:
+    from collections.abc import Sequence, Iterator
+
+from .mixins import (
+    Route,
+    CompiledRoute,
+    MixinDataRoute,
+    is_sequence,
+    sanitize_list_index,
+    get_item_of_object,
+)
+
+__all__ = ("DataPatch", "add_data_by_route", "apply_data_patch")
+
+
+def _locate_patch_path(data: Any, route: Route) -> Any:
+    """Convert the route of `MixinDataRoute.update_data_by_route` to the path of the
+    patch operation.
+
+    Returns
+    -------
+    #1: `[str | int] | None`
+        The path of the patch. If `None`, the route does not locate anything.
+
+    #2: `bool`
+        If `True`, the route locates a table column, and the returned path locates
+        the table.
+    """
+    if not route:
+        return None, False
+    if not isinstance(data, (collections.abc.Sequence, collections.abc.Mapping)):
+        return None, False
+    path = []
+    cur_data = data
+    idx_last = route[-1]
+    for idx in route[:-1]:
+        if idx is None:
+            return None, False
+        if is_sequence(idx):
+            idx_last = idx
+            break
+        path.append(idx)
+        cur_data = get_item_of_object(cur_data, idx)
+    if is_sequence(idx_last):
+        idx_last = idx_last[0]
+        if is_sequence(cur_data) and not isinstance(idx_last, int):
+            return path, True
+    path.append(idx_last)
+    return path, False
+
+
+def add_data_by_route(data: Any, route: Route, val: Any) -> Any:
+    """Add a value to a specific part of `data` by a route.
+
+    If the route locates an item of a list, `val` will be inserted before the
+    located item. The index can be the length of the list or `"-"`, which means
+    appending `val` to the list. Otherwise, this method is the same as
+    `MixinDataRoute.update_data_by_route`.
+
+    Arguments
+    ---------
+    data: `Any`
+        The whole data object to be updated.
+
+    route: `[str | int]`
+        A sequence of indicies used for locating the position where `val` is added.
+
+    val: `Any`
+        The value to be added.
+
+    Returns
+    -------
+    #1: `Any`
+        The modified `data`.
+    """
+    if not route:
+        return data
+    parent = MixinDataRoute.get_data_by_route(data, route[:-1])
+    idx = route[-1]
+    if is_sequence(idx):
+        idx = idx[0]
+    if not isinstance(parent, collections.abc.MutableSequence):
+        return MixinDataRoute.update_data_by_route(data, route, val)
+    if idx == "-":
+        parent.append(val)
+        return data
+    try:
+        idx = sanitize_list_index(idx)
+    except ValueError as exc:
+        raise TypeError(
+            "Index {0} does not match the type of the data "
+            "{1}".format(repr(idx), parent)
+        ) from exc
+    parent.insert(idx, val)
+    return data
+
+
+def apply_data_patch(data: Any, patch: Union["DataPatch", Sequence[Any]]) -> Any:
+    """Apply a patch to the data.
+
+    This method applies the patch in the same way as the property `data_patch` of
+    the component. It is used for synchronizing the data on the server, e.g. the
+    data in a server-side store.
+
+    Arguments
+    ---------
+    data: `Any`
+        The whole data object to be modified.
+
+    patch: `DataPatch | [{"op": str, "path": [str | int], "value": Any}]`
+        The patch to be applied. The operation `"op"` can be `"add"`, `"remove"`,
+        or `"replace"`.
+
+    Returns
+    -------
+    #1: `Any`
+        The modified `data`. If an operation replaces the whole data, the returned
+        value is a new object.
+    """
+    if isinstance(patch, DataPatch):
+        patch = patch.operations
+    for operation in patch:
+        op = operation.get("op", "replace")
+        path = operation.get("path", ())
+        if not path:
+            data = None if op == "remove" else operation.get("value")
+            continue
+        if op == "remove":
+            MixinDataRoute.delete_data_by_route(data, path)
+        elif op == "add":
+            add_data_by_route(data, path, operation.get("value"))
+        elif op == "replace":
+            MixinDataRoute.update_data_by_route(data, path, operation.get("value"))
+        else:
+            raise ValueError("Unknown patch operation: {0}".format(repr(op)))
+    return data
+
+
+class DataPatch:
+    """The recorder of the patch.
+
+    Modify the data by the methods of this class, where the methods have the same
+    usages as those of `MixinDataRoute`. Each modification is applied to the data
+    and recorded as patch operations at the same time. The recorded patch can be
+    returned by a callback as the property `data_patch` directly.
+
+    ``` python
+    patch = DataPatch(data)
+    patch.update_data_by_route(["batters", "batter", 0, "type"], "Plain")
+    patch.delete_data_by_route(["topping", 2])
+    return patch  # Output(..., "data_patch")
+    ```
+
+    The values are deep-copied when being recorded, so the recorded patch is not
+    influenced by the modifications made later.
+    """
+
+    def __init__(self, data: Any) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data object to be modified. It needs to be the same as the
+            `data` of the component.
+        """
+        self.data = data
+        self._operations = []
+
+    @property
+    def operations(self) -> list:
+        """The recorded patch operations."""
+        return self._operations
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._operations)
+
+    def __repr__(self) -> str:
+        return "{0}({1})".format(self.__class__.__name__, repr(self._operations))
+
+    def to_plotly_json(self) -> list:
+        """Serialize the patch. This method is used by Dash when the patch is
+        returned by a callback."""
+        return self._operations
+
+    def clear(self) -> None:
+        """Remove the recorded patch operations. The data is not changed."""
+        self._operations = []
+
+    def _record(self, op: str, path: Sequence[Any], *value: Any) -> None:
+        """Record an operation."""
+        operation = {"op": op, "path": list(path)}
+        if value:
+            operation["value"] = copy.deepcopy(value[0])
+        self._operations.append(operation)
+
+    def update_data_by_route(self, route: Union[Route, CompiledRoute], val: Any) -> Any:
+        """Update a specific part of `data` by a route, and record the patch.
+
+        If the route locates a table column, the whole table will be recorded.
+
+        See `MixinDataRoute.update_data_by_route` for the details of the arguments.
+
+        Returns
+        -------
+        #1: `Any`
+            The modified `data`.
+        """
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        path, is_column = _locate_patch_path(self.data, route)
+        MixinDataRoute.update_data_by_route(self.data, route, val)
+        if path is None:
+            return self.data
+        if is_column:
+            val = MixinDataRoute.get_data_by_route(self.data, path)
+        self._record("replace", path, val)
+        return self.data
+
+    def delete_data_by_route(self, route: Union[Route, CompiledRoute]) -> Any:
+        """Delete the data part specified by a route, and record the patch.
+
+        If the route locates a table column, the whole table will be recorded.
+
+        See `MixinDataRoute.delete_data_by_route` for the details of the arguments.
+
+        Returns
+        -------
+        #1: `Any`
+            The data that is deleted and poped out.
+        """
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        path, is_column = _locate_patch_path(self.data, route)
+        val = MixinDataRoute.delete_data_by_route(self.data, route)
+        if path is None:
+            return val
+        if is_column:
+            self._record(
+                "replace", path, MixinDataRoute.get_data_by_route(self.data, path)
+            )
+        else:
+            self._record("remove", path)
+        return val
+
+    def add_data_by_route(self, route: Route, val: Any) -> Any:
+        """Add a value to a specific part of `data` by a route, and record the
+        patch.
+
+        See `add_data_by_route` for the details of the arguments.
+
+        Returns
+        -------
+        #1: `Any`
+            The modified `data`.
+        """
+        if not route:
+            return self.data
+        add_data_by_route(self.data, route, val)
+        path = [idx[0] if is_sequence(idx) else idx for idx in route]
+        self._record("add", path, val)
+        return self.data
@@ -0,0 +1,163 @@
+# -*- coding: UTF-8 -*-
+"""
+Persistent
+==========
+@Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The persistent (structural-sharing) modifications of the data. Rather than
+modifying the data in place, the methods of this module return a new version of
+the data, where only the containers along the route are copied and the other parts
+are shared with the previous version:
+``` python
+new_data = update_data_by_route(data, ["batters", "batter", 0, "type"], "Plain")
+assert new_data["topping"] is data["topping"]
+```
+Keeping many versions of the data only costs the copied containers of each version.
+The shared parts need to be treated as immutable, because modifying them in place
+changes all versions sharing them.
+"""
+
+import copy
+import collections.abc
+
+from typing import Union, Any
+
+try:
+    from typing import Sequence
+except ImportError:
+    from collections.abc import Sequence
+
+from .mixins import (
+    Route,
+    CompiledRoute,
+    is_sequence,
+    get_item_of_object,
+    set_item_of_object,
+    pop_item_of_object,
+)
+
+__all__ = ("update_data_by_route", "delete_data_by_route")
+
+
+def _shallow_copy(data: Any) -> Any:
+    """Copy a container without copying its items."""
+    data_type = type(data)
+    if data_type is dict or data_type is list:
+        return data.copy()
+    return copy.copy(data)
+
+
+def _copy_path(data: Any, route: Sequence[Any]) -> Any:
+    """Copy the containers along the route.
+
+    Returns
+    -------
+    #1: `Any`
+        The copied root of the data.
+
+    #2: `Any`
+        The copied container where the last index of the route is applied.
+
+    #3: `Any`
+        The last index of the route. If it locates a table column, the rows of the
+        table are also copied.
+    """
+    root = _shallow_copy(data)
+    cur_data = root
+    idx_last = route[-1]
+    for idx in route[:-1]:
+        if is_sequence(idx):
+            idx_last = idx
+            break
+        child = _shallow_copy(get_item_of_object(cur_data, idx))
+        set_item_of_object(cur_data, idx, child)
+        cur_data = child
+    if (
+        is_sequence(idx_last)
+        and is_sequence(cur_data)
+        and not isinstance(idx_last[0], int)
+        and isinstance(cur_data, collections.abc.MutableSequence)
+    ):
+        for pos, row in enumerate(cur_data):
+            if isinstance(row, collections.abc.Mapping):
+                cur_data[pos] = _shallow_copy(row)
+    return root, cur_data, idx_last
+
+
+def update_data_by_route(
+    data: Any, route: Union[Route, CompiledRoute], val: Any
+) -> Any:
+    """Make a new version of the data where a specific part is updated.
+
+    The containers along the route are copied, and `data` is not modified. If the
+    route locates a table column, the table and its rows are copied.
+
+    Arguments
+    ---------
+    data: `Any`
+        The whole data object of the previous version.
+
+    route: `[str | int | (str,)] | CompiledRoute`
+        A sequence of indicies used for locating the specific value in `data`. See
+        `MixinDataRoute.update_data_by_route` for details.
+
+    val: `Any`
+        The value used for updating the located part.
+
+    Returns
+    -------
+    #1: `Any`
+        The new version of the data. If the route does not locate anything, return
+        `data` directly.
+    """
+    if isinstance(route, CompiledRoute):
+        route = route.route
+    if not route or any(idx is None for idx in route[:-1]):
+        return data
+    if not isinstance(data, (collections.abc.Sequence, collections.abc.Mapping)):
+        return data
+    root, cur_data, idx_last = _copy_path(data, route)
+    set_item_of_object(cur_data, idx_last, val)
+    return root
+
+
+def delete_data_by_route(data: Any, route: Union[Route, CompiledRoute]) -> Any:
+    """Make a new version of the data where a specific part is deleted.
+
+    The containers along the route are copied, and `data` is not modified. If the
+    route locates a table column, the table and its rows are copied.
+
+    Arguments
+    ---------
+    data: `Any`
+        The whole data object of the previous version.
+
+    route: `[str | int | (str,)] | CompiledRoute`
+        A sequence of indicies used for locating the specific value in `data`. See
+        `MixinDataRoute.delete_data_by_route` for details.
+
+    Returns
+    -------
+    #1: `Any`
+        The new version of the data. If the route does not locate anything, return
+        `data` directly.
+
+    #2: `Any`
+        The data that is deleted and poped out.
+    """
+    if isinstance(route, CompiledRoute):
+        route = route.route
+    if not isinstance(data, (collections.abc.Sequence, collections.abc.Mapping)):
+        raise KeyError("Fail to locate the data, because the given data is immutable.")
+    if any(idx is None for idx in route[:-1]):
+        return data, None
+    root, cur_data, idx_last = _copy_path(data, route)
+    val = pop_item_of_object(cur_data, idx_last)
+    return root, val
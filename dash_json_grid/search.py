@@ -0,0 +1,289 @@
+# -*- coding: UTF-8 -*-
+"""
+Search
+======
+@Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The server-side search of the data. The search yields the routes of the matched
+nodes, where the routes have the same format as the property `selected_path`. An
+inverted index can be built for the data, so repeated queries on the same data do
+not need to traverse the data again.
+"""
+
+import re
+import heapq
+import collections.abc
+
+from typing import Optional, Any
+
+try:
+    from typing import Iterator, Callable
+except ImportError:
+    from collections.abc import Iterator, Callable
+
+from .mixins import is_sequence, walk
+
+
+__all__ = ("SearchIndex", "search")
+
+
+_RE_TOKEN = re.compile(r"\w+")
+# The tokens are indexed by their substrings up to this length.
+_GRAM_SIZE = 3
+
+
+def _value_text(value: Any) -> Optional[str]:
+    """Get the searched text of a value. The containers do not have texts."""
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, collections.abc.Mapping) or is_sequence(value):
+        return None
+    return str(value)
+
+
+def _make_matcher(query: str, regex: bool) -> Callable[[str], bool]:
+    """Make the function checking whether a text matches the query."""
+    if regex:
+        pattern = re.compile(query)
+        return lambda text: pattern.search(text) is not None
+    query = query.lower()
+    return lambda text: query in text.lower()
+
+
+class SearchIndex:
+    """The inverted index of the data used by `search`.
+
+    The index maps each token (a lowercased word) of the keys and the values to the
+    nodes containing it. The tokens are also indexed by their substrings up to
+    `_GRAM_SIZE` characters, so the tokens containing a word of the query are found
+    without scanning all tokens. A query only needs to check the nodes sharing the
+    tokens of the query, so repeated queries on the same data are sub-linear. The
+    index is not updated with the data. If the data is modified, build a new index.
+    """
+
+    def __init__(self, data: Any) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        data: `Any`
+            The data to be indexed.
+        """
+        self.data = data
+        self._parents = []
+        self._keys = []
+        self._key_texts = []
+        self._values = []
+        postings = collections.defaultdict(list)
+        # The latest entry of each depth. It is the parent of the next deeper entry.
+        ancestors = []
+        for route, value in walk(data, share_route=True):
+            depth = len(route)
+            if depth == 0:
+                continue
+            entry = len(self._keys)
+            del ancestors[depth - 1 :]
+            ancestors.append(entry)
+            key = route[-1]
+            key_text = key if isinstance(key, str) else None
+            value_text = _value_text(value)
+            self._parents.append(ancestors[-2] if depth > 1 else -1)
+            self._keys.append(key)
+            self._key_texts.append(key_text)
+            self._values.append(value_text)
+            tokens = set()
+            for text in (key_text, value_text):
+                if text:
+                    tokens.update(_RE_TOKEN.findall(text.lower()))
+            for token in tokens:
+                postings[token].append(entry)
+        self._postings = dict(postings)
+        grams = collections.defaultdict(list)
+        for token in self._postings:
+            token_grams = dict.fromkeys(
+                token[start : start + size]
+                for size in range(1, _GRAM_SIZE + 1)
+                for start in range(len(token) - size + 1)
+            )
+            for gram in token_grams:
+                grams[gram].append(token)
+        self._grams = dict(grams)
+
+    def _route(self, entry: int) -> list:
+        """Get the route of an entry by going through its parents."""
+        route = []
+        while entry >= 0:
+            route.append(self._keys[entry])
+            entry = self._parents[entry]
+        route.reverse()
+        return route
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _tokens(self, word: str) -> list:
+        """Get the indexed tokens containing a word.
+
+        A short word is looked up directly. A longer word is looked up by its
+        rarest gram, and the tokens of the gram are checked by the whole word.
+        """
+        if len(word) <= _GRAM_SIZE:
+            return self._grams.get(word, [])
+        tokens = min(
+            (
+                self._grams.get(word[start : start + _GRAM_SIZE], ())
+                for start in range(len(word) - _GRAM_SIZE + 1)
+            ),
+            key=len,
+        )
+        return [token for token in tokens if word in token]
+
+    def _candidates(self, query: str, regex: bool) -> Iterator[int]:
+        """Get the entries that may match the query, in the document order.
+
+        If a plain query is contained by the text of an entry, each word of the
+        query is a part of a token of the entry. Therefore, the entries are
+        collected from the tokens of the word with the fewest entries. The
+        postings of the tokens are merged lazily, so stopping the search early
+        does not visit the remaining entries. A regular expression can not be
+        split into words, so all entries are returned.
+        """
+        if regex:
+            return iter(range(len(self._keys)))
+        words = set(_RE_TOKEN.findall(query.lower()))
+        if not words:
+            return iter(range(len(self._keys)))
+        postings = None
+        n_entries = None
+        for word in words:
+            word_postings = [self._postings[token] for token in self._tokens(word)]
+            word_entries = sum(map(len, word_postings))
+            if not word_entries:
+                return iter(())
+            if n_entries is None or word_entries < n_entries:
+                postings = word_postings
+                n_entries = word_entries
+        if len(postings) == 1:
+            return iter(postings[0])
+        return self._merge(postings)
+
+    @staticmethod
+    def _merge(postings: list) -> Iterator[int]:
+        """Merge the sorted postings, and yield each entry once."""
+        prev = -1
+        for entry in heapq.merge(*postings):
+            if entry != prev:
+                yield entry
+                prev = entry
+
+    def search(
+        self,
+        query: str,
+        keys: bool = True,
+        values: bool = True,
+        regex: bool = False,
+        limit: Optional[int] = None,
+    ) -> Iterator[list]:
+        """Search the indexed data. See `search` for details."""
+        matcher = _make_matcher(query, regex)
+        n_found = 0
+        if limit is not None and limit <= 0:
+            return
+        for entry in self._candidates(query, regex):
+            key_text = self._key_texts[entry]
+            value_text = self._values[entry]
+            if (keys and key_text is not None and matcher(key_text)) or (
+                values and value_text is not None and matcher(value_text)
+            ):
+                yield self._route(entry)
+                n_found += 1
+                if limit is not None and n_found >= limit:
+                    return
+
+
+def search(
+    data: Any,
+    query: str,
+    *,
+    keys: bool = True,
+    values: bool = True,
+    regex: bool = False,
+    limit: Optional[int] = None,
+    index: Optional[SearchIndex] = None,
+) -> Iterator[list]:
+    """Search the data, and yield the routes of the matched nodes.
+
+    Arguments
+    ---------
+    data: `Any`
+        The whole data object to be searched.
+
+    query: `str`
+        The searched text. If `regex` is `False`, a node matches the query when its
+        text contains the query (case-insensitive).
+
+    keys: `bool`
+        Whether to match the keys of the mappings.
+
+    values: `bool`
+        Whether to match the values that are not containers. The values are
+        matched by their JSON texts, e.g. `true`, `null`, or `1.5`.
+
+    regex: `bool`
+        If `True`, `query` is a regular expression searched in the texts.
+
+    limit: `int | None`
+        The maximal number of the yielded routes.
+
+    index: `SearchIndex | None`
+        The prebuilt index of `data`. If specified, the index is used for
+        accelerating the search.
+
+    Returns
+    -------
+    #1: `Iterator[[str | int]]`
+        A generator yielding the route of each matched node in the document order.
+        The route can be used by `MixinDataRoute.get_data_by_route`. Stopping the
+        generator early stops the search.
+    """
+    if index is not None:
+        if index.data is not data:
+            raise ValueError(
+                "The search index does not belong to the searched data. Build the "
+                "index by the same data object."
+            )
+        yield from index.search(
+            query, keys=keys, values=values, regex=regex, limit=limit
+        )
+        return
+    if limit is not None and limit <= 0:
+        return
+    matcher = _make_matcher(query, regex)
+    n_found = 0
+    for route, value in walk(data, share_route=True):
+        if not route:
+            continue
+        key = route[-1]
+        if keys and isinstance(key, str) and matcher(key):
+            is_matched = True
+        elif values:
+            value_text = _value_text(value)
+            is_matched = value_text is not None and matcher(value_text)
+        else:
+            is_matched = False
+        if is_matched:
+            yield list(route)
+            n_found += 1
+            if limit is not None and n_found >= limit:
+                return
@@ -0,0 +1,506 @@
+# -*- coding: UTF-8 -*-
+"""
+Skeleton
+========
+@Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The lazy expansion of the data. Rather than sending the whole data to the browser,
+the component can be initialized by a shallow skeleton of the data, where the deep
+containers are replaced by placeholders like
+``` python
+{"__djg_type__": "array", "length": 1000}
+```
+The long containers and strings are also truncated, where the truncated items of a
+container are replaced by a `"more"` placeholder carrying their number and their
+`"offset"` in the container. When a placeholder is selected in the browser, its
+route is sent to the property `expand_path` of the component. For a `"more"`
+placeholder, the sent route is the route of the container followed by
+`"__djg_more__"` and the offset, so that only the next items are loaded. A callback can answer the request by sending the
+next level of the skeleton to the property `data_patch`:
+``` python
+@app.callback(
+    Output("viewer", "data_patch"),
+    Input("viewer", "expand_path"),
+    State("viewer", "data_key"),
+    prevent_initial_call=True,
+)
+def expand(route, data_key):
+    return DashJsonGrid.expand_skeleton(store.get(data_key), route)
+```
+For a huge payload, `summarize` makes a preview capped by the depth, the number of
+items in each container, and the length of each string. The truncated parts are
+replaced by the placeholders carrying their original lengths and routes, so they can
+be expanded in the same way.
+"""
+
+import itertools
+import collections.abc
+
+from typing import Union, Optional, Any, TypeVar
+
+try:
+    from typing import Callable
+except ImportError:
+    from collections.abc import Callable
+
+from typing_extensions import ParamSpec
+
+from .mixins import (
+    Route,
+    CompiledRoute,
+    MixinDataRoute,
+    is_sequence,
+    get_item_of_object,
+    _check_data_delegated,
+)
+
+P = ParamSpec("P")
+T = TypeVar("T")
+__all__ = (
+    "PLACEHOLDER_TYPE_KEY",
+    "PLACEHOLDER_MORE_KEY",
+    "is_placeholder",
+    "make_placeholder",
+    "make_skeleton",
+    "summarize",
+    "MixinSkeleton",
+)
+
+
+PLACEHOLDER_TYPE_KEY = "__djg_type__"
+"""The key marking a placeholder. Its value is one of the following types:
+* `"object"`, `"array"`: A container that is not loaded.
+* `"string"`: A truncated string. The placeholder has the `"preview"` of the string.
+* `"more"`: The items truncated from a container. It is placed after the last loaded
+  item of the container, and carries the `"offset"` of the first truncated item.
+"""
+
+PLACEHOLDER_MORE_KEY = "__djg_more__"
+"""The key of the `"more"` placeholder in a truncated object."""
+
+_PLACEHOLDER_TYPES = ("object", "array", "string", "more")
+
+
+def is_placeholder(val: Any) -> bool:
+    """Check whether `val` is a placeholder of the lazy data or not."""
+    return (
+        isinstance(val, collections.abc.Mapping)
+        and val.get(PLACEHOLDER_TYPE_KEY) in _PLACEHOLDER_TYPES
+    )
+
+
+def make_placeholder(data: Any, route: Optional[Route] = None) -> Any:
+    """Make the placeholder of a container.
+
+    Arguments
+    ---------
+    data: `Any`
+        The data to be replaced by the placeholder.
+
+    route: `[str | int] | None`
+        If specified, the placeholder carries the route of `data`.
+
+    Returns
+    -------
+    #1: `Any`
+        The placeholder carrying the type tag and the length of `data`. If `data`
+        is not a container or is an empty container, return `data` directly.
+    """
+    if isinstance(data, collections.abc.Mapping):
+        if not data:
+            return data
+        placeholder = {PLACEHOLDER_TYPE_KEY: "object", "length": len(data)}
+    elif is_sequence(data):
+        if not data:
+            return data
+        placeholder = {PLACEHOLDER_TYPE_KEY: "array", "length": len(data)}
+    else:
+        return data
+    if route is not None:
+        placeholder["route"] = list(route)
+    return placeholder
+
+
+def make_skeleton(
+    data: Any, depth: int = 1, max_items: int = 100, max_str_len: int = 256
+) -> Any:
+    """Make the shallow skeleton of the data.
+
+    Arguments
+    ---------
+    data: `Any`
+        The data to be converted.
+
+    depth: `int`
+        The number of the container levels kept in the skeleton. The containers
+        deeper than `depth` are replaced by placeholders. It needs to be positive.
+
+    max_items: `int`
+        The maximal number of the items kept in each container. The other items are
+        represented by a `"more"` placeholder.
+
+    max_str_len: `int`
+        The maximal length of the strings. The longer strings are represented by
+        `"string"` placeholders.
+
+    Returns
+    -------
+    #1: `Any`
+        The skeleton. It is a new object sharing the scalar values with `data`.
+        Like `summarize`, its size is bounded by the arguments.
+    """
+    if depth < 1:
+        raise ValueError(
+            "The argument depth needs to be positive, but get: {0}".format(depth)
+        )
+    return summarize(data, depth, max_items, max_str_len)
+
+
+_SUMMARY_END = object()
+
+
+def _make_more(data: Any, route: list, offset: int, max_items: int) -> Any:
+    """Make the `"more"` placeholder of a container whose items are kept from
+    `offset`. Return `None` if no item is truncated."""
+    if len(data) <= offset + max_items:
+        return None
+    return {
+        PLACEHOLDER_TYPE_KEY: "more",
+        "length": len(data) - offset - max_items,
+        "offset": offset + max_items,
+        "route": list(route),
+    }
+
+
+def _summarize_node(
+    data: Any,
+    route: list,
+    max_depth: int,
+    max_items: int,
+    max_str_len: int,
+    n_prefix: int = 0,
+    offset: int = 0,
+) -> Any:
+    """Summarize one node of the data. The first `n_prefix` indicies of `route` are
+    the route of the summarized data. If `data` is a container, its items are kept
+    from `offset`.
+
+    Returns
+    -------
+    #1: `Any`
+        The summarized node. If `data` is a container, it is an empty container to
+        be filled by the children.
+
+    #2: `(Iterator, Any, Any) | None`
+        If the children of `data` need to be summarized, return the iterator of
+        the kept children, the summarized container, and the `"more"` placeholder.
+    """
+    if isinstance(data, str):
+        if len(data) <= max_str_len:
+            return data, None
+        return {
+            PLACEHOLDER_TYPE_KEY: "string",
+            "length": len(data),
+            "preview": data[:max_str_len],
+            "route": list(route),
+        }, None
+    if isinstance(data, collections.abc.Mapping):
+        if data and len(route) - n_prefix >= max_depth:
+            return make_placeholder(data, route), None
+        out = {}
+        children = itertools.islice(data.items(), offset, offset + max_items)
+    elif is_sequence(data):
+        if data and len(route) - n_prefix >= max_depth:
+            return make_placeholder(data, route), None
+        out = []
+        children = itertools.islice(enumerate(data), offset, offset + max_items)
+    else:
+        return data, None
+    return out, (children, out, _make_more(data, route, offset, max_items))
+
+
+def summarize(
+    data: Any, max_depth: int = 2, max_items: int = 100, max_str_len: int = 256
+) -> Any:
+    """Make the size-capped preview of the data.
+
+    The preview keeps the first levels, the first items of each container, and the
+    beginning of each string. Each truncated part is replaced by a placeholder
+    carrying its original length and its route. The placeholders can be expanded
+    by `MixinSkeleton.expand_skeleton`.
+
+    The size of the preview is bounded by the arguments rather than the size of
+    `data`, and the truncated parts are not traversed.
+
+    Arguments
+    ---------
+    data: `Any`
+        The data to be summarized.
+
+    max_depth: `int`
+        The number of the container levels kept in the preview.
+
+    max_items: `int`
+        The maximal number of the items kept in each container. The other items are
+        represented by a `"more"` placeholder.
+
+    max_str_len: `int`
+        The maximal length of the strings. The longer strings are represented by
+        `"string"` placeholders.
+
+    Returns
+    -------
+    #1: `Any`
+        The preview. It is a new object sharing the scalar values with `data`.
+    """
+    return _summarize(data, [], max_depth, max_items, max_str_len)
+
+
+def _summarize(
+    data: Any,
+    route: Route,
+    max_depth: int,
+    max_items: int,
+    max_str_len: int,
+    offset: int = 0,
+) -> Any:
+    """The implementation of `summarize`. `data` is located by `route` in the whole
+    data, so the placeholders carry the routes in the whole data. If `data` is a
+    container, its items are kept from `offset`."""
+    if max_depth < 0 or max_items < 0 or max_str_len < 0:
+        raise ValueError(
+            "The arguments max_depth, max_items, and max_str_len need to be "
+            "non-negative, but get: {0}, {1}, {2}".format(
+                max_depth, max_items, max_str_len
+            )
+        )
+    route = list(route)
+    n_prefix = len(route)
+    root, frame = _summarize_node(
+        data, route, max_depth, max_items, max_str_len, n_prefix, offset
+    )
+    if frame is None:
+        return root
+    stack = [frame]
+    while stack:
+        children, out, more = stack[-1]
+        item = next(children, _SUMMARY_END)
+        if item is _SUMMARY_END:
+            stack.pop()
+            if more is not None:
+                if isinstance(out, list):
+                    out.append(more)
+                else:
+                    out[PLACEHOLDER_MORE_KEY] = more
+            if len(route) > n_prefix:
+                route.pop()
+            continue
+        key, value = item
+        route.append(key)
+        child, frame = _summarize_node(
+            value, route, max_depth, max_items, max_str_len, n_prefix
+        )
+        if isinstance(out, list):
+            out.append(child)
+        else:
+            out[key] = child
+        if frame is None:
+            route.pop()
+        else:
+            stack.append(frame)
+    return root
+
+
+def _expand_more(
+    data: Any,
+    route: list,
+    offset: int,
+    depth: int,
+    max_items: int,
+    max_str_len: int,
+) -> list:
+    """Make the patch that loads the items of the container located by `route` from
+    `offset`, where a `"more"` placeholder is in the skeleton."""
+    container = MixinDataRoute.get_data_by_route(data, route)
+    if isinstance(container, collections.abc.Mapping):
+        keys = itertools.islice(container.keys(), offset, offset + max_items)
+        path_more = route + [PLACEHOLDER_MORE_KEY]
+    elif is_sequence(container):
+        keys = range(offset, min(len(container), offset + max_items))
+        path_more = route + [offset]
+    else:
+        raise TypeError(
+            "The route of the truncated items needs to locate a container, but "
+            "get: {0}".format(type(container))
+        )
+    if offset < 0 or offset >= len(container):
+        raise IndexError(
+            "The offset of the truncated items is out of range, but get: "
+            "{0}".format(offset)
+        )
+    patch = [{"op": "remove", "path": path_more}]
+    for key in keys:
+        sub_route = route + [key]
+        patch.append(
+            {
+                "op": "add",
+                "path": sub_route,
+                "value": _summarize(
+                    get_item_of_object(container, key),
+                    sub_route,
+                    depth - 1,
+                    max_items,
+                    max_str_len,
+                ),
+            }
+        )
+    more = _make_more(container, route, offset, max_items)
+    if more is not None:
+        if is_sequence(container):
+            path_more = route + [offset + max_items]
+        patch.append({"op": "add", "path": path_more, "value": more})
+    return patch
+
+
+class MixinSkeleton:
+    @classmethod
+    def from_skeleton(
+        cls: Callable[P, T],
+        data: Any,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Use the shallow skeleton of the data to initialize the component.
+
+        The initial payload only contains the first levels of `data`. The deeper
+        containers are loaded when they are requested by the property
+        `expand_path`. See `expand_skeleton` for details.
+
+        Extra Arguments
+        ---------------
+        data: `Any`
+            The whole data. Only its skeleton is passed to the component.
+
+        skeleton_depth: `int`
+            The number of the container levels sent to the browser initially.
+
+        skeleton_max_items: `int`
+            The maximal number of the items sent for each container.
+
+        skeleton_max_str_len: `int`
+            The maximal length of the strings sent to the browser.
+
+        Other Arugments
+        ---------------
+        The same as the initialization. Typically, `data_key` is also specified
+        so that the callbacks can find the whole data in a server-side store.
+
+        Returns
+        -------
+        The component initialized by the skeleton, where the other details of the
+        component is the same as the initialization.
+        """
+        depth = kwargs.pop("skeleton_depth", 1)
+        max_items = kwargs.pop("skeleton_max_items", 100)
+        max_str_len = kwargs.pop("skeleton_max_str_len", 256)
+        _check_data_delegated(cls, "from_skeleton", "data", args, kwargs)
+        kwargs["data"] = make_skeleton(data, depth, max_items, max_str_len)
+        return cls(*args, **kwargs)
+
+    @staticmethod
+    def expand_skeleton(
+        data: Any,
+        route: Union[Route, CompiledRoute],
+        depth: int = 1,
+        max_items: int = 100,
+        max_str_len: int = 256,
+    ) -> list:
+        """Make the patch that expands a placeholder in the skeleton.
+
+        Arguments
+        ---------
+        data: `Any`
+            The whole data where the skeleton is made from.
+
+        route: `[str | int] | CompiledRoute`
+            The route of the placeholder, typically provided by the property
+            `expand_path` of the component. For a `"more"` placeholder, it is the
+            route of the container followed by `"__djg_more__"` and the offset of
+            the first truncated item.
+
+        depth: `int`
+            The number of the container levels loaded by this expansion.
+
+        max_items: `int`
+            The maximal number of the items loaded for each container.
+
+        max_str_len: `int`
+            The maximal length of the strings loaded by this expansion. The string
+            located by `route` is always loaded completely.
+
+        Returns
+        -------
+        #1: `[{"op": str, "path": [str | int], "value": Any}]`
+            The patch that can be sent to the property `data_patch`. The placeholder
+            is replaced by the skeleton of the located data. If `route` is empty,
+            the whole data is replaced. For a `"more"` placeholder, the patch adds
+            the next `max_items` items of the container, followed by a new
+            `"more"` placeholder if there are still truncated items.
+        """
+        if depth < 1:
+            raise ValueError(
+                "The argument depth needs to be positive, but get: {0}".format(depth)
+            )
+        if isinstance(route, CompiledRoute):
+            route = route.route
+        route = list(route)
+        if (
+            len(route) >= 2
+            and route[-2] == PLACEHOLDER_MORE_KEY
+            and isinstance(route[-1], int)
+        ):
+            return _expand_more(
+                data, route[:-2], route[-1], depth, max_items, max_str_len
+            )
+        sub_data = MixinDataRoute.get_data_by_route(data, route)
+        if isinstance(sub_data, str):
+            value = sub_data
+        else:
+            value = _summarize(sub_data, route, depth, max_items, max_str_len)
+        return [{"op": "replace", "path": route, "value": value}]
+
+    @staticmethod
+    def summarize(
+        data: Any, max_depth: int = 2, max_items: int = 100, max_str_len: int = 256
+    ) -> Any:
+        """Make the size-capped preview of the data.
+
+        Arguments
+        ---------
+        data: `Any`
+            The data to be summarized.
+
+        max_depth: `int`
+            The number of the container levels kept in the preview.
+
+        max_items: `int`
+            The maximal number of the items kept in each container.
+
+        max_str_len: `int`
+            The maximal length of the strings kept in the preview.
+
+        Returns
+        -------
+        #1: `Any`
+            The preview that can be sent to the property `data`. Each truncated
+            part is a placeholder carrying its original length and its route. See
+            `summarize` of the module `skeleton` for details.
+        """
+        return summarize(data, max_depth, max_items, max_str_len)
@@ -0,0 +1,531 @@
+# -*- coding: UTF-8 -*-
+"""
+Store
+=====
+@Dash JSON Grid Viewer
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The server-side data stores. A store keeps the data of the components on the server,
+and the component only needs to carry the key of the data (the property `data_key`).
+The callbacks can use `State(..., "data_key")` to locate the data in the store rather
+than receiving the whole data from the browser.
+"""
+
+import os
+import json
+import uuid
+import shutil
+import hashlib
+import weakref
+import tempfile
+import threading
+import contextlib
+import collections
+
+from typing import Union, Optional, Any, TypeVar
+
+try:
+    from typing import Callable, Iterator
+except ImportError:
+    from collections.abc import Callable, Iterator
+
+from typing_extensions import ParamSpec
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from .mixins import Route, CompiledRoute, MixinDataRoute, _check_data_delegated
+from . import persistent
+
+
+P = ParamSpec("P")
+T = TypeVar("T")
+__all__ = ("DataStore", "MemoryStore", "DiskStore", "MixinStore")
+
+
+_KEY_LOCKS_INIT = threading.Lock()
+
+
+class _KeyLocks:
+    """The locks of the data keys. A lock is kept only when it is used."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._locks = dict()
+
+    @contextlib.contextmanager
+    def hold(self, key: Any) -> Iterator[None]:
+        """Hold the lock of the key in the context."""
+        with self._lock:
+            entry = self._locks.get(key)
+            if entry is None:
+                entry = [threading.RLock(), 0]
+                self._locks[key] = entry
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] <= 0:
+                    self._locks.pop(key, None)
+
+
+class DataStore:
+    """The abstract class of the server-side data stores.
+
+    A data store is a mapping from the data keys (`str`) to the data. The
+    implementation needs to provide `get`, `set`, `delete`, `__contains__`, and
+    `clear`. All methods need to be thread-safe.
+
+    The data returned by `get` may be shared with the cache of the store, so it
+    should not be modified in place. Use `MixinStore.update_data_by_key` or
+    `MixinStore.delete_data_by_key` to modify the stored data.
+    """
+
+    def get(self, key: str) -> Any:
+        """Get the data by the key. Raise `KeyError` if the key does not exist."""
+        raise NotImplementedError
+
+    def set(self, key: str, data: Any) -> None:
+        """Set the data of the key. The previous data of the key is invalidated."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Invalidate the data of the key. Raise `KeyError` if the key does not
+        exist."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Invalidate all data in the store."""
+        raise NotImplementedError
+
+    def __contains__(self, key: Any) -> bool:
+        raise NotImplementedError
+
+    def __getitem__(self, key: str) -> Any:
+        return self.get(key)
+
+    def __setitem__(self, key: str, data: Any) -> None:
+        self.set(key, data)
+
+    def __delitem__(self, key: str) -> None:
+        self.delete(key)
+
+    def lock(self, key: str) -> "contextlib.AbstractContextManager[None]":
+        """Lock the key for reading, modifying, and writing back its data.
+
+        Arguments
+        ---------
+        key: `str`
+            The key of the data.
+
+        Returns
+        -------
+        #1: `contextlib.AbstractContextManager[None]`
+            The context holding the lock. The other threads locking the same key
+            wait until the context exits.
+        """
+        key_locks = getattr(self, "_key_locks", None)
+        if key_locks is None:
+            with _KEY_LOCKS_INIT:
+                key_locks = getattr(self, "_key_locks", None)
+                if key_locks is None:
+                    key_locks = _KeyLocks()
+                    self._key_locks = key_locks
+        return key_locks.hold(key)
+
+    def new_key(self) -> str:
+        """Create a new data key that is not used by the store."""
+        key = uuid.uuid4().hex
+        while key in self:
+            key = uuid.uuid4().hex
+        return key
+
+    def add(self, data: Any) -> str:
+        """Add new data to the store.
+
+        Arguments
+        ---------
+        data: `Any`
+            The data to be added.
+
+        Returns
+        -------
+        #1: `str`
+            The newly created key of the data.
+        """
+        key = self.new_key()
+        self.set(key, data)
+        return key
+
+
+class MemoryStore(DataStore):
+    """The data store keeping the data in the memory.
+
+    The least recently used data will be invalidated if the number of the stored
+    data exceeds `max_items`. The stored data is not shared among processes, so this
+    store is only suitable for the apps served by a single process.
+    """
+
+    def __init__(self, max_items: Optional[int] = 128) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        max_items: `int | None`
+            The maximal number of the stored data. If `None`, the number is not
+            limited.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError(
+                "The argument max_items needs to be positive, but get: {0}".format(
+                    max_items
+                )
+            )
+        self.max_items = max_items
+        self._data = collections.OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(tuple(self._data.keys()))
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            data = self._data[key]
+            self._data.move_to_end(key)
+            return data
+
+    def set(self, key: str, data: Any) -> None:
+        with self._lock:
+            self._data[key] = data
+            self._data.move_to_end(key)
+            if self.max_items is not None:
+                while len(self._data) > self.max_items:
+                    self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class DiskStore(DataStore):
+    """The data store keeping the data in a folder.
+
+    Each data is saved as a JSON file, so the data needs to be JSON serializable
+    like the property `data` of the component. The files are replaced atomically,
+    so the store can be shared among the processes serving the same app. The
+    recently used data is also cached in the memory, which avoids loading the same
+    data repeatedly.
+
+    The folder should only be writable by the user running the app. On the
+    platforms supporting `fcntl`, `lock(key)` also locks the key among the
+    processes. Otherwise, it only locks the key among the threads.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike, None] = None,
+        max_items: Optional[int] = None,
+        cache_items: int = 4,
+    ) -> None:
+        """Initialization.
+
+        Arguments
+        ---------
+        path: `str | os.PathLike | None`
+            The folder where the data is stored. It is created with the permission
+            `0o700` if it does not exist. If not specified, create a new private
+            folder in the temporary directory, which is not shared with other
+            stores. The created folder is removed with the stored data when the
+            store is garbage-collected or the interpreter exits.
+
+        max_items: `int | None`
+            The maximal number of the stored data. If specified, the least recently
+            written data will be invalidated when the number is exceeded.
+
+        cache_items: `int`
+            The number of the data cached in the memory. If `0`, the data will be
+            loaded from the disk every time.
+        """
+        self._finalizer = None
+        if path is None:
+            path = tempfile.mkdtemp(prefix="dash-json-grid-store-")
+            self._finalizer = weakref.finalize(
+                self, shutil.rmtree, path, ignore_errors=True
+            )
+        self.path = os.path.abspath(os.fspath(path))
+        os.makedirs(self.path, mode=0o700, exist_ok=True)
+        self.max_items = max_items
+        self._cache = MemoryStore(cache_items) if cache_items > 0 else None
+        self._lock = threading.RLock()
+        self._file_locks = dict()
+
+    def _file_name(self, key: str, suffix: str = ".json") -> str:
+        """Get the file path of the key. The key is hashed so that any string can be
+        used as the key."""
+        if not isinstance(key, str):
+            raise KeyError(key)
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.path, name + suffix)
+
+    def __contains__(self, key: Any) -> bool:
+        if not isinstance(key, str):
+            return False
+        return os.path.isfile(self._file_name(key))
+
+    def _stamp(self, key: str) -> Any:
+        """Get the modification stamp of the file. It is used for validating the
+        memory cache when the data is modified by another process."""
+        stat = os.stat(self._file_name(key))
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            try:
+                stamp = self._stamp(key)
+            except FileNotFoundError:
+                raise KeyError(key) from None
+            if self._cache is not None and key in self._cache:
+                cached_stamp, data = self._cache.get(key)
+                if cached_stamp == stamp:
+                    return data
+            try:
+                with open(self._file_name(key), "r", encoding="utf-8") as fobj:
+                    data = json.load(fobj)
+            except FileNotFoundError:
+                raise KeyError(key) from None
+            if self._cache is not None:
+                self._cache.set(key, (stamp, data))
+            return data
+
+    def set(self, key: str, data: Any) -> None:
+        file_name = self._file_name(key)
+        with self._lock:
+            fd, tmp_name = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fobj:
+                    json.dump(data, fobj, ensure_ascii=False)
+                os.replace(tmp_name, file_name)
+            except BaseException:
+                if os.path.exists(tmp_name):
+                    os.remove(tmp_name)
+                raise
+            if self._cache is not None:
+                self._cache.set(key, (self._stamp(key), data))
+            if self.max_items is not None:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently written files if there are too many files."""
+        files = []
+        for entry in os.scandir(self.path):
+            if entry.name.endswith(".json"):
+                try:
+                    files.append((entry.stat().st_mtime_ns, entry.path))
+                except FileNotFoundError:
+                    continue
+        n_removed = len(files) - self.max_items
+        if n_removed <= 0:
+            return
+        files.sort()
+        for _, file_path in files[:n_removed]:
+            try:
+                os.remove(file_path)
+            except FileNotFoundError:
+                pass
+
+    @contextlib.contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        with super().lock(key):
+            # The file lock is only taken by the outermost context of the thread,
+            # because locking the same file twice in a process blocks itself.
+            if fcntl is None or key in self._file_locks:
+                yield
+                return
+            self._file_locks[key] = True
+            try:
+                with open(self._file_name(key, ".lock"), "ab") as fobj:
+                    fcntl.flock(fobj.fileno(), fcntl.LOCK_EX)
+                    try:
+                        yield
+                    finally:
+                        fcntl.flock(fobj.fileno(), fcntl.LOCK_UN)
+            finally:
+                del self._file_locks[key]
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if self._cache is not None and key in self._cache:
+                self._cache.delete(key)
+            try:
+                os.remove(self._file_name(key))
+            except FileNotFoundError:
+                raise KeyError(key) from None
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._cache is not None:
+                self._cache.clear()
+            for entry in os.scandir(self.path):
+                if entry.name.endswith(".json"):
+                    try:
+                        os.remove(entry.path)
+                    except FileNotFoundError:
+                        pass
+
+
+class MixinStore:
+    @classmethod
+    def from_store(
+        cls: Callable[P, T],
+        store: DataStore,
+        data_key: str,
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> T:
+        """Use the data in a server-side store to initialize the component.
+
+        If using this method, users should leave the arguments `data` and `data_key`
+        blank because this method will load the data of `data_key` from the store.
+
+        Extra Arguments
+        ---------------
+        store: `DataStore`
+            The server-side store where the data is kept.
+
+        data_key: `str`
+            The key of the data in the store. It will be passed to the property
+            `data_key` of the component.
+
+        Other Arugments
+        ---------------
+        The same as the initialization.
+
+        Returns
+        -------
+        The component initialized by the stored data, where the other details of
+        the component is the same as the initialization.
+        """
+        _check_data_delegated(cls, "from_store", "data_key", args, kwargs)
+        kwargs["data"] = store.get(data_key)
+        kwargs["data_key"] = data_key
+        return cls(*args, **kwargs)
+
+    @staticmethod
+    def get_data_by_key(
+        store: DataStore, data_key: str, route: Union[Route, CompiledRoute]
+    ) -> Any:
+        """Get a specific part of the stored data by a route.
+
+        Arguments
+        ---------
+        store: `DataStore`
+            The server-side store where the data is kept.
+
+        data_key: `str`
+            The key of the data in the store. Typically, it is provided by the
+            property `data_key` of the component.
+
+        route: `[str | int | (str,)] | CompiledRoute`
+            A sequence of indicies used for locating the specific value in the data.
+            See `MixinDataRoute.get_data_by_route` for details.
+
+        Returns
+        -------
+        #1: `Any`
+            The located part of the stored data.
+        """
+        return MixinDataRoute.get_data_by_route(store.get(data_key), route)
+
+    @staticmethod
+    def update_data_by_key(
+        store: DataStore,
+        data_key: str,
+        route: Union[Route, CompiledRoute],
+        val: Any,
+    ) -> Any:
+        """Update a specific part of the stored data by a route.
+
+        The key is locked during the modification. The previous data is not
+        modified, because the new version of the data is made by
+        `dash_json_grid.persistent`, where only the containers along the route are
+        copied. The new version is written back to the store only if the update
+        succeeds.
+
+        Arguments
+        ---------
+        store: `DataStore`
+            The server-side store where the data is kept.
+
+        data_key: `str`
+            The key of the data in the store.
+
+        route: `[str | int | (str,)] | CompiledRoute`
+            A sequence of indicies used for locating the specific value in the data.
+            See `MixinDataRoute.update_data_by_route` for details.
+
+        val: `Any`
+            The value used for updating the located part of the data.
+
+        Returns
+        -------
+        #1: `Any`
+            The new version of the data.
+        """
+        with store.lock(data_key):
+            data = persistent.update_data_by_route(store.get(data_key), route, val)
+            store.set(data_key, data)
+        return data
+
+    @staticmethod
+    def delete_data_by_key(
+        store: DataStore, data_key: str, route: Union[Route, CompiledRoute]
+    ) -> Any:
+        """Delete a specific part of the stored data by a route.
+
+        The key is locked during the modification. Like `update_data_by_key`, the
+        previous data is not modified, and the new version of the data is written
+        back to the store only if the deletion succeeds.
+
+        Arguments
+        ---------
+        store: `DataStore`
+            The server-side store where the data is kept.
+
+        data_key: `str`
+            The key of the data in the store.
+
+        route: `[str | int | (str,)] | CompiledRoute`
+            A sequence of indicies used for locating the specific value in the data.
+            See `MixinDataRoute.delete_data_by_route` for details.
+
+        Returns
+        -------
+        #1: `Any`
+            The data that is deleted and poped out.
+        """
+        with store.lock(data_key):
+            data, val = persistent.delete_data_by_route(store.get(data_key), route)
+            store.set(data_key, data)
+        return val
@@ -161,7 +161,7 @@ def toggle_editor(
 
 
 @app.callback(
-    Output("viewer", "data"),
+    Output("viewer", "data_patch"),
     Output("editor-alert", "is_open"),
     Output("editor-alert", "children"),
     Input("editor-confirm-btn", "n_clicks"),
@@ -179,14 +179,17 @@ def confirm_data_change(
     if not route:
         return dash.no_update, dash.no_update, dash.no_update
 
+    # Only send the modified part of the data back to the browser.
+    patch = djg.patch.DataPatch(data)
+
     if not modified_data:
         try:
-            djg.DashJsonGrid.delete_data_by_route(data, route)
+            patch.delete_data_by_route(route)
         except (KeyError, IndexError):
             pass
         if not data:
             return dash.no_update, True, "Error: It is not allowed to delete all data."
-        return data, "", False
+        return patch, "", False
 
     try:
         decoded_modified_data = json.loads(modified_data)
@@ -200,17 +203,15 @@ def confirm_data_change(
 
     if "selected_data" not in decoded_modified_data:
         try:
-            djg.DashJsonGrid.delete_data_by_route(data, route)
+            patch.delete_data_by_route(route)
         except (KeyError, IndexError):
             pass
         if not data:
             return dash.no_update, True, "Error: It is not allowed to delete all data."
-        return data, "", False
+        return patch, "", False
 
     try:
-        djg.DashJsonGrid.update_data_by_route(
-            data, route, decoded_modified_data["selected_data"]
-        )
+        patch.update_data_by_route(route, decoded_modified_data["selected_data"])
     except (KeyError, IndexError, TypeError, ValueError) as exc:
         logging.error(exc, stack_info=True)
         return (
@@ -222,7 +223,7 @@ def confirm_data_change(
     if not data:
         return dash.no_update, True, "Error: It is not allowed to delete all data."
 
-    return data, "", False
+    return patch, "", False
 
 
 @app.callback(
@@ -1,8 +1,9 @@
 /* eslint no-magic-numbers: 0 */
-import React, {useState} from "react";
+import React, {useState, useEffect} from "react";
 
 import "./style.css";
 import {DashJsonGrid} from "../lib";
+import {renderCounts} from "../lib/utils";
 
 const Search = (props) => {
   return (
@@ -115,6 +116,14 @@ const App = () => {
   const [selectedPath, setSelectedPath] = useState([]);
   const [hightlightSelected, setHightlightSelected] = useState(true);
   const [theme, setTheme] = useState("defaultLight");
+  const [loadingState, setLoadingState] = useState({is_loading: false});
+  const [searchResults, setSearchResults] = useState(null);
+  const [gridRenders, setGridRenders] = useState(0);
+
+  // The grid should not be re-rendered when only `loading_state` changes.
+  useEffect(() => {
+    setGridRenders(renderCounts.JSONGrid);
+  });
 
   const states = {
     data: setData,
@@ -123,6 +132,8 @@ const App = () => {
     selected_path: setSelectedPath,
     highlight_selected: setHightlightSelected,
     theme: setTheme,
+    loading_state: setLoadingState,
+    search_results: setSearchResults,
   };
 
   const setProps = (newProps) => {
@@ -139,12 +150,27 @@ const App = () => {
         setProps={setProps}
         data={data}
         search_text={searchText}
+        search_results={searchResults}
         default_expand_depth={defaultExpandPath}
         selected_path={selectedPath}
         highlight_selected={hightlightSelected}
         theme={theme}
+        loading_state={loadingState}
       />
       <Output label={"Selected"}>{selectedPath}</Output>
+      <Output label={"Search matches"}>
+        {searchResults ? searchResults.count : 0}
+      </Output>
+      <p>
+        <button
+          onClick={() => {
+            setLoadingState({is_loading: !loadingState.is_loading});
+          }}
+        >
+          Toggle loading state
+        </button>
+      </p>
+      <Output label={"Grid renders"}>{gridRenders}</Output>
     </div>
   );
 };
@@ -0,0 +1,125 @@
+/* eslint no-magic-numbers: 0 */
+import React, {useState, useEffect, useRef} from "react";
+
+import "./style.css";
+import {DashJsonGrid} from "../lib";
+
+/**
+ * Benchmark of the virtualized mode and the paged mode.
+ *
+ * Open the demo page with the hash `#benchmark`. Each case renders an array of
+ * table rows, and measures the time-to-interactive, i.e. the time from setting the
+ * data to the first idle moment after the browser paints the grid.
+ */
+
+const sizes = [1000, 10000, 100000];
+
+const modes = [
+  {name: "full", threshold: undefined, pageSize: undefined},
+  {name: "virtualized", threshold: 1000, pageSize: undefined},
+  {name: "paged", threshold: undefined, pageSize: 1000},
+];
+
+const makeData = (size) => {
+  const data = new Array(size);
+  for (let idx = 0; idx < size; idx++) {
+    data[idx] = {id: idx, type: `type-${idx % 7}`, value: idx * 0.5};
+  }
+  return data;
+};
+
+const Benchmark = () => {
+  const [current, setCurrent] = useState(null);
+  const [results, setResults] = useState([]);
+  const [running, setRunning] = useState(false);
+  const queue = useRef([]);
+  const tic = useRef(0);
+
+  const runNext = () => {
+    const next = queue.current.shift();
+    if (!next) {
+      setCurrent(null);
+      setRunning(false);
+      return;
+    }
+    // Unmount the previous grid before measuring the next case.
+    setCurrent(null);
+    setTimeout(() => {
+      next.data = makeData(next.size);
+      tic.current = performance.now();
+      setCurrent(next);
+    }, 100);
+  };
+
+  useEffect(() => {
+    if (!current) {
+      return;
+    }
+    requestAnimationFrame(() => {
+      setTimeout(() => {
+        const cost = performance.now() - tic.current;
+        const nodes = document.querySelectorAll("#benchmark-grid *").length;
+        setResults((prev) => [
+          ...prev,
+          {mode: current.mode.name, size: current.size, cost, nodes},
+        ]);
+        runNext();
+      }, 0);
+    });
+  }, [current]);
+
+  const start = () => {
+    queue.current = [];
+    sizes.forEach((size) => {
+      modes.forEach((mode) => {
+        queue.current.push({size, mode});
+      });
+    });
+    setResults([]);
+    setRunning(true);
+    runNext();
+  };
+
+  return (
+    <div>
+      <p>
+        <button onClick={start} disabled={running}>
+          Run benchmark
+        </button>
+      </p>
+      <table>
+        <thead>
+          <tr>
+            <th>Mode</th>
+            <th>Rows</th>
+            <th>Time-to-interactive (ms)</th>
+            <th>DOM nodes</th>
+          </tr>
+        </thead>
+        <tbody>
+          {results.map((res, idx) => (
+            <tr key={idx}>
+              <td>{res.mode}</td>
+              <td>{res.size}</td>
+              <td>{res.cost.toFixed(1)}</td>
+              <td>{res.nodes}</td>
+            </tr>
+          ))}
+        </tbody>
+      </table>
+      {current ? (
+        <DashJsonGrid
+          id="benchmark-grid"
+          setProps={() => {}}
+          data={current.data}
+          default_expand_depth={1}
+          virtualize_threshold={current.mode.threshold}
+          page_size={current.mode.pageSize}
+          style={{height: "60vh"}}
+        />
+      ) : null}
+    </div>
+  );
+};
+
+export default Benchmark;
@@ -1,5 +1,8 @@
 import React from "react";
 import ReactDOM from "react-dom";
 import App from "./App";
+import Benchmark from "./Benchmark";
 
-ReactDOM.render(<App />, document.getElementById("root"));
+const Page = window.location.hash === "#benchmark" ? Benchmark : App;
+
+ReactDOM.render(<Page />, document.getElementById("root"));
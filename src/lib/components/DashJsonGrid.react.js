@@ -35,6 +35,8 @@ DashJsonGrid.defaultProps = {
   selected_path: [],
   highlight_selected: true,
   theme: "default",
+  search_debounce: 300,
+  virtualize_overscan: 20,
 };
 
 DashJsonGrid.propTypes = {
@@ -65,6 +67,22 @@ DashJsonGrid.propTypes = {
     PropTypes.bool,
   ]).isRequired,
 
+  /**
+   * The key of `data` in a server-side store. It is not used by the grid viewer.
+   * Callbacks can use `State(..., "data_key")` to locate the data on the server
+   * rather than receive the whole `data` from the browser. See
+   * `dash_json_grid.store` for details.
+   */
+  data_key: PropTypes.string,
+
+  /**
+   * A list of patch operations applied to `data` in the browser. Each operation is
+   * `{"op": "add" | "remove" | "replace", "path": [str | int], "value": any}`. When
+   * the patch is applied, `data` is updated and this property is reset to `None`.
+   * See `dash_json_grid.patch` for details.
+   */
+  data_patch: PropTypes.array,
+
   /**
    * The depth to which the grid is expanded by default.
    */
@@ -76,6 +94,22 @@ DashJsonGrid.propTypes = {
    */
   default_expand_key_tree: PropTypes.object,
 
+  /**
+   * The patch highlighted in the grid, typically returned by
+   * `DashJsonGrid.diff(old, data)`. The added values and the replaced values are
+   * prefixed by `+` and `~`, and the removed keys of the objects are shown with `-`.
+   * See `dash_json_grid.diff` for details.
+   */
+  diff_highlight: PropTypes.array,
+
+  /**
+   * The route of the placeholder requested to be expanded. It is set when a
+   * placeholder in the skeleton data is selected. Callbacks can send the next level
+   * of the data to `data_patch` for expanding it. See `dash_json_grid.skeleton` for
+   * details.
+   */
+  expand_path: PropTypes.array,
+
   /**
    * `keyPath` captured by the `onSelect` method of the grid viewer. This value is a
    * sequence of indicies used for locating the element of the selected data.
@@ -106,10 +140,29 @@ DashJsonGrid.propTypes = {
   highlight_selected: PropTypes.bool,
 
   /**
-   * The text that needs to be searched in the JSON data.
+   * The text that needs to be searched in the JSON data. The matching reported by
+   * `search_results` runs in a Web Worker, but the data is copied (structured
+   * clone) to the worker each time it changes, which still costs main-thread time
+   * for huge data. The highlighting is drawn by the grid itself, which scans the
+   * rendered data on the main thread again. The highlighting is applied after the
+   * worker reports the results, and skipped if nothing is found.
    */
   search_text: PropTypes.string,
 
+  /**
+   * The delay (ms) between the last change of `search_text` and the search. The
+   * searches within the delay are merged.
+   */
+  search_debounce: PropTypes.number,
+
+  /**
+   * The results of the latest search reported by the search engine, as
+   * `{"text": str, "count": int, "routes": [route]}`. `count` is the number of all
+   * matches, and `routes` contains the routes of at most 1000 matches. It is `None`
+   * if `search_text` is empty.
+   */
+  search_results: PropTypes.object,
+
   /**
    * The theme (name) that needs to be applied. If a `Mapping` is specified, will
    * customize the color code of each part of grid viewer.
@@ -199,6 +252,28 @@ DashJsonGrid.propTypes = {
     }),
   ]),
 
+  /**
+   * If specified, the arrays longer than this size are shown as the collapsible
+   * index-range buckets like `[0..999]`. The selected path still uses the real
+   * indicies of the data.
+   */
+  page_size: PropTypes.number,
+
+  /**
+   * The row-count threshold of the virtualized mode. When the data is an array
+   * longer than this threshold, only the rows in the viewport are mounted. If not
+   * specified, the virtualized mode is disabled. The mounted rows are still shown
+   * as an array (or a table), where the indicies shown by the grid start from the
+   * first mounted row. The selected path uses the real indicies of the data.
+   */
+  virtualize_threshold: PropTypes.number,
+
+  /**
+   * The number of the extra rows mounted before and after the viewport in the
+   * virtualized mode.
+   */
+  virtualize_overscan: PropTypes.number,
+
   /**
    * Dash-assigned callback that should be called to report property changes
    * to Dash, to make them available for callbacks.
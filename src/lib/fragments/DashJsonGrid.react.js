@@ -18,10 +18,33 @@ import clsx from "clsx/lite";
 import JSONGrid from "@redheadphone/react-json-grid";
 
 import {propTypes, defaultProps} from "../components/DashJsonGrid.react";
-import {isArray, sanitizeData} from "../utils";
+import {
+  isArray,
+  sanitizeData,
+  applyDataPatch,
+  findPlaceholder,
+  renderPlaceholders,
+  expandColumnar,
+  highlightDiff,
+  isVirtualized,
+  getWindowRange,
+  makeWindowData,
+  remapWindowPath,
+  pageData,
+  remapPagedPath,
+  memoizeOne,
+  withRenderCount,
+} from "../utils";
+import {createSearchEngine} from "../search";
 
 import styles from "./DashJsonGrid.module.scss";
 
+/**
+ * The grid is re-rendered only when its properties are changed. The render count
+ * is recorded as `renderCounts.JSONGrid` in `utils`.
+ */
+const MemoJSONGrid = React.memo(withRenderCount(JSONGrid, "JSONGrid"));
+
 /**
  * DashJsonGrid is a Dash porting version for the React component:
  * `react-json-grid/JSONGrid`
@@ -32,7 +55,154 @@ import styles from "./DashJsonGrid.module.scss";
 export default class DashJsonGrid extends Component {
   constructor(props) {
     super(props);
+    this.state = {
+      firstRow: 0,
+      rowHeight: 24,
+      searchText: "",
+    };
+    this.searchTimer = null;
+    this.searchEngine = null;
+    this.containerRef = React.createRef();
+    this.windowRef = React.createRef();
+    this.windowRange = null;
     this.handleOnSelect = this.handleOnSelect.bind(this);
+    this.handleOnScroll = this.handleOnScroll.bind(this);
+    this.handleSearchResults = this.handleSearchResults.bind(this);
+    this.runSearch = this.runSearch.bind(this);
+
+    // Keep the references passed to the grid stable across the re-renders.
+    this.getTheme = memoizeOne(this.getTheme.bind(this));
+    this.sanitizeData = memoizeOne(sanitizeData);
+    this.highlightDiff = memoizeOne(highlightDiff);
+    this.makeWindowData = memoizeOne(makeWindowData);
+  }
+
+  componentDidMount() {
+    this.applyPatch();
+    this.measureRowHeight();
+    if (this.props.search_text) {
+      this.runSearch();
+    }
+  }
+
+  componentDidUpdate(prevProps) {
+    if (prevProps.data_patch !== this.props.data_patch) {
+      this.applyPatch();
+    }
+    this.measureRowHeight();
+    if (
+      prevProps.search_text !== this.props.search_text ||
+      (this.props.search_text && prevProps.data !== this.props.data)
+    ) {
+      this.scheduleSearch();
+    }
+  }
+
+  componentWillUnmount() {
+    clearTimeout(this.searchTimer);
+    if (this.searchEngine) {
+      this.searchEngine.dispose();
+      this.searchEngine = null;
+    }
+  }
+
+  /**
+   * Run the search after the debounce delay. The pending search is replaced.
+   */
+  scheduleSearch() {
+    clearTimeout(this.searchTimer);
+    this.searchTimer = setTimeout(this.runSearch, this.props.search_debounce);
+  }
+
+  /**
+   * Search the data by `search_text`. The matching is done by the search engine
+   * off the main thread. The grid highlighting is updated only when the engine
+   * reports the results.
+   */
+  runSearch() {
+    const {search_text, search_results, setProps} = this.props;
+    const data = expandColumnar(this.props.data);
+    this.searchTimer = null;
+    if (!search_text) {
+      if (this.state.searchText) {
+        this.setState({searchText: ""});
+      }
+      if (this.searchEngine) {
+        this.searchEngine.cancel();
+      }
+      if (search_results) {
+        setProps({search_results: null});
+      }
+      return;
+    }
+    if (!this.searchEngine) {
+      this.searchEngine = createSearchEngine(this.handleSearchResults);
+    }
+    this.searchEngine.search(data, search_text);
+  }
+
+  /**
+   * Handle the results reported by the search engine. The grid highlights the
+   * text only if the engine finds any match, so the grid does not scan the data
+   * for a text that is not found.
+   * @param {{text: string, count: number, routes: array}} results - The latest
+   * search results.
+   */
+  handleSearchResults(results) {
+    const searchText = results.count > 0 ? results.text : "";
+    if (this.state.searchText !== searchText) {
+      this.setState({searchText: searchText});
+    }
+    this.props.setProps({search_results: results});
+  }
+
+  /**
+   * Estimate the row height by the mounted rows in the virtualized mode. The
+   * estimation is used for locating the rows by the scrolling position.
+   */
+  measureRowHeight() {
+    const windowElement = this.windowRef.current;
+    const windowRange = this.windowRange;
+    if (!windowElement || !windowRange || windowRange.end <= windowRange.start) {
+      return;
+    }
+    const rowHeight =
+      windowElement.offsetHeight / (windowRange.end - windowRange.start);
+    if (rowHeight > 0 && Math.abs(rowHeight - this.state.rowHeight) >= 1) {
+      this.setState({rowHeight: rowHeight});
+    }
+  }
+
+  /**
+   * Handle the scrolling event of the container in the virtualized mode.
+   * @param {Event} event - The scrolling event.
+   */
+  handleOnScroll(event) {
+    const firstRow = Math.floor(
+      event.currentTarget.scrollTop / this.state.rowHeight
+    );
+    if (firstRow !== this.state.firstRow) {
+      this.setState({firstRow: firstRow});
+    }
+  }
+
+  /**
+   * Apply the property `data_patch` to `data`, and reset `data_patch`.
+   * If the patch fails, the data is not changed. The encoded tables of `data`
+   * are expanded before the patch is applied.
+   */
+  applyPatch() {
+    const {data_patch, setProps} = this.props;
+    const data = expandColumnar(this.props.data);
+    if (!isArray(data_patch)) {
+      return;
+    }
+    try {
+      setProps({data: applyDataPatch(data, data_patch), data_patch: null});
+    } catch (err) {
+      console.error(err);
+      setProps({data_patch: null});
+    }
   }
 
   /**
@@ -119,13 +289,94 @@ export default class DashJsonGrid extends Component {
    * (routing) the selected part of the data.
    */
   handleOnSelect(keyPath) {
-    const selectable = this.props.highlight_selected;
-    if (selectable) {
-      this.props.setProps({
-        selected_path: keyPath,
-        // selected_value: this.routeData(this.props.data, keyPath),
-      });
+    const {highlight_selected, page_size, virtualize_threshold, setProps} =
+      this.props;
+    const data = expandColumnar(this.props.data);
+    if (isVirtualized(pageData(data, page_size), virtualize_threshold)) {
+      keyPath = remapWindowPath(
+        keyPath,
+        this.windowRange ? this.windowRange.start : 0
+      );
+    }
+    keyPath = remapPagedPath(data, keyPath, page_size);
+    const newProps = {};
+    if (highlight_selected) {
+      newProps.selected_path = keyPath;
+      // newProps.selected_value = this.routeData(data, keyPath);
+    }
+    const expandPath = findPlaceholder(data, keyPath);
+    if (expandPath) {
+      newProps.expand_path = expandPath;
+    }
+    if (Object.keys(newProps).length > 0) {
+      setProps(newProps);
+    }
+  }
+
+  /**
+   * Render the grid. The tables in the columnar encoding are expanded, the
+   * changes of `diff_highlight` are marked, and the placeholders of the lazy data
+   * are shown as texts. If `page_size` is specified, the long arrays are shown as
+   * the index-range buckets. In the virtualized mode, only the rows in the
+   * viewport (with the overscan rows) are mounted, and the other rows are replaced
+   * by a spacer.
+   * @param {Object} gridProps - The properties passed to `<JSONGrid/>` except
+   * `data`.
+   * @returns {JSX.Element} The rendered grid.
+   */
+  renderGrid(gridProps) {
+    const {
+      diff_highlight,
+      page_size,
+      virtualize_threshold,
+      virtualize_overscan,
+    } = this.props;
+    const data = pageData(
+      renderPlaceholders(
+        this.highlightDiff(expandColumnar(this.props.data), diff_highlight)
+      ),
+      page_size
+    );
+
+    if (!isVirtualized(data, virtualize_threshold)) {
+      this.windowRange = null;
+      return <MemoJSONGrid data={this.sanitizeData(data)} {...gridProps} />;
     }
+
+    const {firstRow, rowHeight} = this.state;
+    const container = this.containerRef.current;
+    const viewportRows = Math.ceil(
+      ((container && container.clientHeight) || window.innerHeight) / rowHeight
+    );
+    const windowRange = getWindowRange(
+      firstRow,
+      viewportRows,
+      data.length,
+      virtualize_overscan
+    );
+    this.windowRange = windowRange;
+
+    return (
+      <div
+        className={styles["virtual-spacer"]}
+        style={{height: data.length * rowHeight}}
+      >
+        <div
+          ref={this.windowRef}
+          className={styles["virtual-window"]}
+          style={{top: windowRange.start * rowHeight}}
+        >
+          <MemoJSONGrid
+            data={this.makeWindowData(
+              data,
+              windowRange.start,
+              windowRange.end
+            )}
+            {...gridProps}
+          />
+        </div>
+      </div>
+    );
   }
 
   render() {
@@ -137,36 +388,43 @@ export default class DashJsonGrid extends Component {
       default_expand_depth,
       default_expand_key_tree,
       highlight_selected,
-      search_text,
       theme,
+      page_size,
+      virtualize_threshold,
       loading_state,
     } = this.props;
 
     const {themeName, customTheme} = this.getTheme(theme);
+    const virtualized = isVirtualized(
+      pageData(expandColumnar(data), page_size),
+      virtualize_threshold
+    );
 
     return (
       <div
         id={id}
+        ref={this.containerRef}
         className={clsx(
           styles["js-grid-container"],
           !highlight_selected && styles["no-select"],
+          virtualized && styles["virtualized"],
           class_name
         )}
         style={style}
+        onScroll={virtualized ? this.handleOnScroll : undefined}
         data-dash-is-loading={
           (loading_state && loading_state.is_loading) || undefined
         }
       >
-        <JSONGrid
-          data={sanitizeData(data)}
-          defaultExpandDepth={default_expand_depth}
-          defaultExpandKeyTree={default_expand_key_tree}
-          onSelect={this.handleOnSelect}
-          highlightSelected={highlight_selected}
-          searchText={search_text}
-          theme={themeName}
-          customTheme={customTheme}
-        />
+        {this.renderGrid({
+          defaultExpandDepth: default_expand_depth,
+          defaultExpandKeyTree: default_expand_key_tree,
+          onSelect: this.handleOnSelect,
+          highlightSelected: highlight_selected,
+          searchText: this.state.searchText,
+          theme: themeName,
+          customTheme: customTheme,
+        })}
       </div>
     );
   }
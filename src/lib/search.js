@@ -0,0 +1,229 @@
+/**
+ * Search
+ *
+ * The search engine running off the main thread.
+ *
+ * Author: Yuchen Jin (cainmagi)
+ * GitHub: https://github.com/cainmagi/dash-json-grid
+ * License: MIT
+ *
+ * Thanks the base project:
+ * https://github.com/RedHeadphone/react-json-grid
+ */
+
+/**
+ * The maximal number of the match routes reported by a search. The match count is
+ * not limited.
+ */
+export const SEARCH_ROUTES_LIMIT = 1000;
+
+/**
+ * The implementation of the search engine.
+ *
+ * This function is serialized as the source of a Web Worker, so it needs to be
+ * self-contained: it can not refer to anything outside its body, and it should
+ * avoid the syntax requiring the Babel helpers (spread, destructuring, `for...of`,
+ * `typeof`, and classes).
+ *
+ * Messages received:
+ * - `{type: "data", version, data}`: Replace the indexed data.
+ * - `{type: "search", id, version, text, limit}`: Search the indexed data.
+ * - `{type: "cancel", id}`: Cancel the searches older than `id`.
+ *
+ * Messages posted:
+ * - `{id, text, count, routes}`: The results of the search `id`.
+ *
+ * @param {Object} scope - The worker scope. It needs to provide `postMessage`, and
+ * its `onmessage` will be configured by this function.
+ */
+export const searchScope = (scope) => {
+  const chunkSize = 20000;
+  const toString = Object.prototype.toString;
+
+  // The flattened index of the data. Each entry is a value of the data. Its route
+  // is recovered by the parent entries only when it is reported.
+  let index = null;
+  let latest = 0;
+  // The results of the previous query. A query extending the previous query only
+  // needs to search the previous matches.
+  let previous = null;
+
+  const buildIndex = (version, data) => {
+    const parents = [];
+    const keys = [];
+    const texts = [];
+    const stack = [[-1, null, data]];
+    while (stack.length > 0) {
+      const item = stack.pop();
+      const value = item[2];
+      const entry = keys.length;
+      parents.push(item[0]);
+      keys.push(item[1]);
+      const keyText =
+        item[1] === null || toString.call(item[1]) === "[object Number]"
+          ? ""
+          : String(item[1]).toLowerCase();
+      const valueType = toString.call(value);
+      if (valueType === "[object Array]") {
+        texts.push(keyText);
+        for (let idx = value.length - 1; idx >= 0; idx--) {
+          stack.push([entry, idx, value[idx]]);
+        }
+      } else if (valueType === "[object Object]") {
+        texts.push(keyText);
+        const objKeys = Object.keys(value);
+        for (let idx = objKeys.length - 1; idx >= 0; idx--) {
+          stack.push([entry, objKeys[idx], value[objKeys[idx]]]);
+        }
+      } else {
+        texts.push(keyText + "\u0000" + String(value).toLowerCase());
+      }
+    }
+    return {version: version, parents: parents, keys: keys, texts: texts};
+  };
+
+  const getRoute = (entry) => {
+    const route = [];
+    let cur = entry;
+    while (index.parents[cur] >= 0) {
+      route.push(index.keys[cur]);
+      cur = index.parents[cur];
+    }
+    return route.reverse();
+  };
+
+  const search = (message) => {
+    const text = String(message.text).toLowerCase();
+    const candidates =
+      previous !== null &&
+      previous.version === index.version &&
+      text.indexOf(previous.text) === 0
+        ? previous.matches
+        : null;
+    const total = candidates === null ? index.texts.length : candidates.length;
+    const matches = [];
+    let pos = 0;
+
+    const step = () => {
+      if (message.id !== latest) {
+        return;
+      }
+      const end = Math.min(total, pos + chunkSize);
+      for (; pos < end; pos++) {
+        const entry = candidates === null ? pos : candidates[pos];
+        if (index.texts[entry].indexOf(text) >= 0) {
+          matches.push(entry);
+        }
+      }
+      if (pos < total) {
+        setTimeout(step, 0);
+        return;
+      }
+      previous = {version: index.version, text: text, matches: matches};
+      const routes = [];
+      const limit = Math.min(matches.length, message.limit);
+      for (let idx = 0; idx < limit; idx++) {
+        routes.push(getRoute(matches[idx]));
+      }
+      scope.postMessage({
+        id: message.id,
+        text: message.text,
+        count: matches.length,
+        routes: routes,
+      });
+    };
+    step();
+  };
+
+  scope.onmessage = (event) => {
+    const message = event.data;
+    if (message.type === "data") {
+      index = buildIndex(message.version, message.data);
+      previous = null;
+    } else if (message.type === "cancel") {
+      latest = message.id;
+    } else if (message.type === "search") {
+      latest = message.id;
+      if (index !== null && index.version === message.version) {
+        search(message);
+      }
+    }
+  };
+};
+
+/**
+ * Create a search engine. The engine runs in a Web Worker. If the worker is not
+ * available, the engine runs on the main thread, where the search is still split
+ * into small chunks.
+ * @param {Function} onResults - The callback receiving the latest results
+ * `{text, count, routes}`. The results of the cancelled searches are dropped.
+ * @returns {{
+ *   search: Function, cancel: Function, dispose: Function
+ * }} The engine. `search(data, text)` starts a new search and cancels the previous
+ * one. The data is sent to the engine only when its identity changes.
+ */
+export const createSearchEngine = (onResults) => {
+  let latest = 0;
+  let version = 0;
+  let lastData;
+  let worker = null;
+  let post;
+
+  const handleResults = (results) => {
+    if (results.id === latest) {
+      onResults({
+        text: results.text,
+        count: results.count,
+        routes: results.routes,
+      });
+    }
+  };
+
+  try {
+    const url = URL.createObjectURL(
+      new Blob(["(" + searchScope.toString() + ")(self);"], {
+        type: "text/javascript",
+      })
+    );
+    worker = new Worker(url);
+    URL.revokeObjectURL(url);
+    worker.onmessage = (event) => handleResults(event.data);
+    post = (message) => worker.postMessage(message);
+  } catch (err) {
+    worker = null;
+    const scope = {
+      postMessage: (message) => setTimeout(() => handleResults(message), 0),
+    };
+    searchScope(scope);
+    post = (message) => scope.onmessage({data: message});
+  }
+
+  return {
+    search: (data, text) => {
+      if (version === 0 || data !== lastData) {
+        version += 1;
+        lastData = data;
+        post({type: "data", version: version, data: data});
+      }
+      latest += 1;
+      post({
+        type: "search",
+        id: latest,
+        version: version,
+        text: text,
+        limit: SEARCH_ROUTES_LIMIT,
+      });
+    },
+    cancel: () => {
+      latest += 1;
+      post({type: "cancel", id: latest});
+    },
+    dispose: () => {
+      latest += 1;
+      lastData = undefined;
+      if (worker !== null) {
+        worker.terminate();
+      }
+    },
+  };
+};
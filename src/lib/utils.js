@@ -11,6 +11,7 @@
  * https://github.com/RedHeadphone/react-json-grid
  */
 
+import React from "react";
 import {type} from "ramda";
 
 export const isArray =
@@ -32,3 +33,748 @@ export const sanitizeData = (data) => {
 
   return [data];
 };
+
+/**
+ * Get the key used for accessing one level of the data by a patch path element.
+ * @param {object | array} data - The container of this level.
+ * @param {string | number | array} index - The path element. A one-element array
+ * is the same as its only element.
+ * @returns {string | number} The object key, or the non-negative array index.
+ * Appending to an array is represented by the array length.
+ */
+const getPatchKey = (data, index) => {
+  const key = isArray(index) ? index[0] : index;
+  if (!isArray(data)) {
+    return key;
+  }
+  if (key === "-") {
+    return data.length;
+  }
+  const arrayIndex = Number(key);
+  if (!Number.isInteger(arrayIndex)) {
+    throw new TypeError(`Index ${key} does not match the type of the data.`);
+  }
+  return arrayIndex < 0 ? arrayIndex + data.length : arrayIndex;
+};
+
+/**
+ * Check whether a patch path element locates a table column of the data. A
+ * column is located by a one-element array with a string key, like `["type"]`.
+ * @param {object | array} data - The container of this level.
+ * @param {string | number | array} index - The path element.
+ * @returns {boolean} `true` if `index` locates a column of the array `data`.
+ */
+const isColumnIndex = (data, index) => {
+  return isArray(data) && isArray(index) && type(index[0]) === "String";
+};
+
+/**
+ * Apply one patch operation to a table column. The rows are copied only if they
+ * are changed. A replaced column is broadcast in the same way as
+ * `update_data_by_route` on the server.
+ * @param {array} data - The table where the column is located.
+ * @param {{op: string, path: array, value: any}} operation - The patch operation.
+ * @param {string} key - The column key.
+ * @returns {array} The patched copy of the table.
+ */
+const patchColumn = (data, operation, key) => {
+  const isRow = (row) => type(row) === "Object";
+  if (operation.op === "remove") {
+    return data.map((row) => {
+      if (!isRow(row) || !Object.prototype.hasOwnProperty.call(row, key)) {
+        return row;
+      }
+      const copied = {...row};
+      delete copied[key];
+      return copied;
+    });
+  }
+  const value = operation.value;
+  if (!isArray(value)) {
+    return data.map((row) => (isRow(row) ? {...row, [key]: value} : row));
+  }
+  const nRows = data.filter(isRow).length;
+  const nColumn = data.filter(
+    (row) => isRow(row) && Object.prototype.hasOwnProperty.call(row, key)
+  ).length;
+  let pos = 0;
+  let getValue;
+  if (value.length === nRows) {
+    getValue = () => value[pos++];
+  } else if (value.length === nColumn) {
+    getValue = (row) =>
+      Object.prototype.hasOwnProperty.call(row, key) ? value[pos++] : undefined;
+  } else if (nRows > 1 && value.length === 1) {
+    getValue = () => value[0];
+  } else {
+    throw new RangeError(
+      `The value does not match the length of the table column ${key}.`
+    );
+  }
+  return data.map((row) => {
+    if (!isRow(row)) {
+      return row;
+    }
+    const item = getValue(row);
+    return item === undefined ? row : {...row, [key]: item};
+  });
+};
+
+/**
+ * Check that a key locates an existing item of the data, in the same way as
+ * `apply_data_patch` on the server.
+ * @param {object | array} data - The container of this level.
+ * @param {string | number} key - The key returned by `getPatchKey`.
+ * @param {string | number | array} index - The path element, used by the error
+ * messages.
+ * @param {boolean} allowNewKey - Whether a missing object key is allowed. It is
+ * `true` when the key is replaced, where a new key is added to the object.
+ */
+const checkPatchKey = (data, key, index, allowNewKey) => {
+  if (isArray(data)) {
+    if (key < 0 || key >= data.length) {
+      throw new RangeError(`The index ${index} is out of the range of the array.`);
+    }
+  } else if (!allowNewKey && !Object.prototype.hasOwnProperty.call(data, key)) {
+    throw new Error(`The key ${key} is not found in the data.`);
+  }
+};
+
+/**
+ * Apply one patch operation to one level of the data. Only the containers along
+ * the path are copied, the other parts of the data are shared with the original.
+ * @param {object | array} data - The data of the current level.
+ * @param {{op: string, path: array, value: any}} operation - The patch operation.
+ * @param {number} pos - The position of the current level in the path.
+ * @returns {object | array} The patched copy of the current level.
+ */
+const patchLevel = (data, operation, pos) => {
+  if (!["Object", "Array"].includes(type(data))) {
+    throw new TypeError("Fail to locate the data, because the data is immutable.");
+  }
+  const path = operation.path;
+  if (isColumnIndex(data, path[pos])) {
+    return patchColumn(data, operation, path[pos][0]);
+  }
+  const key = getPatchKey(data, path[pos]);
+  const isLast = pos === path.length - 1;
+  if (!(isLast && operation.op === "add")) {
+    checkPatchKey(data, key, path[pos], isLast && operation.op !== "remove");
+  }
+  const copied = isArray(data) ? data.slice() : {...data};
+  if (!isLast) {
+    copied[key] = patchLevel(data[key], operation, pos + 1);
+    return copied;
+  }
+  if (operation.op === "remove") {
+    if (isArray(copied)) {
+      copied.splice(key, 1);
+    } else {
+      delete copied[key];
+    }
+  } else if (operation.op === "add" && isArray(copied)) {
+    copied.splice(key, 0, operation.value);
+  } else {
+    copied[key] = operation.value;
+  }
+  return copied;
+};
+
+/**
+ * Apply a patch to the data without modifying the original data.
+ * @param {any} data - The whole data to be patched.
+ * @param {array} patch - A list of patch operations. Each operation is
+ * `{op: "add" | "remove" | "replace", path: array, value: any}`.
+ * @returns {any} The patched data. If the patch is empty, return `data` directly.
+ * If a path does not locate an existing item (except for the added items and the
+ * replaced object keys), an error is thrown, and `data` is not changed.
+ */
+export const applyDataPatch = (data, patch) => {
+  if (!isArray(patch)) {
+    return data;
+  }
+  return patch.reduce((curData, operation) => {
+    if (type(operation) !== "Object" || !isArray(operation.path)) {
+      return curData;
+    }
+    if (operation.path.length === 0) {
+      return operation.op === "remove" ? null : operation.value;
+    }
+    return patchLevel(curData, operation, 0);
+  }, data);
+};
+
+/**
+ * The key marking a placeholder of the lazy skeleton data.
+ */
+export const PLACEHOLDER_TYPE_KEY = "__djg_type__";
+
+/**
+ * The key of the placeholder of the truncated items in a summarized object.
+ */
+export const PLACEHOLDER_MORE_KEY = "__djg_more__";
+
+const placeholderTypes = ["object", "array", "string", "more"];
+
+/**
+ * Check whether the value is a placeholder of the lazy data or not.
+ * @param {any} value - The value to be checked.
+ * @returns {boolean} `true` if the value is a placeholder.
+ */
+export const isPlaceholder = (value) => {
+  return (
+    type(value) === "Object" &&
+    placeholderTypes.includes(value[PLACEHOLDER_TYPE_KEY])
+  );
+};
+
+/**
+ * Get the route requested for expanding a placeholder. The truncated items of a
+ * container are requested by the route of the container followed by
+ * `PLACEHOLDER_MORE_KEY` and the offset of the first truncated item, so only the
+ * next items are loaded.
+ * @param {Object} placeholder - The placeholder.
+ * @param {array} route - The route of the placeholder.
+ * @returns {array} The route to be expanded.
+ */
+const getPlaceholderRoute = (placeholder, route) => {
+  if (placeholder[PLACEHOLDER_TYPE_KEY] !== "more") {
+    return route.slice();
+  }
+  const offset = placeholder.offset;
+  return type(offset) === "Number"
+    ? [...route.slice(0, -1), PLACEHOLDER_MORE_KEY, offset]
+    : route.slice(0, -1);
+};
+
+/**
+ * Find the placeholder passed by a route.
+ * @param {any} data - The whole data maintained by the component.
+ * @param {array} route - The route of the selected part of the data.
+ * @returns {array | null} The route requested for expanding the first placeholder
+ * on the way of `route`. If no placeholder is found, return `null`.
+ */
+export const findPlaceholder = (data, route) => {
+  if (!isArray(route)) {
+    return null;
+  }
+  let curData = data;
+  for (let pos = 0; pos < route.length; pos++) {
+    if (isPlaceholder(curData)) {
+      return getPlaceholderRoute(curData, route.slice(0, pos));
+    }
+    const index = route[pos];
+    if (isArray(index) || !["Object", "Array"].includes(type(curData))) {
+      return null;
+    }
+    curData = curData[index];
+  }
+  return isPlaceholder(curData) ? getPlaceholderRoute(curData, route) : null;
+};
+
+/**
+ * The cache of the rendered placeholders. Each container of the data is rendered
+ * only once, so the unchanged parts of the data share the rendered results.
+ */
+const placeholderCache = new WeakMap();
+
+/**
+ * Get the readable text of a placeholder.
+ * @param {Object} placeholder - The placeholder.
+ * @returns {string} The text shown in the grid.
+ */
+const getPlaceholderText = (placeholder) => {
+  const length = placeholder.length;
+  switch (placeholder[PLACEHOLDER_TYPE_KEY]) {
+    case "object":
+      return `{\u2026} (${length} keys)`;
+    case "array":
+      return `[\u2026] (${length} items)`;
+    case "string":
+      return `${placeholder.preview}\u2026 (${length} chars)`;
+    default:
+      return `\u2026 ${length} more items`;
+  }
+};
+
+/**
+ * Replace the placeholders of the lazy data by their readable texts, e.g.
+ * `[…] (1000 items)`. The routes of the other values are not changed.
+ * @param {any} data - The data to be rendered.
+ * @returns {any} The rendered data. If there is no placeholder, return `data`
+ * directly.
+ */
+export const renderPlaceholders = (data) => {
+  const dataType = type(data);
+  if (!["Object", "Array"].includes(dataType)) {
+    return data;
+  }
+  if (isPlaceholder(data)) {
+    return getPlaceholderText(data);
+  }
+  if (placeholderCache.has(data)) {
+    return placeholderCache.get(data);
+  }
+  let result;
+  if (dataType === "Array") {
+    const rendered = data.map(renderPlaceholders);
+    result = rendered.every((value, idx) => value === data[idx])
+      ? data
+      : rendered;
+  } else {
+    let changed = false;
+    const rendered = {};
+    Object.entries(data).forEach(([key, value]) => {
+      rendered[key] = renderPlaceholders(value);
+      changed = changed || rendered[key] !== value;
+    });
+    result = changed ? rendered : data;
+  }
+  placeholderCache.set(data, result);
+  return result;
+};
+
+/**
+ * The key of the column names of a table in the columnar encoding.
+ */
+export const COLUMNAR_KEY = "__djg_columns__";
+
+/**
+ * Check whether the value is a table in the columnar encoding or not.
+ * @param {any} value - The value to be checked.
+ * @returns {boolean} `true` if the value is an encoded table.
+ */
+export const isColumnar = (value) => {
+  return type(value) === "Object" && isArray(value[COLUMNAR_KEY]);
+};
+
+/**
+ * The cache of the expanded data. Each container of the data is expanded only
+ * once, so the unchanged parts of the data share the expanded results.
+ */
+const columnarCache = new WeakMap();
+
+/**
+ * Convert an encoded table to the rows. The values are expanded recursively.
+ * @param {Object} table - The table in the columnar encoding, i.e.
+ * `{__djg_columns__: [string], length: number, values: [array], missing:
+ * [[number]]}`, where `missing` contains the indicies of the rows not having
+ * each column.
+ * @returns {Object[]} The rows of the table.
+ */
+const expandTable = (table) => {
+  const columns = table[COLUMNAR_KEY];
+  const values = table.values || [];
+  const missing = table.missing || [];
+  const rows = [];
+  for (let idx = 0; idx < table.length; idx++) {
+    rows.push({});
+  }
+  columns.forEach((key, col) => {
+    const colValues = values[col] || [];
+    const colMissing =
+      isArray(missing[col]) && missing[col].length > 0
+        ? new Set(missing[col])
+        : null;
+    rows.forEach((row, idx) => {
+      if (!colMissing || !colMissing.has(idx)) {
+        row[key] = expandColumnar(colValues[idx]);
+      }
+    });
+  });
+  return rows;
+};
+
+/**
+ * Expand the tables in the columnar encoding, which is made by
+ * `DashJsonGrid.encode_tables(...)` on the server. The other values are not
+ * changed.
+ * @param {any} data - The data with the encoded tables.
+ * @returns {any} The expanded data. If there is no encoded table, return `data`
+ * directly.
+ */
+export const expandColumnar = (data) => {
+  const dataType = type(data);
+  if (!["Object", "Array"].includes(dataType)) {
+    return data;
+  }
+  if (columnarCache.has(data)) {
+    return columnarCache.get(data);
+  }
+  let result;
+  if (isColumnar(data)) {
+    result = expandTable(data);
+  } else if (dataType === "Array") {
+    const expanded = data.map(expandColumnar);
+    result = expanded.every((value, idx) => value === data[idx])
+      ? data
+      : expanded;
+  } else {
+    let changed = false;
+    const expanded = {};
+    Object.entries(data).forEach(([key, value]) => {
+      expanded[key] = expandColumnar(value);
+      changed = changed || expanded[key] !== value;
+    });
+    result = changed ? expanded : data;
+  }
+  columnarCache.set(data, result);
+  return result;
+};
+
+/**
+ * The marks of the values highlighted by the diff-highlight mode.
+ */
+export const DIFF_MARKS = {add: "+ ", replace: "~ ", remove: "- "};
+
+/**
+ * Mark a value and all scalar values inside it.
+ * @param {any} value - The value to be marked.
+ * @param {string} mark - The mark prefixed to the texts of the scalar values.
+ * @returns {any} The marked copy of the value.
+ */
+const markValue = (value, mark) => {
+  const valueType = type(value);
+  if (valueType === "Array") {
+    return value.map((item) => markValue(item, mark));
+  }
+  if (valueType === "Object") {
+    const marked = {};
+    Object.entries(value).forEach(([key, item]) => {
+      marked[key] = markValue(item, mark);
+    });
+    return marked;
+  }
+  return mark + (valueType === "String" ? value : JSON.stringify(value));
+};
+
+/**
+ * Mark the part of one level of the data located by a patch operation. Only the
+ * containers along the path are copied. The paths not found in the data are
+ * ignored.
+ * @param {any} data - The data of the current level.
+ * @param {{op: string, path: array}} operation - The highlighted operation.
+ * @param {number} pos - The position of the current level in the path.
+ * @returns {any} The marked copy of the current level.
+ */
+const markLevel = (data, operation, pos) => {
+  const dataType = type(data);
+  if (!["Object", "Array"].includes(dataType)) {
+    return data;
+  }
+  const path = operation.path;
+  const isLast = pos === path.length - 1;
+  const mark = DIFF_MARKS[operation.op] || DIFF_MARKS.replace;
+  if (isColumnIndex(data, path[pos])) {
+    const key = path[pos][0];
+    return data.map((row) => {
+      if (type(row) !== "Object") {
+        return row;
+      }
+      if (operation.op === "remove") {
+        return {...row, [key]: mark.trim()};
+      }
+      return Object.prototype.hasOwnProperty.call(row, key)
+        ? {...row, [key]: markValue(row[key], mark)}
+        : row;
+    });
+  }
+  const index = isArray(path[pos]) ? path[pos][0] : path[pos];
+  const isFound =
+    dataType === "Array"
+      ? Number.isInteger(Number(index)) &&
+        Number(index) >= 0 &&
+        Number(index) < data.length
+      : Object.prototype.hasOwnProperty.call(data, index);
+  if (!isFound) {
+    if (isLast && operation.op === "remove" && dataType === "Object") {
+      return {...data, [index]: mark.trim()};
+    }
+    return data;
+  }
+  if (isLast && operation.op === "remove") {
+    return data;
+  }
+  const copied = dataType === "Array" ? data.slice() : {...data};
+  copied[index] = isLast
+    ? markValue(data[index], mark)
+    : markLevel(data[index], operation, pos + 1);
+  return copied;
+};
+
+/**
+ * Highlight the changes of a patch in the data. The scalar values added or
+ * replaced by the patch are prefixed by `+` or `~`, and the removed keys of the
+ * objects are shown with `-`. The removed items of the arrays are not shown, so
+ * the routes of the other values are not changed.
+ * @param {any} data - The data after the patch is applied.
+ * @param {array} patch - The patch, typically returned by `DashJsonGrid.diff`.
+ * @returns {any} The highlighted data. If the patch is empty, return `data`
+ * directly.
+ */
+export const highlightDiff = (data, patch) => {
+  if (!isArray(patch)) {
+    return data;
+  }
+  return patch.reduce((curData, operation) => {
+    if (type(operation) !== "Object" || !isArray(operation.path)) {
+      return curData;
+    }
+    if (operation.path.length === 0) {
+      return operation.op === "remove"
+        ? curData
+        : markValue(curData, DIFF_MARKS[operation.op] || DIFF_MARKS.replace);
+    }
+    return markLevel(curData, operation, 0);
+  }, data);
+};
+
+/**
+ * Check whether the data needs to be rendered in the virtualized mode.
+ * @param {any} data - The whole data maintained by the component.
+ * @param {number} threshold - The row-count threshold. If not positive, the
+ * virtualized mode is disabled.
+ * @returns {boolean} `true` if `data` is an array longer than `threshold`.
+ */
+export const isVirtualized = (data, threshold) => {
+  return isArray(data) && threshold > 0 && data.length > threshold;
+};
+
+/**
+ * Get the range of the rows to be mounted in the virtualized mode.
+ * @param {number} firstRow - The index of the first row in the viewport.
+ * @param {number} viewportRows - The number of the rows fitting the viewport.
+ * @param {number} length - The number of all rows.
+ * @param {number} overscan - The number of the extra rows mounted before and after
+ * the viewport.
+ * @returns {{start: number, end: number}} The range of the mounted rows, where the
+ * `end` row is excluded.
+ */
+export const getWindowRange = (firstRow, viewportRows, length, overscan) => {
+  const padding = Math.max(0, Math.floor(overscan) || 0);
+  const start = Math.max(0, Math.min(firstRow, length - viewportRows) - padding);
+  const end = Math.min(length, firstRow + viewportRows + padding);
+  return {start: start, end: Math.max(start, end)};
+};
+
+/**
+ * Get the mounted rows in the virtualized mode. The rows are kept in an array, so
+ * a list of objects is still shown as a table by the grid.
+ * @param {array} data - The whole data maintained by the component.
+ * @param {number} start - The first mounted row.
+ * @param {number} end - The end of the mounted rows (excluded).
+ * @returns {array} The mounted rows, where the row `idx` of the whole data is the
+ * item `idx - start`.
+ */
+export const makeWindowData = (data, start, end) => {
+  return data.slice(start, end);
+};
+
+/**
+ * Convert the selected route of the mounted rows to the route of the whole data.
+ * @param {array} keyPath - The route provided by the grid rendering the mounted
+ * rows, where the first element is the index in the mounted rows.
+ * @param {number} start - The first mounted row.
+ * @returns {array} The route where the first element is the real row index.
+ */
+export const remapWindowPath = (keyPath, start) => {
+  if (!isArray(keyPath) || keyPath.length === 0 || isArray(keyPath[0])) {
+    return keyPath;
+  }
+  const index = Number(keyPath[0]);
+  if (!Number.isInteger(index)) {
+    return keyPath;
+  }
+  return [index + start, ...keyPath.slice(1)];
+};
+
+/**
+ * The cache of the paged data. Each container of the data is paged only once for
+ * the same page size, so the unchanged parts of the data share the paged results.
+ */
+const pagedCache = new WeakMap();
+
+const rePageLabel = /^\[(\d+)\.\.(\d+)\]$/;
+
+/**
+ * Define a property whose value is computed when it is accessed for the first
+ * time. The computed value replaces the getter.
+ * @param {Object} target - The object where the property is defined.
+ * @param {string} key - The name of the property.
+ * @param {Function} compute - The function computing the value.
+ */
+const defineLazy = (target, key, compute) => {
+  Object.defineProperty(target, key, {
+    configurable: true,
+    enumerable: true,
+    get: () => {
+      const value = compute();
+      Object.defineProperty(target, key, {
+        configurable: true,
+        enumerable: true,
+        writable: true,
+        value: value,
+      });
+      return value;
+    },
+  });
+};
+
+/**
+ * Split the items `[start, end)` of an array into index-range buckets. If there
+ * are too many buckets, they are grouped by larger buckets recursively.
+ * The content of each bucket is built only when the grid reads the bucket, so
+ * paging a new version of a long array only creates the top-level buckets, and
+ * the items of the buckets that are not shown are not visited.
+ * @param {array} data - The array to be paged.
+ * @param {number} start - The first item of the range.
+ * @param {number} end - The end of the range (excluded).
+ * @param {number} pageSize - The maximal number of the items in each bucket.
+ * @returns {Object.<string, any>} The buckets keyed by labels like `[0..999]`.
+ */
+const pageArray = (data, start, end, pageSize) => {
+  let span = pageSize;
+  while (span * pageSize < end - start) {
+    span *= pageSize;
+  }
+  const buckets = {};
+  for (let bucketStart = start; bucketStart < end; bucketStart += span) {
+    const bucketEnd = Math.min(end, bucketStart + span);
+    const label = `[${bucketStart}..${bucketEnd - 1}]`;
+    defineLazy(buckets, label, () =>
+      span === pageSize
+        ? data
+            .slice(bucketStart, bucketEnd)
+            .map((value) => pageData(value, pageSize))
+        : pageArray(data, bucketStart, bucketEnd, pageSize)
+    );
+  }
+  return buckets;
+};
+
+/**
+ * Convert the arrays longer than `pageSize` to the index-range buckets.
+ * @param {any} data - The data to be paged.
+ * @param {number} pageSize - The maximal number of the items shown in each level.
+ * If not positive, the paging is disabled.
+ * @returns {any} The paged data. If nothing is paged, return `data` directly.
+ */
+export const pageData = (data, pageSize) => {
+  if (!(pageSize > 0)) {
+    return data;
+  }
+  const dataType = type(data);
+  if (!["Object", "Array"].includes(dataType)) {
+    return data;
+  }
+  const cached = pagedCache.get(data);
+  if (cached && cached.pageSize === pageSize) {
+    return cached.result;
+  }
+  let result;
+  if (dataType === "Array" && data.length > pageSize) {
+    result = pageArray(data, 0, data.length, pageSize);
+  } else if (dataType === "Array") {
+    const paged = data.map((value) => pageData(value, pageSize));
+    result = paged.every((value, idx) => value === data[idx]) ? data : paged;
+  } else {
+    let changed = false;
+    const paged = {};
+    Object.entries(data).forEach(([key, value]) => {
+      paged[key] = pageData(value, pageSize);
+      changed = changed || paged[key] !== value;
+    });
+    result = changed ? paged : data;
+  }
+  pagedCache.set(data, {pageSize: pageSize, result: result});
+  return result;
+};
+
+/**
+ * Convert the selected route of the paged data to the route of the original data.
+ * @param {any} data - The original data before paging.
+ * @param {array} keyPath - The route provided by the grid rendering the paged data.
+ * @param {number} pageSize - The page size used for paging the data.
+ * @returns {array} The route where the buckets are replaced by the real indicies.
+ * If a bucket is selected, return the route of the paged array.
+ */
+export const remapPagedPath = (data, keyPath, pageSize) => {
+  if (!(pageSize > 0) || !isArray(keyPath)) {
+    return keyPath;
+  }
+  const route = [];
+  let curData = data;
+  let pos = 0;
+  while (pos < keyPath.length) {
+    let index = keyPath[pos];
+    pos++;
+    if (isArray(curData) && curData.length > pageSize && !isArray(index)) {
+      let offset = null;
+      let match = rePageLabel.exec(String(index));
+      while (match) {
+        offset = Number(match[1]);
+        if (pos >= keyPath.length) {
+          return route;
+        }
+        index = keyPath[pos];
+        pos++;
+        match = isArray(index) ? null : rePageLabel.exec(String(index));
+      }
+      if (offset !== null && !isArray(index)) {
+        index = offset + Number(index);
+      }
+    }
+    route.push(index);
+    if (isArray(index) || !["Object", "Array"].includes(type(curData))) {
+      return route.concat(keyPath.slice(pos));
+    }
+    curData = curData[index];
+  }
+  return route;
+};
+
+/**
+ * Memoize the latest call of a function. The cached result is reused if all
+ * arguments are identical (`===`) to those of the latest call.
+ * @param {Function} func - The function to be memoized.
+ * @returns {Function} The memoized function.
+ */
+export const memoizeOne = (func) => {
+  let lastArgs = null;
+  let lastResult;
+  return (...args) => {
+    if (
+      lastArgs !== null &&
+      args.length === lastArgs.length &&
+      args.every((arg, idx) => arg === lastArgs[idx])
+    ) {
+      return lastResult;
+    }
+    lastResult = func(...args);
+    lastArgs = args;
+    return lastResult;
+  };
+};
+
+/**
+ * The numbers of the renders counted by `withRenderCount`. It is used for
+ * checking whether a component is re-rendered unnecessarily.
+ */
+export const renderCounts = {};
+
+/**
+ * Instrument a component by counting its renders.
+ * @param {React.ComponentType} Component - The component to be instrumented.
+ * @param {string} name - The key of the count in `renderCounts`.
+ * @returns {React.ComponentType} The instrumented component. Its render count is
+ * increased each time it is rendered.
+ */
+export const withRenderCount = (Component, name) => {
+  renderCounts[name] = 0;
+  const Counted = (props) => {
+    renderCounts[name] += 1;
+    return React.createElement(Component, props);
+  };
+  Counted.displayName = `withRenderCount(${name})`;
+  return Counted;
+};
@@ -0,0 +1,57 @@
+# -*- coding: UTF-8 -*-
+"""
+Fixtures
+========
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The fixtures shared by the tests of the data routes. Each test gets a newly
+decoded copy of the testing data, so the tests can modify the data freely.
+"""
+
+import os
+import json
+import logging
+from typing import Any
+
+try:
+    from typing import Generator
+except ImportError:
+    from collections.abc import Generator
+
+import pytest
+
+
+def _read_data_file(name: str) -> Generator[str, None, None]:
+    """Read the json-string formatted data from a testing file."""
+    log = logging.getLogger("dash_json_grid.test")
+    log.info("Initialize the JSON data: {0}".format(name))
+    with open(os.path.join(os.path.dirname(__file__), name), "r") as fobj:
+        _data = fobj.read()
+    yield _data
+    log.info("Remove the JSON data: {0}".format(name))
+    del _data
+
+
+@pytest.fixture(scope="session")
+def data_json() -> Generator[str, None, None]:
+    """Fixture: Get the json-string formatted data of `data.json`."""
+    yield from _read_data_file("data.json")
+
+
+@pytest.fixture(scope="session")
+def data_incomplete_json() -> Generator[str, None, None]:
+    """Fixture: Get the json-string formatted data of `data_incomplete.json`."""
+    yield from _read_data_file("data_incomplete.json")
+
+
+@pytest.fixture(scope="function")
+def data(data_json: str) -> Generator[Any, None, None]:
+    """Fixture: Get the pre-loaded data in the original state."""
+    yield json.loads(data_json)
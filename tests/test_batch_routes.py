@@ -0,0 +1,136 @@
+# -*- coding: UTF-8 -*-
+"""
+Batch routes
+============
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the batch operations of the data routes. The results need to be the
+same as calling the single-route methods one by one.
+"""
+
+import copy
+import logging
+from typing import Any
+
+import pytest
+
+import dash_json_grid
+
+from . import utils
+
+
+__all__ = ("TestBatchRoutes",)
+
+
+class TestBatchRoutes:
+    """Test the batch operations of the routes."""
+
+    def test_batch_routes_get(self, data: Any) -> None:
+        """Test getting the values by several routes."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        routes = (
+            ["batters", "batter", 0, "id"],
+            ["batters", "batter", 2],
+            ["topping", ["type"]],
+            ["batters", "batter", "0", "type"],
+            ["name"],
+            [],
+        )
+        vals = dash_json_grid.DashJsonGrid.get_many(data, routes)
+        assert len(vals) == len(routes)
+        for route, val in zip(routes, vals):
+            assert utils.is_eq(
+                val, dash_json_grid.DashJsonGrid.get_data_by_route(data, route)
+            )
+        log.info("Successfully get the data by several routes.")
+
+        with pytest.raises(KeyError, match="undefined"):
+            dash_json_grid.DashJsonGrid.get_many(data, (["name"], ["undefined"]))
+        log.info("Successfully raise the error of an invalid route.")
+
+    def test_batch_routes_update(self, data: Any) -> None:
+        """Test updating the values by several routes."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        data_ref = copy.deepcopy(data)
+        updates = (
+            (["batters", "batter", 1], {"id": "9998", "type": "Modified"}),
+            (["batters", "batter", 1, "type"], "Modified twice"),
+            (["batters", "batter", 0, "id"], "9999"),
+            (["topping", ["id"]], "0000"),
+            (["ppu"], 1.0),
+            (["ppu"], 2.0),
+        )
+        assert dash_json_grid.DashJsonGrid.update_many(data, updates) is data
+        for route, val in updates:
+            dash_json_grid.DashJsonGrid.update_data_by_route(
+                data_ref, route, copy.deepcopy(val)
+            )
+        assert data == data_ref
+        assert data["batters"]["batter"][1]["type"] == "Modified twice"
+        assert data["ppu"] == 2.0
+        log.info("Successfully update the data by several routes.")
+
+        data_ref = copy.deepcopy(data)
+        updates = (
+            (["topping", 1, "type"], "Cell first"),
+            (["topping", ["type"]], "Column"),
+            (["topping", 2, "type"], "Cell last"),
+            (["topping", 3, "id"], "Other"),
+            (["topping", ["id"]], {3: "Column"}),
+        )
+        dash_json_grid.DashJsonGrid.update_many(data, updates)
+        for route, val in updates:
+            dash_json_grid.DashJsonGrid.update_data_by_route(data_ref, route, val)
+        assert data == data_ref
+        assert data["topping"][1]["type"] == "Column"
+        assert data["topping"][2]["type"] == "Cell last"
+        assert data["topping"][3]["id"] == "Column"
+        log.info("Successfully keep the order of the column and the cell updates.")
+
+    def test_batch_routes_delete(self, data: Any) -> None:
+        """Test deleting the values by several routes."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        data_ref = copy.deepcopy(data)
+        routes = (
+            ["topping", 1],
+            ["topping", 4, "type"],
+            ["topping", "5"],
+            ["topping", -1],
+            ["batters", "batter", ["type"]],
+            ["topping", 1],
+        )
+        vals = dash_json_grid.DashJsonGrid.delete_many(data, routes)
+        assert utils.is_eq_mapping(vals[0], data_ref["topping"][1])
+        assert vals[0] is vals[5]
+        assert vals[1] == data_ref["topping"][4]["type"]
+        assert utils.is_eq_mapping(vals[2], data_ref["topping"][5])
+        assert utils.is_eq_mapping(vals[3], data_ref["topping"][6])
+        assert utils.is_eq_sequence(
+            vals[4], tuple(item["type"] for item in data_ref["batters"]["batter"])
+        )
+        assert utils.is_eq_sequence(
+            data["topping"],
+            (
+                data_ref["topping"][0],
+                data_ref["topping"][2],
+                data_ref["topping"][3],
+                {"id": data_ref["topping"][4]["id"]},
+            ),
+        )
+        assert all("type" not in item for item in data["batters"]["batter"])
+        log.info("Successfully delete the data by several routes.")
+
+        with pytest.raises(KeyError, match="immutable"):
+            dash_json_grid.DashJsonGrid.delete_many(1, (["a"],))
+        with pytest.raises(IndexError):
+            dash_json_grid.DashJsonGrid.delete_many(data, ([],))
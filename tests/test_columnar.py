@@ -0,0 +1,80 @@
+# -*- coding: UTF-8 -*-
+"""
+Columnar
+========
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the columnar encoding of the tables. Decoding the encoded data needs
+to give the original data, including the order of the keys.
+"""
+
+import logging
+from typing import Any
+
+import pytest
+
+import dash_json_grid
+import json
+
+
+__all__ = ("TestColumnar",)
+
+
+class TestColumnar:
+    """Test the columnar encoding of the tables."""
+
+    def test_columnar_encode(self, data: Any) -> None:
+        """Test encoding and decoding the tables."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        original = json.dumps(data)
+        encoded = dash_json_grid.DashJsonGrid.encode_tables(data, min_rows=2)
+        assert json.dumps(data) == original
+        topping = encoded["topping"]
+        assert dash_json_grid.columnar.is_columnar(topping)
+        assert topping[dash_json_grid.columnar.COLUMNAR_KEY] == ["id", "type"]
+        assert topping["length"] == len(data["topping"])
+        assert topping["values"][1] == [row["type"] for row in data["topping"]]
+        assert encoded["ppu"] == data["ppu"]
+        assert len(json.dumps(encoded)) < len(original)
+        log.info("Successfully encode the tables: {0}".format(topping))
+
+        decoded = dash_json_grid.DashJsonGrid.decode_tables(encoded)
+        assert json.dumps(decoded) == original
+        assert dash_json_grid.DashJsonGrid.encode_tables(data) is data
+        log.info("Successfully decode the tables.")
+
+    def test_columnar_missing(self) -> None:
+        """Test encoding the tables with the missing columns."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        table = [
+            {"a": 1, "c": 3},
+            {"a": 2, "b": [{"x": 1}, {"x": 2}]},
+            {"b": None},
+        ]
+        encoded = dash_json_grid.columnar.encode_tables({"rows": table}, min_rows=2)
+        rows = encoded["rows"]
+        assert rows[dash_json_grid.columnar.COLUMNAR_KEY] == ["a", "b", "c"]
+        assert rows["missing"] == [[2], [0], [1, 2]]
+        assert dash_json_grid.columnar.is_columnar(rows["values"][1][1])
+        decoded = dash_json_grid.columnar.decode_tables(encoded)
+        assert json.dumps(decoded) == json.dumps({"rows": table})
+        log.info("Successfully encode the missing columns: {0}".format(rows))
+
+        for table in (
+            [{"a": 1, "b": 2}, {"b": 3, "a": 4}],
+            [{1: "a"}, {1: "b"}],
+            [{}, {}],
+            [{"a": 1}, 2],
+        ):
+            assert dash_json_grid.columnar.encode_tables(table, min_rows=1) is table
+        with pytest.raises(ValueError):
+            dash_json_grid.columnar.encode_tables(table, min_rows=0)
@@ -0,0 +1,119 @@
+# -*- coding: UTF-8 -*-
+"""
+Compiled route
+==============
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the compiled routes. A compiled route needs to provide the same results
+as the static methods of `MixinDataRoute`.
+"""
+
+import copy
+import logging
+from typing import Any
+
+import pytest
+
+import dash_json_grid
+
+from . import utils
+
+
+__all__ = ("TestCompiledRoute",)
+
+
+class TestCompiledRoute:
+    """Test the compiled routes."""
+
+    def test_compiled_route_get(self, data: Any) -> None:
+        """Test that the compiled routes get the same values as the static method."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        for route in (
+            ["batters", "batter", 0, "id"],
+            ["batters", "batter", "2"],
+            ["batters", "batter", [2]],
+            ["topping", ["type"]],
+            ["topping", ["type"], 1],
+            ["name", None, "any"],
+            [],
+        ):
+            compiled = dash_json_grid.DashJsonGrid.compile_route(route)
+            assert isinstance(compiled, dash_json_grid.mixins.CompiledRoute)
+            data_routed = dash_json_grid.DashJsonGrid.get_data_by_route(data, route)
+            assert utils.is_eq(compiled.get(data), data_routed)
+            assert utils.is_eq(
+                dash_json_grid.DashJsonGrid.get_data_by_route(data, compiled),
+                data_routed,
+            )
+            log.info("Successfully get the data by a compiled route: {0}".format(route))
+
+        compiled = dash_json_grid.DashJsonGrid.compile_route(["batters", "batter", "x"])
+        with pytest.raises(TypeError, match="does not match the type of the data"):
+            compiled.get(data)
+        compiled = dash_json_grid.DashJsonGrid.compile_route(["batters", "undefined"])
+        with pytest.raises(KeyError, match="undefined"):
+            compiled.get(data)
+        log.info("Successfully validate the errors raised by the compiled routes.")
+
+    def test_compiled_route_set_pop(self, data: Any) -> None:
+        """Test that the compiled routes modify the data like the static methods."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        data_ref = copy.deepcopy(data)
+        for route, val in (
+            (["batters", "batter", 0, "id"], "9999"),
+            (["batters", "batter", "1"], {"id": "9998", "type": "Modified"}),
+            (["topping", ["id"]], ("3001", "3002", "3005", "3007", "3006", "3003")),
+            (["topping", ["id"], 3], "ignored"),
+            (["topping", ["type"]], "Any"),
+        ):
+            compiled = dash_json_grid.DashJsonGrid.compile_route(route)
+            if len(val) == 6:
+                with pytest.raises(IndexError):
+                    compiled.set(data, val)
+                continue
+            assert compiled.set(data, val) is data
+            dash_json_grid.DashJsonGrid.update_data_by_route(
+                data_ref, route, copy.deepcopy(val)
+            )
+            assert data == data_ref
+            log.info("Successfully set the data by a compiled route: {0}".format(route))
+
+        for route in (
+            ["batters", "batter", 0, "id"],
+            ["topping", "3"],
+            ["batters", "batter", ["type"]],
+        ):
+            compiled = dash_json_grid.DashJsonGrid.compile_route(route)
+            val = compiled.pop(data)
+            val_ref = dash_json_grid.DashJsonGrid.delete_data_by_route(data_ref, route)
+            assert utils.is_eq(val, val_ref)
+            assert data == data_ref
+            log.info("Successfully pop the data by a compiled route: {0}".format(route))
+
+        with pytest.raises(IndexError):
+            dash_json_grid.DashJsonGrid.compile_route([]).pop(data)
+        with pytest.raises(KeyError, match="immutable"):
+            dash_json_grid.DashJsonGrid.compile_route(["a"]).pop(1)
+
+    def test_compiled_route_validate(self) -> None:
+        """Test the validation during the compilation."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        compiled = dash_json_grid.DashJsonGrid.compile_route(["a", 1, ["b"]])
+        assert dash_json_grid.DashJsonGrid.compile_route(compiled) is compiled
+        assert compiled == dash_json_grid.DashJsonGrid.compile_route(("a", 1, ("b",)))
+        assert compiled.route == ("a", 1, ("b",))
+
+        for route in ("abc", ["a", 1.5], ["a", []], 1):
+            with pytest.raises(TypeError):
+                dash_json_grid.DashJsonGrid.compile_route(route)  # type: ignore
+        log.info("Successfully validate the invalid routes.")
@@ -0,0 +1,148 @@
+# -*- coding: UTF-8 -*-
+"""
+Diff
+====
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the structural difference. Applying the difference to the old data
+needs to give the new data.
+"""
+
+import copy
+import logging
+from typing import Any
+
+import dash_json_grid
+
+
+__all__ = ("TestDiff",)
+
+
+class TestDiff:
+    """Test the difference between two versions of the data."""
+
+    def check_diff(self, old: Any, new: Any) -> list:
+        """Check that the difference changes `old` to `new`."""
+        patch = dash_json_grid.DashJsonGrid.diff(old, new)
+        res = dash_json_grid.patch.apply_data_patch(copy.deepcopy(old), patch)
+        assert res == new
+        return patch
+
+    def test_diff_values(self, data: Any) -> None:
+        """Test the difference of the values."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        assert dash_json_grid.DashJsonGrid.diff(data, data) == []
+        assert dash_json_grid.DashJsonGrid.diff(data, copy.deepcopy(data)) == []
+
+        new = copy.deepcopy(data)
+        new["ppu"] = 0.6
+        new["batters"]["batter"][1]["type"] = "Cocoa"
+        del new["name"]
+        new["extra"] = {"tag": "new"}
+        patch = self.check_diff(data, new)
+        assert {"op": "replace", "path": ["ppu"], "value": 0.6} in patch
+        assert {"op": "remove", "path": ["name"]} in patch
+        assert {"op": "add", "path": ["extra"], "value": {"tag": "new"}} in patch
+        log.info("Successfully get the difference: {0}".format(patch))
+
+        new = copy.deepcopy(data)
+        new["topping"].insert(2, {"id": "5010", "type": "Jelly"})
+        patch = self.check_diff(data, new)
+        assert patch == [
+            {"op": "add", "path": ["topping", 2], "value": new["topping"][2]}
+        ]
+        new = copy.deepcopy(data)
+        del new["topping"][1:3]
+        patch = self.check_diff(data, new)
+        assert [op["op"] for op in patch] == ["remove", "remove"]
+        log.info("Successfully skip the unchanged items of the lists.")
+
+        assert self.check_diff(data, [1, 2]) == [
+            {"op": "replace", "path": [], "value": [1, 2]}
+        ]
+
+    def test_diff_types(self) -> None:
+        """Test that the scalar values equal by `==` but in different types are
+        regarded as changed."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        old = {"flag": True, "count": 1, "ratio": 1, "off": 0, "rows": [1, True]}
+        new = {"flag": 1, "count": 1.0, "ratio": 1, "off": False, "rows": [True, 1]}
+        patch = dash_json_grid.DashJsonGrid.diff(old, new)
+        assert sorted(tuple(op["path"]) for op in patch) == [
+            ("count",),
+            ("flag",),
+            ("off",),
+            ("rows", 0),
+            ("rows", 1),
+        ]
+        res = dash_json_grid.patch.apply_data_patch(copy.deepcopy(old), patch)
+        assert [type(val) for val in res.values()] == [
+            type(val) for val in new.values()
+        ]
+        assert [type(val) for val in res["rows"]] == [bool, int]
+        log.info("Successfully distinguish the types: {0}".format(patch))
+
+        old = [{"id": 1, "on": True}, {"id": 2, "on": False}]
+        new = [{"id": 1, "on": 1}, {"id": 2, "on": False}]
+        assert dash_json_grid.DashJsonGrid.diff(old, new) == [
+            {"op": "replace", "path": [0, "on"], "value": 1}
+        ]
+        assert dash_json_grid.DashJsonGrid.diff(old, copy.deepcopy(old)) == []
+
+        old = {"a": [{"x": 1, "y": [0.5, None]}] * 3, "b": {"p": 1, "q": 2}}
+        new = {"a": [{"y": [0.5, None], "x": 1}] * 3, "b": {"q": 2, "p": 1}}
+        assert dash_json_grid.DashJsonGrid.diff(old, new) == []
+        new = copy.deepcopy(old)
+        new["a"][1]["y"][0] = 0.5
+        new["a"][2]["y"][1] = None
+        new["b"]["q"] = 2.0
+        assert dash_json_grid.DashJsonGrid.diff(old, new) == [
+            {"op": "replace", "path": ["b", "q"], "value": 2.0}
+        ]
+        log.info("Successfully ignore the order of the keys.")
+
+    def test_diff_columns(self, data: Any) -> None:
+        """Test the difference of the table columns."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        new = copy.deepcopy(data)
+        for idx, row in enumerate(new["topping"]):
+            row["type"] = "Type {0}".format(idx)
+            row["price"] = idx
+        patch = self.check_diff(data, new)
+        assert {
+            "op": "replace",
+            "path": ["topping", ["type"]],
+            "value": [row["type"] for row in new["topping"]],
+        } in patch
+        assert {
+            "op": "replace",
+            "path": ["topping", ["price"]],
+            "value": list(range(len(new["topping"]))),
+        } in patch
+        log.info("Successfully replace the columns: {0}".format(patch))
+
+        new = copy.deepcopy(data)
+        new["topping"][3]["type"] = "Maple"
+        patch = self.check_diff(data, new)
+        assert patch == [
+            {"op": "replace", "path": ["topping", 3, "type"], "value": "Maple"}
+        ]
+
+        new = copy.deepcopy(data)
+        for row in new["topping"]:
+            del row["id"]
+        new["topping"][0]["note"] = "first"
+        patch = self.check_diff(data, new)
+        assert {"op": "remove", "path": ["topping", ["id"]]} in patch
+        assert {"op": "add", "path": ["topping", 0, "note"], "value": "first"} in patch
+        log.info("Successfully remove the columns: {0}".format(patch))
@@ -0,0 +1,111 @@
+# -*- coding: UTF-8 -*-
+"""
+Document
+========
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the versioned wrapper of the data. The cached routes need to give the
+same values as resolving the routes on the modified data.
+"""
+
+import logging
+from typing import Any
+
+import pytest
+
+import dash_json_grid
+
+
+__all__ = ("TestDocument",)
+
+
+class TestDocument:
+    """Test the versioned wrapper and its route cache."""
+
+    def check_routes(self, doc: Any, routes: Any) -> None:
+        """Check that the cached routes give the same values as the data."""
+        for route in routes:
+            assert doc.get_data_by_route(
+                route
+            ) == dash_json_grid.DashJsonGrid.get_data_by_route(doc.data, route)
+
+    def test_document_cache(self, data: Any) -> None:
+        """Test resolving the routes by the cache."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        doc = dash_json_grid.document.JsonDocument(data, cache_size=4)
+        route = ["batters", "batter", -1]
+        value = doc.get_data_by_route(route)
+        assert value is data["batters"]["batter"][-1]
+        assert doc.get_data_by_route(route) is value
+        assert doc.to_plotly_json() is data
+        for idx in range(4):
+            doc.get_data_by_route(["topping", idx])
+        assert doc.n_cached == 4
+        log.info("Successfully resolve the routes: {0}".format(doc))
+
+        with pytest.raises(ValueError, match="positive"):
+            dash_json_grid.document.JsonDocument(data, cache_size=0)
+
+    def test_document_route_bounds(self) -> None:
+        """Test the negative indicies and the `None` in the routes."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        data = {"a": [10, 20, 30]}
+        doc = dash_json_grid.document.JsonDocument(data)
+        assert doc.get_data_by_route(["a", -3]) == 10
+        for idx in (-4, -5, 3):
+            with pytest.raises(IndexError):
+                doc.get_data_by_route(["a", idx])
+            with pytest.raises(IndexError):
+                dash_json_grid.DashJsonGrid.get_data_by_route(data, ["a", idx])
+        log.info("Successfully check the bounds of the negative indicies.")
+
+        assert doc.get_data_by_route(["a", None, "x"]) is data["a"]
+        assert doc.get_data_by_route([None, "a"]) is data
+        assert doc.get_data_by_route(
+            ["a", None, "x"]
+        ) is dash_json_grid.DashJsonGrid.get_data_by_route(data, ["a", None, "x"])
+        log.info("Successfully stop the routes at None.")
+
+    def test_document_modify(self, data: Any) -> None:
+        """Test dropping the cached routes by the modifications."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        doc = dash_json_grid.document.JsonDocument(data)
+        routes = (
+            ["batters", "batter", 0, "type"],
+            ["batters", "batter", -1],
+            ["topping", "2", "type"],
+            ["topping", ["type"]],
+            ["id"],
+        )
+        self.check_routes(doc, routes)
+        version = doc.version
+        doc.update_data_by_route(["batters", "batter", 0, "type"], "Plain")
+        doc.update_data_by_route(["batters", "batter", 3], {"id": "1005"})
+        doc.update_data_by_route(["topping", 2, "type"], "Jam")
+        assert doc.version == version + 3
+        self.check_routes(doc, routes)
+        assert doc.is_cached(["id"])
+        log.info("Successfully update the data: {0}".format(doc))
+
+        doc.delete_data_by_route(["topping", 0])
+        doc.update_data_by_route(["topping", ["type"]], "None")
+        doc.delete_data_by_route(["batters", "batter", -1])
+        self.check_routes(doc, routes)
+        log.info("Successfully delete the data: {0}".format(doc))
+
+        data["id"] = "0002"
+        doc.invalidate(["id"])
+        self.check_routes(doc, routes)
+        doc.invalidate()
+        assert doc.n_cached == 0
+        log.info("Successfully invalidate the cached routes.")
@@ -0,0 +1,85 @@
+# -*- coding: UTF-8 -*-
+"""
+Hashing
+=======
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the content hashes of the data. The digests updated by the
+modifications need to be the same as the digests of the re-hashed data.
+"""
+
+import logging
+from typing import Any
+
+import pytest
+
+import dash_json_grid
+
+
+__all__ = ("TestHashing",)
+
+
+class TestHashing:
+    """Test the cache of the content hashes."""
+
+    def test_hashing_digest(self, data: Any) -> None:
+        """Test the digests of the data."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        cache = dash_json_grid.DashJsonGrid.build_hash_cache(data)
+        assert cache.digest() == dash_json_grid.hashing.HashCache(data).digest()
+        assert cache.digest(["batters"]) == (
+            dash_json_grid.hashing.HashCache(data["batters"]).digest()
+        )
+        assert cache.digest(["topping", -1]) == cache.digest(
+            ["topping", len(data["topping"]) - 1]
+        )
+        reordered = dict(reversed(list(data.items())))
+        assert cache.digest() == dash_json_grid.hashing.HashCache(reordered).digest()
+        assert cache.digest(["topping", 0]) != cache.digest(["topping", 1])
+        with pytest.raises(KeyError):
+            cache.digest(["missing"])
+        log.info("Successfully get the digest: {0}".format(cache))
+
+    def test_hashing_update(self, data: Any) -> None:
+        """Test updating the digests by the modifications."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        cache = dash_json_grid.hashing.HashCache(data)
+        digest_root = cache.digest()
+        digest_batters = cache.digest(["batters"])
+        digest_topping = cache.digest(["topping"])
+
+        cache.update_data_by_route(["batters", "batter", 0, "type"], "Plain")
+        assert cache.is_changed([], digest_root)
+        assert cache.is_changed(["batters"], digest_batters)
+        assert not cache.is_changed(["topping"], digest_topping)
+        assert cache.digest() == dash_json_grid.hashing.HashCache(data).digest()
+        log.info("Successfully update the digests of the ancestors.")
+
+        for route in (
+            ["topping", ["type"]],
+            ["topping", 2],
+            ["topping", ["id"]],
+            ["ppu"],
+        ):
+            cache.delete_data_by_route(route)
+            assert cache.digest() == dash_json_grid.hashing.HashCache(data).digest()
+        cache.update_data_by_route(["topping", ["type"]], "None")
+        cache.update_data_by_route(["extra"], {"tags": [1, 2]})
+        assert cache.digest() == dash_json_grid.hashing.HashCache(data).digest()
+        assert cache.is_changed(["topping"], digest_topping)
+        assert cache.is_changed(["ppu"], digest_root)
+        log.info("Successfully update the digests of the columns and items.")
+
+        data["topping"].insert(0, {"type": "Jam"})
+        cache.refresh(["topping", 0])
+        assert cache.digest() == dash_json_grid.hashing.HashCache(data).digest()
+        log.info("Successfully refresh the digests after the modification.")
@@ -0,0 +1,148 @@
+# -*- coding: UTF-8 -*-
+"""
+Indexed table
+=============
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the tables with the columnar index. The indexed tables need to provide
+the same results as the plain tables, even if they are modified.
+"""
+
+import copy
+import pickle
+import logging
+from typing import Any
+
+import pytest
+
+import dash_json_grid
+import json
+
+from . import utils
+
+
+__all__ = ("TestIndexedTable",)
+
+
+class TestIndexedTable:
+    """Test the tables with the columnar index."""
+
+    @pytest.fixture
+    def data_json(self, data_incomplete_json: str) -> str:
+        """Fixture: Use `data_incomplete.json` as the testing data."""
+        return data_incomplete_json
+
+    def test_indexed_table_convert(self, data: Any) -> None:
+        """Test the conversion of the tables."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        data_ref = copy.deepcopy(data)
+        data = dash_json_grid.DashJsonGrid.index_tables(data, min_rows=2)
+        assert isinstance(data["table"], dash_json_grid.mixins.IndexedTable)
+        assert not isinstance(
+            data["unstructured"]["v1"], dash_json_grid.mixins.IndexedTable
+        )
+        assert not isinstance(
+            data["unstructured"]["v2"], dash_json_grid.mixins.IndexedTable
+        )
+        assert data == data_ref
+        assert json.dumps(data) == json.dumps(data_ref)
+        log.info("Successfully index the tables in the data.")
+
+        table = dash_json_grid.DashJsonGrid.index_tables(data["table"], min_rows=2)
+        assert table is data["table"]
+        table = dash_json_grid.DashJsonGrid.index_tables(data_ref["table"], min_rows=2)
+        assert isinstance(table, dash_json_grid.mixins.IndexedTable)
+        assert table == data_ref["table"]
+        for table_copied in (copy.deepcopy(table), pickle.loads(pickle.dumps(table))):
+            assert isinstance(table_copied, dash_json_grid.mixins.IndexedTable)
+            assert table_copied == table
+        log.info("Successfully copy an indexed table.")
+
+    def test_indexed_table_get(self, data: Any) -> None:
+        """Test getting the table columns from the indexed tables."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        data_ref = copy.deepcopy(data)
+        data = dash_json_grid.DashJsonGrid.index_tables(data, min_rows=2)
+        for route in (
+            ["table", ["key1"]],
+            ["table", ["key2"]],
+            ["table", ["key3"]],
+            ["table", ["key1"], 2],
+            ["table", [1]],
+        ):
+            for _ in range(2):
+                assert utils.is_eq(
+                    dash_json_grid.DashJsonGrid.get_data_by_route(data, route),
+                    dash_json_grid.DashJsonGrid.get_data_by_route(data_ref, route),
+                )
+        with pytest.raises(KeyError, match="key4"):
+            dash_json_grid.DashJsonGrid.get_data_by_route(data, ["table", ["key4"]])
+        log.info("Successfully get the columns of an indexed table.")
+
+    def test_indexed_table_modify(self, data: Any) -> None:
+        """Test that the columnar index is refreshed after the table is modified."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        data_ref = copy.deepcopy(data)
+        data = dash_json_grid.DashJsonGrid.index_tables(data, min_rows=2)
+        routes = (["table", ["key1"]], ["table", ["key2"]], ["table", ["key3"]])
+
+        def check() -> None:
+            assert data == data_ref
+            for route in routes:
+                try:
+                    val_ref = dash_json_grid.DashJsonGrid.get_data_by_route(
+                        data_ref, route
+                    )
+                except KeyError:
+                    with pytest.raises(KeyError):
+                        dash_json_grid.DashJsonGrid.get_data_by_route(data, route)
+                    continue
+                val = dash_json_grid.DashJsonGrid.get_data_by_route(data, route)
+                assert utils.is_eq(val, val_ref)
+
+        check()
+        for route, val in (
+            (["table", 0, "key1"], "new"),
+            (["table", 1, "key3"], 1.0),
+            (["table", ["key2"]], "broadcast"),
+            (["table", 2], {"key1": "row", "key3": 2.0}),
+        ):
+            for _data in (data, data_ref):
+                dash_json_grid.DashJsonGrid.update_data_by_route(
+                    _data, route, copy.deepcopy(val)
+                )
+            check()
+        log.info("Successfully update the indexed table.")
+
+        for route in (["table", 3, "key3"], ["table", ["key2"]], ["table", 0]):
+            for _data in (data, data_ref):
+                dash_json_grid.DashJsonGrid.delete_data_by_route(_data, route)
+            check()
+        log.info("Successfully delete the items of the indexed table.")
+
+        compiled = dash_json_grid.DashJsonGrid.compile_route(["table", 0, "key1"])
+        for _data in (data, data_ref):
+            compiled.set(_data, "compiled")
+        check()
+        for _data in (data, data_ref):
+            dash_json_grid.DashJsonGrid.update_many(
+                _data, ((["table", 1, "key1"], "many"), (["table", 0, "key3"], 3.0))
+            )
+        check()
+        for _data in (data, data_ref):
+            dash_json_grid.DashJsonGrid.delete_many(_data, (["table", 1, "key3"],))
+        check()
+        for _data in (data, data_ref):
+            _data["table"].append({"key1": "appended", "key3": 4.0})
+        check()
+        log.info("Successfully modify the indexed table in different ways.")
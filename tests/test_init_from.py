@@ -16,7 +16,10 @@ initializations via the mixins.
 """
 
 import os
+import asyncio
 import logging
+import concurrent.futures
+from typing import Optional
 
 try:
     from typing import Generator
@@ -96,3 +99,54 @@ class TestInitFrom:
             'Successfully validate the functionality of using "data" with '
             "from_file(...)"
         )
+
+    def test_init_from_async(self, file_path: str) -> None:
+        """Test the asynchronous component initializaton."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        with open(file_path, "r") as fobj:
+            json_str = fobj.read()
+        keys = ("id", "type", "name", "ppu", "batters", "topping")
+
+        async def create_comps(
+            executor: Optional[concurrent.futures.Executor],
+        ) -> list:
+            return await asyncio.gather(
+                dash_json_grid.DashJsonGrid.from_str_async(
+                    json_str, executor=executor, highlight_selected=True
+                ),
+                dash_json_grid.DashJsonGrid.from_file_async(
+                    file_path, executor=executor, default_expand_depth=2
+                ),
+                dash_json_grid.DashJsonGrid.from_file_async(
+                    file_path, executor=executor, route=["batters"]
+                ),
+            )
+
+        for executor in (
+            None,
+            concurrent.futures.ThreadPoolExecutor(max_workers=2),
+            concurrent.futures.ProcessPoolExecutor(max_workers=2),
+        ):
+            try:
+                comp_str, comp_file, comp_route = asyncio.run(create_comps(executor))
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+            assert isinstance(comp_str, dash_json_grid.DashJsonGrid)
+            assert getattr(comp_str, "highlight_selected") is True
+            assert utils.is_mapping_with_keys(getattr(comp_str, "data"), keys)
+            assert isinstance(comp_file, dash_json_grid.DashJsonGrid)
+            assert getattr(comp_file, "default_expand_depth") == 2
+            assert utils.is_mapping_with_keys(getattr(comp_file, "data"), keys)
+            assert utils.is_mapping_with_keys(getattr(comp_route, "data"), ("batter",))
+        log.info("Successfully initialize the components asynchronously.")
+
+        with pytest.raises(
+            TypeError, match='When using "from_file_async", it is not allowed'
+        ):
+            asyncio.run(dash_json_grid.DashJsonGrid.from_file_async(file_path, data={}))
+        log.info(
+            'Successfully validate the functionality of using "data" with '
+            "from_file_async(...)"
+        )
@@ -0,0 +1,159 @@
+# -*- coding: UTF-8 -*-
+"""
+Journal
+=======
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the undo/redo journal. Reverting the modifications needs to give the
+previous versions of the data, including the order of the keys.
+"""
+
+import copy
+import logging
+from typing import Any
+
+import pytest
+
+import dash_json_grid
+import json
+
+
+__all__ = ("TestJournal",)
+
+
+class TestJournal:
+    """Test the undo/redo journal of the modifications."""
+
+    def test_journal_undo_redo(self, data: Any) -> None:
+        """Test reverting and applying the modifications again."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        journal = dash_json_grid.journal.EditJournal(data)
+        versions = [json.dumps(data)]
+        journal.update_data_by_route(["batters", "batter", 0, "type"], "Plain")
+        versions.append(json.dumps(data))
+        journal.update_data_by_route(["topping", ["type"]], "None")
+        versions.append(json.dumps(data))
+        val = journal.delete_data_by_route(["topping", -1])
+        assert val["type"] == "None"
+        versions.append(json.dumps(data))
+        journal.delete_data_by_route(["topping", ["id"]])
+        versions.append(json.dumps(data))
+        journal.delete_data_by_route(["type"])
+        versions.append(json.dumps(data))
+        journal.update_data_by_route(["extra"], {"tags": [1, 2]})
+        versions.append(json.dumps(data))
+        assert journal.can_undo and not journal.can_redo
+        log.info("Successfully record the modifications: {0}".format(journal))
+
+        for version in reversed(versions[:-1]):
+            assert journal.undo() is not None
+            assert json.dumps(data) == version
+        assert journal.undo() is None
+        log.info("Successfully revert the modifications: {0}".format(journal))
+
+        for version in versions[1:]:
+            assert journal.redo() is not None
+            assert json.dumps(data) == version
+        assert journal.redo() is None
+        log.info("Successfully apply the modifications again: {0}".format(journal))
+
+        journal.undo()
+        journal.update_data_by_route(["ppu"], 1.0)
+        assert not journal.can_redo
+
+        with pytest.raises((TypeError, ValueError)):
+            journal.update_data_by_route(["ppu", "x"], 1)
+        assert data["ppu"] == 1.0
+        assert journal.can_undo
+        journal.undo()
+        assert journal.can_undo and journal.can_redo
+        log.info("Successfully keep the records after a failed modification.")
+
+    def test_journal_budget(self, data: Any) -> None:
+        """Test dropping the oldest records when the memory exceeds."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        original = copy.deepcopy(data)
+        journal = dash_json_grid.journal.EditJournal(data, max_bytes=4096)
+        for idx in range(100):
+            journal.update_data_by_route(["ppu"], "value {0}".format(idx))
+        assert 0 < journal.n_bytes <= 4096
+        n_undo = 0
+        while journal.undo() is not None:
+            n_undo += 1
+        assert 0 < n_undo < 100
+        assert data["ppu"] == "value {0}".format(99 - n_undo)
+        log.info("Successfully keep {0} records in the budget.".format(n_undo))
+
+        # Redo all records but the last one after shrinking the budget.
+        journal.max_bytes = journal.n_bytes - 1
+        assert journal.redo() is not None
+        assert journal.can_undo
+        assert data["ppu"] == "value {0}".format(100 - n_undo)
+        assert 0 < journal.n_bytes <= journal.max_bytes
+        while journal.redo() is not None:
+            pass
+        assert data["ppu"] != "value 99"
+        log.info("Successfully drop the furthest redo records: {0}".format(journal))
+
+        data["topping"][0] = {"id": "1", "type": "None", "note": "last"}
+        journal = dash_json_grid.journal.EditJournal(data)
+        journal.delete_data_by_route(["topping", 0, "note"])
+        journal.delete_data_by_route(["topping", 0, "id"])
+        journal.undo()
+        journal.undo()
+        assert list(data["topping"][0]) == ["id", "type", "note"]
+
+        journal = dash_json_grid.journal.EditJournal(data, max_bytes=4096)
+        journal.update_data_by_route(["topping"], list(range(10000)))
+        assert not journal.can_undo
+        assert journal.n_bytes == 0
+        assert data != original
+
+        with pytest.raises(ValueError):
+            dash_json_grid.journal.EditJournal(data, max_bytes=0)
+
+    def test_journal_transaction(self, data: Any) -> None:
+        """Test applying and reverting the modifications as transactions."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        original = json.dumps(data)
+        with pytest.raises(IndexError):
+            with dash_json_grid.DashJsonGrid.transaction(data) as txn:
+                txn.update_data_by_route(["batters", "batter", 0, "type"], "Plain")
+                txn.delete_data_by_route(["topping", 2])
+                txn.update_data_by_route(["topping", ["type"]], {0: "Jam", 99: "Ice"})
+        assert json.dumps(data) == original
+        log.info("Successfully revert the half-written column.")
+
+        journal = dash_json_grid.journal.EditJournal(data)
+        with journal.transaction():
+            journal.update_data_by_route(["topping", ["type"]], "None")
+            journal.delete_data_by_route(["topping", 0])
+            assert journal.in_transaction
+            with pytest.raises(KeyError):
+                with journal.transaction():
+                    journal.delete_data_by_route(["topping", 0, "id"])
+                    journal.delete_data_by_route(["topping", 0, "missing"])
+            assert "id" in data["topping"][0]
+            with pytest.raises(ValueError):
+                journal.undo()
+        modified = json.dumps(data)
+        assert not journal.in_transaction
+        assert all(row["type"] == "None" for row in data["topping"])
+        log.info("Successfully apply the transaction: {0}".format(journal))
+
+        assert journal.undo() == ["topping"]
+        assert json.dumps(data) == original
+        assert not journal.can_undo
+        assert journal.redo() == ["topping"]
+        assert json.dumps(data) == modified
+        log.info("Successfully revert the transaction as one step.")
@@ -0,0 +1,227 @@
+# -*- coding: UTF-8 -*-
+"""
+Loaders
+=======
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the loaders. The data loaded by the streaming mode needs to be the same
+as the data loaded by `json.load`.
+"""
+
+import io
+import os
+import json
+import logging
+from typing import Any
+
+try:
+    from typing import Generator
+except ImportError:
+    from collections.abc import Generator
+
+import pytest
+
+import dash_json_grid
+
+from . import utils
+
+
+__all__ = ("TestLoaders",)
+
+
+class TestLoaders:
+    """Test the loaders of the JSON files."""
+
+    @pytest.fixture(scope="class")
+    def file_path(self) -> Generator[str, None, None]:
+        """Fixture: Get the path of the testing file."""
+        path = os.path.join(os.path.dirname(__file__), "data.json")
+        if not os.path.isfile(path):
+            raise FileNotFoundError("The testing file is missing: {0}".format(path))
+        yield path
+
+    def test_loaders_stream(self, file_path: str) -> None:
+        """Test loading the whole file in the streaming mode."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        with open(file_path, "r") as fobj:
+            data_ref = json.load(fobj)
+        for chunk_size in (1, 7, 65536):
+            data = dash_json_grid.loaders.load_stream(file_path, chunk_size=chunk_size)
+            assert data == data_ref
+            with open(file_path, "rb") as fobj:
+                data = dash_json_grid.loaders.load_stream(fobj, chunk_size=chunk_size)
+            assert data == data_ref
+        log.info("Successfully load the whole file in the streaming mode.")
+
+        data_ref = {
+            'escaped "key"': ["\\", "é中", "é\n"],
+            "values": [0, -1.5e3, True, False, None, {}, [], [[]], ""],
+        }
+        text = json.dumps(data_ref, ensure_ascii=False)
+        for chunk_size in (1, 2, 3, 1024):
+            data = dash_json_grid.loaders.load_stream(
+                io.StringIO(text), chunk_size=chunk_size
+            )
+            assert data == data_ref
+            data = dash_json_grid.loaders.load_stream(
+                io.BytesIO(text.encode("utf-8")), chunk_size=chunk_size
+            )
+            assert data == data_ref
+        log.info("Successfully load the special values in the streaming mode.")
+
+    def test_loaders_stream_route(self, file_path: str) -> None:
+        """Test loading a part of the file located by a route."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        with open(file_path, "r") as fobj:
+            data_ref = json.load(fobj)
+        for route in (
+            ["batters", "batter", 2],
+            ["batters", "batter", "2", "type"],
+            ["batters", ["batter"], -1],
+            ["topping", ["type"]],
+            ["topping", ["id"], 3],
+            ["topping", [1], "id"],
+            ["topping", -3, "type"],
+            ["ppu"],
+            ["name", 0],
+            [],
+        ):
+            val_ref = dash_json_grid.DashJsonGrid.get_data_by_route(data_ref, route)
+            for chunk_size in (1, 16, 65536):
+                val = dash_json_grid.loaders.load_stream(
+                    file_path, route=route, chunk_size=chunk_size
+                )
+                assert utils.is_eq(val, val_ref)
+        log.info("Successfully load the data located by the routes.")
+
+        with pytest.raises(KeyError, match="undefined"):
+            dash_json_grid.loaders.load_stream(file_path, ["batters", "undefined"])
+        with pytest.raises(KeyError, match="undefined"):
+            dash_json_grid.loaders.load_stream(file_path, ["topping", ["undefined"]])
+        with pytest.raises(IndexError):
+            dash_json_grid.loaders.load_stream(file_path, ["topping", 7])
+        with pytest.raises(IndexError):
+            dash_json_grid.loaders.load_stream(file_path, ["topping", -8])
+        with pytest.raises(TypeError):
+            dash_json_grid.loaders.load_stream(file_path, ["topping", "id"])
+        with pytest.raises(ValueError):
+            dash_json_grid.loaders.load_stream(
+                io.StringIO('{"a": [1, 2}'), ["a", ["id"]]
+            )
+        with pytest.raises(ValueError):
+            dash_json_grid.loaders.load_stream(io.StringIO('{"a": "b'), ["b"])
+        log.info("Successfully raise the errors of the invalid routes.")
+
+    def test_loaders_from_file(self, file_path: str) -> None:
+        """Test the component initialization in the streaming mode."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        with open(file_path, "r") as fobj:
+            data_ref = json.load(fobj)
+
+        comp = dash_json_grid.DashJsonGrid.from_file(
+            file_path, stream=True, chunk_size=32, default_expand_depth=2
+        )
+        assert getattr(comp, "default_expand_depth") == 2
+        assert getattr(comp, "data") == data_ref
+        comp = dash_json_grid.DashJsonGrid.from_file(file_path, route=["topping", 1])
+        assert utils.is_eq(getattr(comp, "data"), data_ref["topping"][1])
+        log.info("Successfully initialize the component in the streaming mode.")
+
+        with pytest.raises(
+            TypeError, match='When using "from_file", it is not allowed'
+        ):
+            dash_json_grid.DashJsonGrid.from_file(file_path, stream=True, data={})
+
+    def test_loaders_backend(self, file_path: str) -> None:
+        """Test loading the data by different JSON backends."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        with open(file_path, "r") as fobj:
+            json_str = fobj.read()
+        data_ref = json.loads(json_str)
+
+        backends = dash_json_grid.loaders.available_backends()
+        assert backends[-1] == "json"
+        assert dash_json_grid.loaders.get_backend().name == backends[0]
+        for backend in backends:
+            assert dash_json_grid.loaders.get_backend(backend).name == backend
+            for val in (json_str, json_str.encode("utf-8")):
+                assert dash_json_grid.loaders.loads(val, backend=backend) == data_ref
+                comp = dash_json_grid.DashJsonGrid.from_str(val, backend=backend)
+                assert getattr(comp, "data") == data_ref
+            comp = dash_json_grid.DashJsonGrid.from_file(file_path, backend=backend)
+            assert getattr(comp, "data") == data_ref
+            with open(file_path, "rb") as fobj:
+                comp = dash_json_grid.DashJsonGrid.from_file(fobj, backend=backend)
+            assert getattr(comp, "data") == data_ref
+            comp = dash_json_grid.DashJsonGrid.from_file(
+                file_path, route=["topping", ["id"]], backend=backend
+            )
+            assert utils.is_eq(
+                getattr(comp, "data"), tuple(item["id"] for item in data_ref["topping"])
+            )
+        log.info("Successfully load the data by the backends: {0}".format(backends))
+
+        assert dash_json_grid.loaders.get_default_backend() == "auto"
+        try:
+            dash_json_grid.loaders.set_default_backend("json")
+            assert dash_json_grid.loaders.get_default_backend() == "json"
+            assert dash_json_grid.loaders.get_backend().name == "json"
+        finally:
+            dash_json_grid.loaders.set_default_backend(None)
+        assert dash_json_grid.loaders.get_default_backend() == "auto"
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            dash_json_grid.loaders.set_default_backend("undefined")
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            dash_json_grid.DashJsonGrid.from_str(json_str, backend="undefined")
+        log.info("Successfully configure the default backend.")
+
+        val = dash_json_grid.loaders.loads('{"a": NaN}')
+        assert val["a"] != val["a"]
+        if "orjson" in backends:
+            with pytest.raises(ValueError):
+                dash_json_grid.loaders.loads('{"a": NaN}', backend="orjson")
+        log.info("Successfully fall back to the standard library in the auto mode.")
+
+    def test_loaders_mmap(self, file_path: str, tmp_path: Any) -> None:
+        """Test loading the data from a memory-mapped file."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        with open(file_path, "r") as fobj:
+            data_ref = json.load(fobj)
+        for backend in dash_json_grid.loaders.available_backends():
+            data = dash_json_grid.loaders.load_file(
+                file_path, backend=backend, use_mmap=True
+            )
+            assert data == data_ref
+            comp = dash_json_grid.DashJsonGrid.from_file(
+                file_path, backend=backend, use_mmap=True
+            )
+            assert getattr(comp, "data") == data_ref
+        log.info("Successfully load the data from the memory-mapped file.")
+
+        path_empty = os.path.join(str(tmp_path), "empty.json")
+        with open(path_empty, "w"):
+            pass
+        with pytest.raises(ValueError):
+            dash_json_grid.loaders.load_file(path_empty, use_mmap=True)
+        path_invalid = os.path.join(str(tmp_path), "invalid.json")
+        with open(path_invalid, "w") as fobj:
+            fobj.write('{"a": [1, 2')
+        for backend in dash_json_grid.loaders.available_backends():
+            with pytest.raises(ValueError):
+                dash_json_grid.loaders.load_file(
+                    path_invalid, backend=backend, use_mmap=True
+                )
+        os.remove(path_invalid)
+        log.info("Successfully raise the errors of the invalid files.")
@@ -0,0 +1,119 @@
+# -*- coding: UTF-8 -*-
+"""
+Patch
+=====
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the partial updates of the data. The recorded patch needs to make the
+same modifications as the route methods.
+"""
+
+import copy
+import logging
+from typing import Any
+
+import pytest
+
+import dash_json_grid
+import json
+
+
+__all__ = ("TestPatch",)
+
+
+class TestPatch:
+    """Test the recording and the application of the data patch."""
+
+    def test_patch_record(self, data: Any) -> None:
+        """Test recording the patch by the route methods."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        data_ref = copy.deepcopy(data)
+        patch = dash_json_grid.patch.DataPatch(data)
+        patch.update_data_by_route(["batters", "batter", 0, "type"], "Plain")
+        patch.update_data_by_route(["ppu"], 0.5)
+        assert patch.delete_data_by_route(["topping", -1]) == data_ref["topping"][-1]
+        patch.add_data_by_route(["topping", 0], {"id": "5008", "type": "Ice"})
+        patch.add_data_by_route(["topping", "-"], {"id": "5009", "type": "Salt"})
+        patch.update_data_by_route(["name", None, "unused"], "Unused")
+        assert patch.operations == [
+            {
+                "op": "replace",
+                "path": ["batters", "batter", 0, "type"],
+                "value": "Plain",
+            },
+            {"op": "replace", "path": ["ppu"], "value": 0.5},
+            {"op": "remove", "path": ["topping", -1]},
+            {
+                "op": "add",
+                "path": ["topping", 0],
+                "value": {"id": "5008", "type": "Ice"},
+            },
+            {
+                "op": "add",
+                "path": ["topping", "-"],
+                "value": {"id": "5009", "type": "Salt"},
+            },
+        ]
+        assert patch.to_plotly_json() is patch.operations
+        assert json.loads(json.dumps(list(patch))) == patch.operations
+        log.info("Successfully record the patch operations.")
+
+        assert dash_json_grid.patch.apply_data_patch(data_ref, patch) == data
+        log.info("Successfully apply the recorded patch.")
+
+        patch.clear()
+        assert len(patch) == 0
+
+    def test_patch_table_column(self, data: Any) -> None:
+        """Test recording the patch of modifying table columns."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        data_ref = copy.deepcopy(data)
+        patch = dash_json_grid.patch.DataPatch(data)
+        patch.update_data_by_route(["topping", ["type"]], "Modified")
+        patch.delete_data_by_route(["batters", "batter", ["id"]])
+        patch.update_data_by_route(["topping", 0, "type"], "First")
+        ops = patch.operations
+        assert [op["op"] for op in ops] == ["replace", "replace", "replace"]
+        assert ops[0]["path"] == ["topping"]
+        assert ops[1]["path"] == ["batters", "batter"]
+        assert ops[0]["value"][0]["type"] == "Modified"
+        log.info("Successfully record the table columns as the whole tables.")
+
+        assert dash_json_grid.patch.apply_data_patch(data_ref, ops) == data
+        log.info("Successfully apply the patch of the table columns.")
+
+    def test_patch_apply(self) -> None:
+        """Test applying the patch written manually."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        data = {"a": [1, 2, 3], "b": {"c": 1}}
+        data = dash_json_grid.patch.apply_data_patch(
+            data,
+            [
+                {"op": "replace", "path": ["b", "c"], "value": 5},
+                {"op": "remove", "path": ["a", "1"]},
+                {"op": "add", "path": ["a", 0], "value": 0},
+                {"op": "add", "path": ["b", "d"], "value": []},
+            ],
+        )
+        assert data == {"a": [0, 1, 3], "b": {"c": 5, "d": []}}
+        data = dash_json_grid.patch.apply_data_patch(
+            data, [{"op": "replace", "path": [], "value": [1]}]
+        )
+        assert data == [1]
+        with pytest.raises(ValueError, match="Unknown patch operation"):
+            dash_json_grid.patch.apply_data_patch(data, [{"op": "move", "path": [0]}])
+        with pytest.raises(TypeError):
+            dash_json_grid.patch.apply_data_patch(
+                data, [{"op": "add", "path": ["x"], "value": 1}]
+            )
+        log.info("Successfully apply the manually written patch.")
@@ -0,0 +1,100 @@
+# -*- coding: UTF-8 -*-
+"""
+Persistent
+==========
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the persistent modifications. The previous versions of the data need
+to be unchanged, and the unmodified parts need to be shared by the versions.
+"""
+
+import copy
+import logging
+from typing import Any
+
+import pytest
+
+import dash_json_grid
+
+
+__all__ = ("TestPersistent",)
+
+
+class TestPersistent:
+    """Test the persistent modifications of the data."""
+
+    def test_persistent_update(self, data: Any) -> None:
+        """Test making the new versions by the updates and the deletions."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        original = copy.deepcopy(data)
+        new = dash_json_grid.persistent.update_data_by_route(
+            data, ["batters", "batter", 0, "type"], "Plain"
+        )
+        assert data == original
+        assert new["batters"]["batter"][0]["type"] == "Plain"
+        assert new["topping"] is data["topping"]
+        assert new["batters"]["batter"][1] is data["batters"]["batter"][1]
+        assert new["batters"] is not data["batters"]
+        expected = copy.deepcopy(original)
+        dash_json_grid.DashJsonGrid.update_data_by_route(
+            expected, ["batters", "batter", 0, "type"], "Plain"
+        )
+        assert new == expected
+        log.info("Successfully update the data with the shared parts.")
+
+        newer = dash_json_grid.persistent.update_data_by_route(
+            new, ["topping", ["type"]], "None"
+        )
+        assert all(row["type"] == "None" for row in newer["topping"])
+        assert new["topping"] == original["topping"]
+        assert newer["batters"] is new["batters"]
+        log.info("Successfully update the column with the copied rows.")
+
+        newest, val = dash_json_grid.persistent.delete_data_by_route(
+            newer, ["topping", -1]
+        )
+        assert val == newer["topping"][-1]
+        assert len(newest["topping"]) == len(newer["topping"]) - 1
+        assert newest["topping"][0] is newer["topping"][0]
+        assert data == original
+        log.info("Successfully delete the data: {0}".format(val))
+
+        assert (
+            dash_json_grid.persistent.update_data_by_route(data, [None, "id"], 1)
+            is data
+        )
+        with pytest.raises(KeyError):
+            dash_json_grid.persistent.update_data_by_route(data, ["missing", "id"], 1)
+
+    def test_persistent_document(self, data: Any) -> None:
+        """Test the persistent mode of the document."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        doc = dash_json_grid.document.JsonDocument(data, persistent=True)
+        batters = doc.get_data_by_route(["batters"])
+        topping = doc.get_data_by_route(["topping"])
+        snapshot = doc.snapshot()
+        assert snapshot is data
+
+        doc.update_data_by_route(["batters", "batter", 0, "type"], "Plain")
+        assert snapshot["batters"]["batter"][0]["type"] != "Plain"
+        assert doc.get_data_by_route(["batters", "batter", 0, "type"]) == "Plain"
+        assert doc.get_data_by_route(["batters"]) is not batters
+        assert doc.is_cached(["topping"])
+        assert doc.get_data_by_route(["topping"]) is topping
+        log.info("Successfully drop the copied containers: {0}".format(doc))
+
+        val = doc.delete_data_by_route(["topping", 0])
+        assert val == snapshot["topping"][0]
+        assert len(doc.get_data_by_route(["topping"])) == len(topping) - 1
+        assert len(snapshot["topping"]) == len(topping)
+        assert doc.version == 2
+        log.info("Successfully keep the previous version: {0}".format(doc))
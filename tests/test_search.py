@@ -0,0 +1,85 @@
+# -*- coding: UTF-8 -*-
+"""
+Search
+======
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the server-side search. The search with or without the index needs
+to yield the same routes.
+"""
+
+import logging
+from typing import Any
+
+import pytest
+
+import dash_json_grid
+
+
+__all__ = ("TestSearch",)
+
+
+class TestSearch:
+    """Test searching the data by the route helpers."""
+
+    def test_search_routes(self, data: Any) -> None:
+        """Test the routes yielded by the search."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        routes = list(dash_json_grid.DashJsonGrid.search(data, "chocolate"))
+        assert routes
+        for route in routes:
+            val = dash_json_grid.DashJsonGrid.get_data_by_route(data, route)
+            assert "chocolate" in str(val).lower()
+        log.info("Successfully search the values: {0}".format(routes))
+
+        routes = list(dash_json_grid.DashJsonGrid.search(data, "batter", values=False))
+        assert routes == [["batters"], ["batters", "batter"]]
+        assert not list(dash_json_grid.DashJsonGrid.search(data, "batter", keys=False))
+        routes = list(dash_json_grid.DashJsonGrid.search(data, r"^500\d$", regex=True))
+        assert len(routes) == len(data["topping"])
+        assert all(route[0] == "topping" and route[-1] == "id" for route in routes)
+        log.info("Successfully search the keys and the regular expressions.")
+
+        gen = dash_json_grid.DashJsonGrid.search(data, "id")
+        assert next(gen) == ["id"]
+        gen.close()
+        assert len(list(dash_json_grid.DashJsonGrid.search(data, "id", limit=2))) == 2
+        assert not list(dash_json_grid.DashJsonGrid.search(data, "id", limit=0))
+        log.info("Successfully stop the search early.")
+
+    def test_search_index(self, data: Any) -> None:
+        """Test the search accelerated by the inverted index."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        index = dash_json_grid.DashJsonGrid.build_search_index(data)
+        assert len(index) > 0
+        for query, kwargs in (
+            ("chocolate", {}),
+            ("choc", {}),
+            ("late with sp", {}),
+            ("Type", {"values": False}),
+            ("5", {"keys": False}),
+            ("  ", {}),
+            ("missing", {}),
+            (r"[Ss]ugar$", {"regex": True}),
+            ("id", {"limit": 3}),
+            ("ugar", {}),
+            ("o", {"limit": 4}),
+            ("ate gla", {}),
+            ("zzzz", {}),
+        ):
+            assert list(
+                dash_json_grid.DashJsonGrid.search(data, query, index=index, **kwargs)
+            ) == list(dash_json_grid.DashJsonGrid.search(data, query, **kwargs))
+        log.info("Successfully search the data by the index.")
+
+        with pytest.raises(ValueError, match="does not belong"):
+            list(dash_json_grid.DashJsonGrid.search(dict(data), "id", index=index))
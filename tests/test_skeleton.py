@@ -0,0 +1,194 @@
+# -*- coding: UTF-8 -*-
+"""
+Skeleton
+========
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the lazy expansion of the data. Expanding all placeholders of the
+skeleton needs to restore the whole data.
+"""
+
+import logging
+from typing import Any
+
+import pytest
+
+import dash_json_grid
+
+
+__all__ = ("TestSkeleton",)
+
+
+class TestSkeleton:
+    """Test the skeleton data and its lazy expansion."""
+
+    def test_skeleton_make(self, data: Any) -> None:
+        """Test making the skeleton of the data."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        skeleton = dash_json_grid.skeleton.make_skeleton(data)
+        assert tuple(skeleton.keys()) == tuple(data.keys())
+        assert skeleton["id"] == data["id"]
+        assert skeleton["topping"] == {
+            "__djg_type__": "array",
+            "length": len(data["topping"]),
+            "route": ["topping"],
+        }
+        assert dash_json_grid.skeleton.is_placeholder(skeleton["batters"])
+        assert not dash_json_grid.skeleton.is_placeholder(data["batters"])
+        assert dash_json_grid.skeleton.make_placeholder([]) == []
+        log.info("Successfully make the skeleton of the data.")
+
+        skeleton = dash_json_grid.skeleton.make_skeleton(data, depth=2)
+        assert dash_json_grid.skeleton.is_placeholder(skeleton["topping"][0])
+        assert dash_json_grid.skeleton.is_placeholder(skeleton["batters"]["batter"])
+        with pytest.raises(ValueError, match="depth"):
+            dash_json_grid.skeleton.make_skeleton(data, depth=0)
+
+        comp = dash_json_grid.DashJsonGrid.from_skeleton(
+            data, data_key="key", skeleton_depth=2
+        )
+        assert getattr(comp, "data") == skeleton
+        assert getattr(comp, "data_key") == "key"
+        log.info("Successfully initialize the component by the skeleton.")
+
+    def test_skeleton_expand(self, data: Any) -> None:
+        """Test expanding the placeholders until the whole data is restored."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        skeleton = dash_json_grid.skeleton.make_skeleton(data)
+        n_requests = 0
+        while True:
+            route = self.find_placeholder(skeleton, [])
+            if route is None:
+                break
+            patch = dash_json_grid.DashJsonGrid.expand_skeleton(data, route)
+            assert len(patch) == 1 and patch[0]["path"] == route
+            skeleton = dash_json_grid.patch.apply_data_patch(skeleton, patch)
+            n_requests += 1
+        assert n_requests > 0
+        assert skeleton == data
+        assert dash_json_grid.DashJsonGrid.expand_skeleton(data, []) == [
+            {
+                "op": "replace",
+                "path": [],
+                "value": dash_json_grid.skeleton.make_skeleton(data),
+            }
+        ]
+        log.info("Successfully restore the data by {0} expansions.".format(n_requests))
+
+    def test_skeleton_summarize(self, data: Any) -> None:
+        """Test the size-capped summary and its lazy expansion."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        summary = dash_json_grid.DashJsonGrid.summarize(
+            data, max_depth=1, max_items=2, max_str_len=3
+        )
+        more = summary[dash_json_grid.skeleton.PLACEHOLDER_MORE_KEY]
+        assert more["length"] == len(data) - 2 and more["route"] == []
+        assert tuple(summary.keys())[:2] == tuple(data.keys())[:2]
+        log.info("Successfully summarize the data: {0}".format(summary))
+
+        summary = dash_json_grid.DashJsonGrid.summarize(
+            data, max_depth=3, max_items=1, max_str_len=3
+        )
+        n_requests = 0
+        route = self.find_placeholder(summary, [])
+        while route is not None:
+            target = self.expand_route(summary, route)
+            patch = dash_json_grid.DashJsonGrid.expand_skeleton(
+                data, target, depth=2, max_items=1, max_str_len=3
+            )
+            summary = dash_json_grid.patch.apply_data_patch(summary, patch)
+            n_requests += 1
+            route = self.find_placeholder(summary, [])
+        assert summary == data
+        log.info("Successfully restore the data by {0} expansions.".format(n_requests))
+
+        assert dash_json_grid.skeleton.summarize("abcd", max_str_len=3) == {
+            dash_json_grid.skeleton.PLACEHOLDER_TYPE_KEY: "string",
+            "length": 4,
+            "preview": "abc",
+            "route": [],
+        }
+        with pytest.raises(ValueError, match="non-negative"):
+            dash_json_grid.skeleton.summarize(data, max_items=-1)
+
+    def test_skeleton_bounded(self) -> None:
+        """Test that the skeleton and its expansions are bounded by the widths."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        data = {
+            "rows": [{"id": idx, "tags": [idx] * 3} for idx in range(25)],
+            "text": "x" * 1000,
+            "keys": {"k{0}".format(idx): idx for idx in range(7)},
+        }
+        skeleton = dash_json_grid.skeleton.make_skeleton(
+            data, depth=2, max_items=10, max_str_len=8
+        )
+        assert len(skeleton["rows"]) == 11
+        assert skeleton["rows"][-1] == {
+            "__djg_type__": "more",
+            "length": 15,
+            "offset": 10,
+            "route": ["rows"],
+        }
+        assert skeleton["text"]["preview"] == "x" * 8
+        log.info("Successfully bound the skeleton by the widths.")
+
+        n_requests = 0
+        route = self.find_placeholder(skeleton, [])
+        while route is not None:
+            target = self.expand_route(skeleton, route)
+            patch = dash_json_grid.DashJsonGrid.expand_skeleton(
+                data, target, max_items=10, max_str_len=8
+            )
+            assert len(patch) <= 12
+            skeleton = dash_json_grid.patch.apply_data_patch(skeleton, patch)
+            n_requests += 1
+            route = self.find_placeholder(skeleton, [])
+        assert skeleton == data
+        assert tuple(skeleton["keys"]) == tuple(data["keys"])
+        log.info("Successfully restore the data by {0} expansions.".format(n_requests))
+
+        with pytest.raises(IndexError, match="offset"):
+            dash_json_grid.DashJsonGrid.expand_skeleton(
+                data, ["rows", dash_json_grid.skeleton.PLACEHOLDER_MORE_KEY, 25]
+            )
+
+    @staticmethod
+    def expand_route(skeleton: Any, route: list) -> list:
+        """Get the route requested for expanding a placeholder, in the same way as
+        the component."""
+        placeholder = dash_json_grid.DashJsonGrid.get_data_by_route(skeleton, route)
+        assert placeholder["route"] in (route, route[:-1])
+        if placeholder[dash_json_grid.skeleton.PLACEHOLDER_TYPE_KEY] != "more":
+            return route
+        return route[:-1] + [
+            dash_json_grid.skeleton.PLACEHOLDER_MORE_KEY,
+            placeholder["offset"],
+        ]
+
+    @classmethod
+    def find_placeholder(cls, data: Any, route: list) -> Any:
+        """Find the route of the first placeholder in the data."""
+        if dash_json_grid.skeleton.is_placeholder(data):
+            return route
+        if isinstance(data, dict):
+            items = data.items()
+        elif isinstance(data, list):
+            items = enumerate(data)
+        else:
+            return None
+        for key, val in items:
+            res = cls.find_placeholder(val, route + [key])
+            if res is not None:
+                return res
+        return None
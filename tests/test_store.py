@@ -0,0 +1,199 @@
+# -*- coding: UTF-8 -*-
+"""
+Store
+=====
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the server-side data stores. The stored data needs to be located and
+modified by the data keys.
+"""
+
+import os
+import copy
+import threading
+import logging
+from typing import Any
+
+import pytest
+
+import dash_json_grid
+import json
+
+from . import utils
+
+
+__all__ = ("TestStore",)
+
+
+class TestStore:
+    """Test the server-side data stores."""
+
+    def test_store_memory(self, data: Any) -> None:
+        """Test the store keeping the data in the memory."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        store = dash_json_grid.store.MemoryStore(max_items=2)
+        key_1 = store.add(data)
+        key_2 = store.add([1, 2, 3])
+        assert key_1 != key_2
+        assert store.get(key_1) is data
+        key_3 = store.add("data")
+        assert key_1 in store
+        assert key_2 not in store
+        assert store[key_3] == "data"
+        del store[key_3]
+        assert key_3 not in store
+        with pytest.raises(KeyError):
+            store.get(key_3)
+        store.clear()
+        assert len(store) == 0
+        log.info("Successfully invalidate the least recently used data.")
+
+        with pytest.raises(ValueError, match="max_items"):
+            dash_json_grid.store.MemoryStore(max_items=0)
+
+    def test_store_disk(self, data: Any, tmp_path: Any) -> None:
+        """Test the store keeping the data in a folder."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        store = dash_json_grid.store.DiskStore(str(tmp_path), max_items=2)
+        store_shared = dash_json_grid.store.DiskStore(str(tmp_path), cache_items=0)
+        key = store.add(data)
+        assert key in store_shared
+        assert store_shared.get(key) == data
+        store_shared.set(key, {"modified": True})
+        assert store.get(key) == {"modified": True}
+        log.info("Successfully share the data among the stores.")
+
+        store["key/with/slashes"] = [1]
+        store["key:2"] = [2]
+        assert store["key/with/slashes"] == [1]
+        assert len([name for name in os.listdir(str(tmp_path))]) == 2
+        store_shared.delete("key:2")
+        with pytest.raises(KeyError):
+            store.get("key:2")
+        with pytest.raises(KeyError):
+            store.delete("key:2")
+        store.clear()
+        assert not os.listdir(str(tmp_path))
+        log.info("Successfully invalidate the data in the folder.")
+
+    def test_store_routes(self, data: Any, tmp_path: Any) -> None:
+        """Test the route methods using the data keys."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        for store in (
+            dash_json_grid.store.MemoryStore(),
+            dash_json_grid.store.DiskStore(str(tmp_path)),
+        ):
+            data_ref = copy.deepcopy(data)
+            key = store.add(copy.deepcopy(data))
+            comp = dash_json_grid.DashJsonGrid.from_store(
+                store, key, default_expand_depth=2
+            )
+            assert getattr(comp, "data_key") == key
+            assert getattr(comp, "data") == data_ref
+            with pytest.raises(
+                TypeError, match='When using "from_store", it is not allowed'
+            ):
+                dash_json_grid.DashJsonGrid.from_store(store, key, data={})
+
+            route = ["batters", "batter", 1, "type"]
+            assert dash_json_grid.DashJsonGrid.get_data_by_key(
+                store, key, route
+            ) == dash_json_grid.DashJsonGrid.get_data_by_route(data_ref, route)
+            dash_json_grid.DashJsonGrid.update_data_by_key(
+                store, key, route, "Modified"
+            )
+            dash_json_grid.DashJsonGrid.update_data_by_route(
+                data_ref, route, "Modified"
+            )
+            assert store.get(key) == data_ref
+            route = ["topping", ["type"]]
+            val = dash_json_grid.DashJsonGrid.delete_data_by_key(store, key, route)
+            val_ref = dash_json_grid.DashJsonGrid.delete_data_by_route(data_ref, route)
+            assert utils.is_eq(val, val_ref)
+            assert store.get(key) == data_ref
+            log.info(
+                "Successfully modify the data in the store: {0}".format(
+                    store.__class__.__name__
+                )
+            )
+
+    def test_store_disk_private(self, data: Any) -> None:
+        """Test the default folder and the format of the disk store."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        store = dash_json_grid.store.DiskStore()
+        store_other = dash_json_grid.store.DiskStore()
+        try:
+            assert store.path != store_other.path
+            if os.name == "posix":
+                assert os.stat(store.path).st_mode & 0o777 == 0o700
+            key = store.add(data)
+            (name,) = os.listdir(store.path)
+            assert name.endswith(".json")
+            with open(os.path.join(store.path, name), "r", encoding="utf-8") as fobj:
+                assert json.load(fobj) == data
+            assert key not in store_other
+            log.info("Successfully keep the data in a private folder.")
+        finally:
+            paths = (store.path, store_other.path)
+            del store, store_other
+        assert not any(os.path.exists(path) for path in paths)
+        log.info("Successfully remove the private folders with the stores.")
+
+    def test_store_routes_atomic(self, data: Any, tmp_path: Any) -> None:
+        """Test that the failed modifications do not change the stored data, and the
+        concurrent modifications are not lost."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        for store in (
+            dash_json_grid.store.MemoryStore(),
+            dash_json_grid.store.DiskStore(str(tmp_path)),
+        ):
+            key = store.add(copy.deepcopy(data))
+            prev = store.get(key)
+            with pytest.raises(IndexError):
+                dash_json_grid.DashJsonGrid.update_data_by_key(
+                    store, key, ["topping", ["type"]], ["None", "Glazed"]
+                )
+            with pytest.raises(KeyError):
+                dash_json_grid.DashJsonGrid.delete_data_by_key(
+                    store, key, ["batters", "missing"]
+                )
+            assert store.get(key) == data
+            assert prev == data
+            log.info("Successfully keep the data after the failed modifications.")
+
+            store.set(key, {"counter": [0] * 4})
+            n_repeats = 25
+
+            def increase(pos: int) -> None:
+                for _ in range(n_repeats):
+                    with store.lock(key):
+                        val = store.get(key)["counter"][pos]
+                        dash_json_grid.DashJsonGrid.update_data_by_key(
+                            store, key, ["counter", pos], val + 1
+                        )
+
+            workers = [
+                threading.Thread(target=increase, args=(pos,)) for pos in range(4)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            assert store.get(key) == {"counter": [n_repeats] * 4}
+            log.info(
+                "Successfully modify the data concurrently: {0}".format(
+                    store.__class__.__name__
+                )
+            )
@@ -208,3 +208,91 @@ class TestTableColumns:
             "Successfully update a column by broadcasting. Only the existing values "
             "are updated. The new values are: {0}".format(data_update)
         )
+
+    def test_table_columns_array_like(self, data: Any) -> None:
+        """Test the broadcasting of array-like values to the table columns."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        class ArrayLike:
+            """An array-like object which is not a sequence."""
+
+            def __init__(self, *values: Any) -> None:
+                self.values = values
+
+            def __len__(self) -> int:
+                return len(self.values)
+
+            def tolist(self) -> list:
+                return list(self.values)
+
+        test_data = data["table"]
+        assert dash_json_grid.mixins.is_array_like(ArrayLike(1, 2))
+        assert not dash_json_grid.mixins.is_array_like((1, 2))
+
+        values = ArrayLike(*range(5))
+        dash_json_grid.DashJsonGrid.update_data_by_route(test_data, [["key1"]], values)
+        assert utils.is_eq_sequence(
+            dash_json_grid.DashJsonGrid.get_data_by_route(test_data, [["key1"]]),
+            (0, 1, 2, 3, 4),
+        )
+        dash_json_grid.DashJsonGrid.update_data_by_route(
+            test_data, [["key5"]], ArrayLike("new-A", "new-B")
+        )
+        assert utils.is_eq_mapping(
+            dash_json_grid.DashJsonGrid.get_data_by_route(test_data, [["key5"]]),
+            {2: "new-A", 4: "new-B"},
+        )
+        log.info("Successfully update a column by an array-like value.")
+
+        with pytest.raises(IndexError):
+            dash_json_grid.DashJsonGrid.update_data_by_route(
+                test_data, [["key1"]], ArrayLike(1, 2, 3)
+            )
+        with pytest.raises(ValueError, match="empty"):
+            dash_json_grid.DashJsonGrid.update_data_by_route(
+                test_data, [["key1"]], ArrayLike()
+            )
+        log.info("Successfully validate the invalid array-like values.")
+
+        class SlicedArrayLike(ArrayLike):
+            """An array-like object recording the lengths converted by `tolist()`."""
+
+            n_converted = []
+
+            def __getitem__(self, index: slice) -> "SlicedArrayLike":
+                return SlicedArrayLike(*self.values[index])
+
+            def tolist(self) -> list:
+                self.n_converted.append(len(self.values))
+                return list(self.values)
+
+        n_rows = 10000
+        table = [{"score": 0} for _ in range(n_rows)]
+        dash_json_grid.DashJsonGrid.update_data_by_route(
+            table, [["score"]], SlicedArrayLike(*range(n_rows))
+        )
+        assert [row["score"] for row in table] == list(range(n_rows))
+        assert SlicedArrayLike.n_converted
+        assert max(SlicedArrayLike.n_converted) < n_rows
+        dash_json_grid.DashJsonGrid.update_data_by_route(
+            table, [["score"]], SlicedArrayLike(-1)
+        )
+        assert all(row["score"] == -1 for row in table)
+        log.info("Successfully convert the array-like value by chunks.")
+
+    def test_table_columns_numpy(self, data: Any) -> None:
+        """Test the broadcasting of numpy arrays to the table columns."""
+        log = logging.getLogger("dash_json_grid.test")
+        np = pytest.importorskip("numpy")
+
+        test_data = data["table"]
+        dash_json_grid.DashJsonGrid.update_data_by_route(
+            test_data, [["key1"]], np.arange(5, dtype=np.float64)
+        )
+        data_update = dash_json_grid.DashJsonGrid.get_data_by_route(
+            test_data, [["key1"]]
+        )
+        assert utils.is_eq_sequence(data_update, (0.0, 1.0, 2.0, 3.0, 4.0))
+        assert all(type(val) is float for val in data_update)
+        json.dumps(test_data)
+        log.info("Successfully update a column by a numpy array.")
@@ -0,0 +1,87 @@
+# -*- coding: UTF-8 -*-
+"""
+Walk
+====
+@ Dash JSON Grid Viewer - Tests
+
+Author
+------
+Yuchen Jin (cainmagi)
+cainmagi@gmail.com
+
+Description
+-----------
+The tests for the iterative traversal. The traversal needs to visit each node in
+the pre-order, and needs to work with the data deeper than the recursion limit.
+"""
+
+import sys
+import logging
+from typing import Any
+
+import dash_json_grid
+
+
+__all__ = ("TestWalk",)
+
+
+class TestWalk:
+    """Test the iterative traversal of the data."""
+
+    def test_walk_routes(self, data: Any) -> None:
+        """Test the routes and values yielded by the traversal."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        nodes = [
+            (list(route), value)
+            for route, value in dash_json_grid.DashJsonGrid.walk(data)
+        ]
+        assert nodes[0] == ([], data)
+        kept = list(dash_json_grid.DashJsonGrid.walk(data))
+        assert [route for route, _ in kept] == [route for route, _ in nodes]
+        shared = [
+            route
+            for route, _ in dash_json_grid.DashJsonGrid.walk(data, share_route=True)
+        ]
+        assert shared[1] is shared[-1]
+        assert nodes[1] == (["id"], data["id"])
+        for route, value in nodes:
+            assert dash_json_grid.DashJsonGrid.get_data_by_route(data, route) is value
+        n_keys = sum(1 for route, _ in nodes if len(route) == 1)
+        assert n_keys == len(data)
+        log.info("Successfully visit {0} nodes in the pre-order.".format(len(nodes)))
+
+        routes = [
+            list(route)
+            for route, _ in dash_json_grid.DashJsonGrid.walk(data, max_depth=1)
+        ]
+        assert routes == [[]] + [[key] for key in data.keys()]
+        routes = [
+            list(route)
+            for route, _ in dash_json_grid.DashJsonGrid.walk(
+                data, prune=lambda route, value: route[-1:] == ["batters"]
+            )
+        ]
+        assert ["batters"] in routes
+        assert not any(route[:1] == ["batters"] and len(route) > 1 for route in routes)
+        assert any(route[:1] == ["topping"] and len(route) > 1 for route in routes)
+        log.info("Successfully prune the traversal.")
+
+    def test_walk_deep(self) -> None:
+        """Test the traversal of the data deeper than the recursion limit."""
+        log = logging.getLogger("dash_json_grid.test")
+
+        depth = sys.getrecursionlimit() * 2
+        data = cur = {}
+        for idx in range(depth):
+            cur["value"] = idx
+            cur["child"] = [{}]
+            cur = cur["child"][0]
+        n_nodes = 0
+        max_route = 0
+        for route, _ in dash_json_grid.mixins.walk(data):
+            n_nodes += 1
+            max_route = max(max_route, len(route))
+        assert n_nodes == 3 * depth + 1
+        assert max_route == 2 * depth
+        log.info("Successfully traverse {0} levels.".format(max_route))